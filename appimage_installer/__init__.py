@@ -1,18 +1,14 @@
 import os
-import shutil
-import subprocess
-import tempfile
-import argparse
-import json
-from configparser import ConfigParser
-import importlib.metadata
-import traceback
-import hashlib
 import stat
-from pathlib import Path
-import re
 import sys
 
+# Komut satırının hızlı açılması için ağır modüller kullanıldıkları
+# fonksiyonların içinde içe aktarılır.
+
+__version__ = "1.0.7"
+
+from .timings import timings
+
 def check_linux_system():
     """Check if the system is Linux during installation."""
     if sys.platform != "linux":
@@ -31,49 +27,112 @@ check_linux_system()
 
 HOME = os.path.expanduser("~")
 VERSION_FILE = os.path.join(HOME, ".local", "share", "appimage-versions.json")
+STORE_FILE = os.path.join(HOME, ".local", "share", "appimage-installer.db")
+CACHE_DIR = os.path.join(HOME, ".cache", "appimage-installer")
+OBJECTS_DIR = os.path.join(HOME, ".local", "share", "appimages")
+LAUNCH_CACHE_DIR = os.path.join(CACHE_DIR, "launch")
+LAUNCHER_DIR = os.path.join(HOME, ".local", "share", "appimage-installer", "launchers")
+# --system ile kullanılan, kullanıcıların paylaştığı depo
+SYSTEM_PREFIX = os.environ.get("APPIMAGE_INSTALLER_SYSTEM_PREFIX", "/opt/appimages")
 ALLOWED_EXTENSIONS = {'.AppImage', '.appimage'}
 ALLOWED_ICON_EXTENSIONS = {'.png', '.svg', '.xpm'}
 MAX_PATH_LENGTH = 4096  # Linux'un maksimum dosya yolu uzunluğu
+# Kurulum için AppImage içinden okunması yeterli olan dizinler
+METADATA_DIRS = ("usr/share/applications", "usr/share/icons", "usr/share/pixmaps")
+# Bu dizinlerden çıkarılan dosyaların adlarıyla eşleşen varsayılan desenler
+EXTRACT_INCLUDE = ("*.desktop", ".DirIcon", "*.png", "*.svg", "*.xpm")
+# Geçici çıkarma dizinlerinin varsayılan kökü; tmpfs olabilen /tmp kullanılmaz
+SCRATCH_DIR = os.path.join(CACHE_DIR, "scratch")
+# İmaj okunamadığında tam çıkarmanın boyutu için AppImage boyutunun çarpanı
+EXTRACT_EXPANSION = 3
+# gc komutunun uygulama başına tuttuğu sürüm sayısı
+KEEP_VERSIONS = 3
+# İzlenen klasöre bırakılan dosyanın kurulmadan önce değişmeden kalması gereken süre
+WATCH_DEBOUNCE = 2.0
 
 # Global language data
 _lang_data = None
+_lang_code = "en"
+
+# Komut satırının kabul ettiği diller
+LANGUAGES = ("en", "tr", "de", "fr")
 
 def get_version():
-    try:
-        return importlib.metadata.version("appimage-installer")
-    except importlib.metadata.PackageNotFoundError:
-        return "1.0.0"  # Fallback version if package is not installed
+    return __version__
 
-def load_language(lang):
-    global _lang_data
-    try:
-        # Get the base directory for the application
-        if getattr(sys, 'frozen', False):
-            # Running in a PyInstaller bundle
-            base_dir = sys._MEIPASS
-        else:
-            # Running in a normal Python environment
-            base_dir = os.path.dirname(__file__)
+def _locales_dir():
+    # Get the base directory for the application
+    if getattr(sys, 'frozen', False):
+        # Running in a PyInstaller bundle
+        return os.path.join(sys._MEIPASS, "locales")
+    # Running in a normal Python environment
+    return os.path.join(os.path.dirname(__file__), "locales")
 
+def read_language(lang):
+    """Bir dil dosyasını global çeviri tablosuna dokunmadan okur.
+
+    JSON dosyası ilk okunduğunda marshal biçiminde derlenmiş bir kataloğa
+    yazılır; dosya değişmediği sürece sonraki çalıştırmalar JSON
+    ayrıştırıcısını hiç yüklemeden bu katalogdan okur.
+    """
+    import marshal
+
+    try:
         # Try to load the requested language file
-        lang_file = os.path.join(base_dir, "locales", f"{lang}.json")
+        lang_file = os.path.join(_locales_dir(), f"{lang}.json")
         
         if not os.path.exists(lang_file):
             # Fall back to English if the requested language is not available
-            lang_file = os.path.join(base_dir, "locales", "en.json")
+            lang_file = os.path.join(_locales_dir(), "en.json")
         
         if not os.path.exists(lang_file):
             return None
-            
+
+        st = os.stat(lang_file)
+        key = (lang_file, st.st_size, st.st_mtime_ns)
+        catalog = os.path.join(CACHE_DIR, "locales", os.path.basename(lang_file) + ".marshal")
+        try:
+            with open(catalog, 'rb') as f:
+                stored_key, data = marshal.load(f)
+            if stored_key == key:
+                return data
+        except (OSError, EOFError, ValueError, TypeError):
+            pass
+
+        import json
         with open(lang_file, 'r', encoding='utf-8') as f:
-            _lang_data = json.load(f)
-        return _lang_data
+            data = json.load(f)
+
+        try:
+            os.makedirs(os.path.dirname(catalog), mode=0o700, exist_ok=True)
+            temp_path = f"{catalog}.{os.getpid()}"
+            with open(temp_path, 'wb') as f:
+                marshal.dump((key, data), f)
+            os.replace(temp_path, catalog)
+        except OSError:
+            pass
+        return data
     except Exception as e:
         return None
 
+def set_language(lang):
+    """Kullanılacak dili seçer; çeviriler ilk ihtiyaç duyulduğunda yüklenir."""
+    global _lang_data, _lang_code
+    _lang_code = lang
+    _lang_data = None
+
+def load_language(lang):
+    global _lang_data, _lang_code
+    _lang_code = lang
+    _lang_data = read_language(lang)
+    return _lang_data
+
 def _(key, **kwargs):
     global _lang_data
     try:
+        if _lang_data is None:
+            _lang_data = read_language(_lang_code) or {}
+
         if not _lang_data:
             return key
             
@@ -92,17 +151,27 @@ def _(key, **kwargs):
             formatted_kwargs = {k: str(v) for k, v in kwargs.items()}
             return text.format(**formatted_kwargs)
         except KeyError as e:
+            import traceback
             traceback.print_exc()
             return text
         except Exception as e:
+            import traceback
             traceback.print_exc()
             return text
     except Exception as e:
+        import traceback
         traceback.print_exc()
         return key
 
-def verify_appimage(path):
-    """AppImage dosyasının güvenliğini ve geçerliliğini kontrol eder."""
+def verify_appimage(path, expected_sha256=None, check_signature=False):
+    """AppImage dosyasının güvenliğini ve geçerliliğini kontrol eder.
+
+    ELF ve AppImage başlığı yalnızca birkaç bayt okunarak denetlenir.
+    expected_sha256 verilirse dosyanın içerik özeti de karşılaştırılır;
+    check_signature verilirse gömülü özet ve imza doğrulanır. True imzayı
+    dosyanın kendi anahtarıyla (kendinden imzalı) denetler; bir dosya yolu
+    ise imza yalnızca o güvenilir anahtarla kabul edilir.
+    """
     try:
         # Dosya uzantısını kontrol et
         if not any(path.lower().endswith(ext) for ext in ALLOWED_EXTENSIONS):
@@ -129,17 +198,65 @@ def verify_appimage(path):
         if st.st_size > 1024 * 1024 * 1024:  # 1GB
             raise ValueError(_("file_too_large"))
 
+        # ELF ve AppImage sihirli sayılarını ve bölüm tablosunu kontrol et
+        from .elf import ELFError, read_header
+
+        fd = os.open(path, os.O_RDONLY)
+        try:
+            try:
+                header = read_header(fd)
+            except ELFError as e:
+                raise ValueError(_("not_an_appimage", reason=str(e)))
+            if check_signature:
+                check_embedded_signature(fd, header, None if check_signature is True else check_signature)
+        finally:
+            os.close(fd)
+
         # Dosya hash'ini kontrol et (opsiyonel)
-        # with open(path, 'rb') as f:
-        #     file_hash = hashlib.sha256(f.read()).hexdigest()
-        #     # Burada hash kontrolü yapılabilir
+        if expected_sha256 and file_digest(path) != expected_sha256.lower():
+            raise ValueError(_("hash_mismatch"))
 
         return True
     except Exception as e:
         raise ValueError(str(e))
 
+def check_embedded_signature(fd, header, trusted_key=None):
+    """Gömülü MD5 özetini ve GPG imzasını doğrular.
+
+    trusted_key verilmezse imza gömülü anahtarla denetlenir ve imza yoksa
+    yalnızca uyarı verilir. trusted_key bir anahtar dosyasıysa imza
+    zorunludur ve yalnızca o anahtarla yapılmışsa kabul edilir.
+    """
+    from .elf import verify_digest, verify_signature
+
+    key = None
+    if trusted_key:
+        try:
+            with open(trusted_key, "rb") as f:
+                key = f.read()
+        except OSError as e:
+            raise ValueError(_("trusted_key_unreadable", path=trusted_key, reason=e.strerror))
+    if verify_digest(fd, header) is False:
+        raise ValueError(_("digest_mismatch"))
+    try:
+        signed = verify_signature(fd, header, key)
+    except FileNotFoundError:
+        raise ValueError(_("gpg_not_found"))
+    if signed is False:
+        raise ValueError(_("signature_invalid"))
+    if signed is None and trusted_key:
+        raise ValueError(_("signature_required"))
+    if signed is None:
+        print(_("signature_missing"))
+    elif trusted_key:
+        print(_("signature_trusted", path=trusted_key))
+    else:
+        print(_("signature_self_signed"))
+
 def sanitize_path(path):
     """Dosya yolunu güvenli hale getirir."""
+    import re
+
     # Mutlak yol kontrolü
     if os.path.isabs(path):
         raise ValueError(_("absolute_path_not_allowed"))
@@ -154,6 +271,8 @@ def sanitize_path(path):
 
 def secure_mkdir(path):
     """Güvenli bir şekilde dizin oluşturur."""
+    from pathlib import Path
+
     try:
         path = Path(path)
         if path.exists() and not path.is_dir():
@@ -167,26 +286,118 @@ def secure_mkdir(path):
         raise ValueError(str(e))
 
 def secure_write(file_path, content):
-    """Güvenli bir şekilde dosyaya yazar."""
+    """Güvenli bir şekilde dosyaya yazar.
+
+    Geçici dosya hedefle aynı dizinde oluşturulur ve os.replace ile taşınır;
+    böylece okuyucular hiçbir zaman yarım yazılmış bir dosya görmez.
+    """
+    import tempfile
+
+    temp_path = None
     try:
         # Geçici dosya oluştur
-        temp_file = tempfile.NamedTemporaryFile(mode='w', delete=False)
+        temp_file = tempfile.NamedTemporaryFile(mode='w', delete=False,
+                                                dir=os.path.dirname(os.path.abspath(file_path)),
+                                                prefix=".tmp-")
         temp_path = temp_file.name
         
         # İçeriği geçici dosyaya yaz
         temp_file.write(content)
+        temp_file.flush()
+        os.fsync(temp_file.fileno())
         temp_file.close()
         
-        # Geçici dosyayı hedef konuma taşı
-        shutil.move(temp_path, file_path)
-        
         # Dosya izinlerini ayarla (600)
-        os.chmod(file_path, 0o600)
+        os.chmod(temp_path, 0o600)
+
+        # Geçici dosyayı hedef konuma taşı
+        os.replace(temp_path, file_path)
     except Exception as e:
-        if os.path.exists(temp_path):
+        if temp_path and os.path.exists(temp_path):
             os.unlink(temp_path)
         raise ValueError(str(e))
 
+FICLONE = 0x40049409  # linux/fs.h: _IOW(0x94, 9, int)
+COPY_BUFFER_SIZE = 8 * 1024 * 1024
+
+def _copy_data(src_fd, dst_fd, size):
+    """Veriyi en ucuz yöntemle kopyalar ve kullanılan yöntemin adını döndürür."""
+    # btrfs/XFS üzerinde blokları paylaşan anlık kopya
+    try:
+        import fcntl
+        fcntl.ioctl(dst_fd, FICLONE, src_fd)
+        return "reflink"
+    except (ImportError, OSError):
+        pass
+
+    # Çekirdek içinde kopyalama
+    for method in ("copy_file_range", "sendfile"):
+        func = getattr(os, method, None)
+        if func is None:
+            continue
+        offset = 0
+        try:
+            while offset < size:
+                if method == "copy_file_range":
+                    copied = func(src_fd, dst_fd, size - offset, offset, offset)
+                else:
+                    copied = func(dst_fd, src_fd, offset, size - offset)
+                if copied == 0:
+                    break
+                offset += copied
+        except OSError:
+            if offset == 0:
+                continue
+            raise
+        if offset == size:
+            return method
+        os.lseek(dst_fd, 0, os.SEEK_SET)
+        os.ftruncate(dst_fd, 0)
+
+    # Büyük tamponla akış kopyası
+    os.lseek(src_fd, 0, os.SEEK_SET)
+    os.lseek(dst_fd, 0, os.SEEK_SET)
+    buffer = bytearray(COPY_BUFFER_SIZE)
+    view = memoryview(buffer)
+    with open(src_fd, 'rb', buffering=0, closefd=False) as fsrc:
+        for size_read in iter(lambda: fsrc.readinto(buffer), 0):
+            written = 0
+            while written < size_read:
+                written += os.write(dst_fd, view[written:size_read])
+    return "stream"
+
+def place_file(src, dst, move=False, mode=0o755):
+    """Dosyayı hedefe mümkün olan en az G/Ç ile yerleştirir.
+
+    Sırasıyla şunlar denenir: move True ise ve iki yol aynı dosya
+    sistemindeyse yeniden adlandırma, reflink (FICLONE), copy_file_range/
+    sendfile ve büyük tamponlu akış kopyası. Hedef her durumda atomik olarak
+    değiştirilir. Kullanılan yöntemin adı döndürülür.
+    """
+    import tempfile
+
+    dst_dir = os.path.dirname(os.path.abspath(dst))
+    if move and os.stat(src).st_dev == os.stat(dst_dir).st_dev:
+        try:
+            os.replace(src, dst)
+            os.chmod(dst, mode)
+            return "rename"
+        except OSError:
+            pass
+
+    temp = tempfile.NamedTemporaryFile(dir=dst_dir, prefix=".tmp-", delete=False)
+    try:
+        with open(src, 'rb') as fsrc, temp:
+            size = os.fstat(fsrc.fileno()).st_size
+            method = _copy_data(fsrc.fileno(), temp.fileno(), size)
+        os.chmod(temp.name, mode)
+        os.replace(temp.name, dst)
+    except BaseException:
+        if os.path.exists(temp.name):
+            os.unlink(temp.name)
+        raise
+    return method
+
 def secure_read(file_path):
     """Güvenli bir şekilde dosyadan okur."""
     try:
@@ -207,42 +418,397 @@ def secure_read(file_path):
     except Exception as e:
         raise ValueError(str(e))
 
+_store = None
+_store_pid = None
+
+def get_store():
+    """Kurulu uygulama kayıtlarının tutulduğu depoyu döndürür.
+
+    Depo ilk açıldığında eski VERSION_FILE içeriği otomatik olarak içe aktarılır.
+    SQLite bağlantıları fork sonrasında paylaşılamadığından işlem havuzundaki
+    her süreç kendi bağlantısını açar.
+    """
+    global _store, _store_pid
+    if _store is None or _store_pid != os.getpid():
+        from .store import VersionStore
+        _store = VersionStore(STORE_FILE, legacy_json=VERSION_FILE)
+        _store_pid = os.getpid()
+    return _store
+
+_metadata_cache = None
+_metadata_cache_pid = None
+
+def get_metadata_cache():
+    """İçerik özetine göre anahtarlanan metadata önbelleğini döndürür."""
+    global _metadata_cache, _metadata_cache_pid
+    if _metadata_cache is None or _metadata_cache_pid != os.getpid():
+        from .cache import MetadataCache
+        _metadata_cache = MetadataCache(CACHE_DIR)
+        _metadata_cache_pid = os.getpid()
+    return _metadata_cache
+
+def get_objects(system=None, trusted=False):
+    """AppImage'ların tutulduğu içerik adresli depoyu döndürür.
+
+    system bir önek ise kullanıcıların paylaştığı sistem deposu döner;
+    trusted True ise deponun root'a ait ve başkalarınca yazılamaz olduğu
+    denetlenir.
+    """
+    if system:
+        from .objects import SharedObjectStore, UntrustedStoreError
+        store = SharedObjectStore(system)
+        if trusted:
+            try:
+                store.check()
+            except UntrustedStoreError as e:
+                raise ValueError(_("untrusted_system_store", path=e.path, reason=e.reason))
+        return store
+    from .objects import ObjectStore
+    return ObjectStore(OBJECTS_DIR)
+
+def _object_ref(app_name):
+    """Sistem deposunda bu kullanıcının kaydını temsil eden başvuru adı."""
+    return f"{os.getuid()}-{app_name}"
+
+def release_objects(app_name, info, hashes):
+    """Sistem deposundaki kaydın verilen sürümlere başvurularını kaldırır."""
+    if info.get("system"):
+        shared = get_objects(info["system"])
+        for sha256 in hashes:
+            shared.remove_ref(sha256, _object_ref(app_name))
+
+def owns_link(path, versions=()):
+    """Yol kullanıcı deposundaki ya da kayıtların sistem deposundaki bir nesneye bağlıysa True."""
+    prefixes = {info.get("system") for info in versions.values() if info.get("system")} if versions else set()
+    prefixes.add(SYSTEM_PREFIX)
+    return any(get_objects(prefix).owns(path) for prefix in [None] + sorted(prefixes))
+
+def extract_dir():
+    """Geçici çıkarma dizinlerinin kökünü döndürür (--extract-dir)."""
+    return os.environ.get("APPIMAGE_INSTALLER_EXTRACT_DIR") or SCRATCH_DIR
+
+def extract_include():
+    """Kurulum için çıkarılan dosya adı desenlerini döndürür (--extract-include)."""
+    patterns = os.environ.get("APPIMAGE_INSTALLER_EXTRACT_INCLUDE", "")
+    return tuple(p for p in patterns.split(":") if p) or EXTRACT_INCLUDE
+
+_scratch_cleaned = False
+
+def scratch_dir(prefix=""):
+    """Çıkarma kökünde bu sürece ait yeni bir geçici dizin oluşturur.
+
+    İlk çağrıda sahibi artık çalışmayan (öldürülmüş bir kurulumdan kalan)
+    dizinler silinir.
+    """
+    from . import scratch
+    global _scratch_cleaned
+
+    root = extract_dir()
+    if not _scratch_cleaned:
+        _scratch_cleaned = True
+        scratch.clean_stale(root)
+    return scratch.make(root, prefix)
+
+def ensure_space(path, size):
+    """path'in dosya sisteminde size bayt çıkarmaya yetecek alan yoksa hata verir."""
+    from . import scratch
+
+    needed = scratch.required_bytes(size)
+    available = scratch.free_bytes(path)
+    if available < needed:
+        mb = 1024 * 1024
+        raise ValueError(_("not_enough_space", path=path, needed=f"{needed / mb:.1f}",
+                           available=f"{available / mb:.1f}"))
+
+def get_launch_cache():
+    """Önceden çıkarılmış imajların tutulduğu başlatma önbelleğini döndürür."""
+    from .launchcache import LaunchCache
+    return LaunchCache(LAUNCH_CACHE_DIR)
+
+def _extract_tree(appimage_path, dest):
+    """İmajın tamamını dest altına çıkarır ve yazılan bayt sayısını döndürür.
+
+    Dahili SquashFS okuyucusu imajı açamazsa --appimage-extract kullanılır.
+    """
+    import shutil
+    import subprocess
+    from .squashfs import SquashFS, SquashFSError
+
+    try:
+        with SquashFS(appimage_path) as fs:
+            ensure_space(os.path.dirname(dest), fs.unpacked_size())
+            return fs.extract_tree(dest)
+    except (SquashFSError, OSError):
+        shutil.rmtree(dest, ignore_errors=True)
+
+    ensure_space(os.path.dirname(dest), os.path.getsize(appimage_path) * EXTRACT_EXPANSION)
+    work_dir = dest + ".extract"
+    os.makedirs(work_dir)
+    try:
+        subprocess.run([appimage_path, "--appimage-extract"], cwd=work_dir,
+                       check=True, capture_output=True, text=True)
+        os.rename(os.path.join(work_dir, "squashfs-root"), dest)
+    except subprocess.CalledProcessError as e:
+        raise ValueError(f"AppImage extraction failed: {e.stderr}")
+    finally:
+        shutil.rmtree(work_dir, ignore_errors=True)
+    total = 0
+    for root, _dirs, names in os.walk(dest):
+        for name in names:
+            path = os.path.join(root, name)
+            if not os.path.islink(path):
+                total += os.path.getsize(path)
+    return total
+
+def populate_launch_cache(sha256, appimage_path):
+    """İmajı başlatma önbelleğine çıkarır ve önbelleği boyut sınırına indirir."""
+    cache = get_launch_cache()
+    cache.populate(sha256, lambda dest: _extract_tree(appimage_path, dest))
+    cache.prune(keep={sha256})
+
+def _place_object(src, dst, move):
+    from .objects import OBJECT_MODE
+    # Başka bağlantısı olan bir dosya taşınırsa o bağlantı üzerinden nesne değiştirilebilir
+    move = move and os.stat(src).st_nlink == 1
+    return place_file(src, dst, move=move, mode=OBJECT_MODE)
+
+def appimage_entry(info):
+    """Kayıttaki kurulu AppImage manifest girdisini döndürür; yoksa None."""
+    for entry in info.get("files") or ():
+        if entry["type"] == "AppImage":
+            return entry
+    return None
+
+def version_history(app_name, info):
+    """Kaydın sürüm geçmişini döndürür.
+
+    Geçmişi olmayan eski kayıtlarda ~/.local/bin altındaki gerçek AppImage
+    dosyası depoya taşınıp yerine depo bağlantısı konur ve tek girdili bir
+    geçmiş oluşturulur; böylece ilk yükseltmeden sonra da eski sürüme
+    dönülebilir. Manifesti ya da özeti olmayan kayıtlarda dosya
+    legacy_manifest ile bulunur ve özeti burada hesaplanır.
+    """
+    if "history" in info:
+        return list(info["history"])
+    if "files" not in info:
+        info["files"] = legacy_manifest(app_name, info)
+    entry = appimage_entry(info)
+    if entry is None or os.path.islink(entry["path"]) or not os.path.isfile(entry["path"]):
+        return []
+    size = os.path.getsize(entry["path"])
+    if entry.get("sha256") and size != entry["size"]:
+        return []
+    sha256 = entry.get("sha256") or hash_file(entry["path"])
+    objects = get_objects()
+    obj, _method = objects.add(entry["path"], sha256, _place_object, move=True)
+    objects.link(obj, entry["path"])
+    entry.update(size=size, sha256=sha256)
+    return [{"version": info.get("version"), "sha256": sha256, "size": size}]
+
+def referenced_objects(versions, personal=False, launch_cache=False):
+    """Kayıtların geçmişinde ve etkin sürümünde geçen nesne özetlerini döndürür.
+
+    personal True ise sistem deposunu kullanan kayıtlar, launch_cache True
+    ise başlatma önbelleği kapalı kayıtlar atlanır.
+    """
+    referenced = set()
+    for info in versions.values():
+        if personal and info.get("system"):
+            continue
+        if launch_cache and not info.get("launch_cache"):
+            continue
+        referenced.update(item["sha256"] for item in info.get("history") or ())
+        entry = appimage_entry(info)
+        if entry and entry.get("sha256"):
+            referenced.add(entry["sha256"])
+    return referenced
+
 def load_versions():
     """Güvenli bir şekilde versiyon bilgilerini yükler."""
     try:
-        if os.path.exists(VERSION_FILE):
-            content = secure_read(VERSION_FILE)
-            if content:
-                return json.loads(content)
-        return {}
+        return get_store().load()
     except Exception as e:
         raise ValueError(str(e))
 
 def save_versions(versions):
-    """Güvenli bir şekilde versiyon bilgilerini kaydeder."""
+    """Güvenli bir şekilde versiyon bilgilerini kaydeder.
+
+    load_versions ile okunan kayıtlarda yalnızca değişiklikler yazılır;
+    böylece paralel çalışan süreçler birbirinin kayıtlarını ezmez.
+    """
     try:
-        os.makedirs(os.path.dirname(VERSION_FILE), exist_ok=True)
-        secure_write(VERSION_FILE, json.dumps(versions, indent=4))
+        get_store().save(versions)
     except Exception as e:
         raise ValueError(str(e))
 
-def extract_appimage(appimage_path, extract_dir):
-    """Güvenli bir şekilde AppImage dosyasını çıkarır."""
+def hash_file(path, chunk_size=1024 * 1024):
+    """Dosyanın SHA-256 özetini parça parça okuyarak hesaplar."""
+    import hashlib
+
+    digest = hashlib.sha256()
+    buffer = bytearray(chunk_size)
+    view = memoryview(buffer)
+    with open(path, 'rb', buffering=0) as f:
+        for size in iter(lambda: f.readinto(buffer), 0):
+            digest.update(view[:size])
+    return digest.hexdigest()
+
+def file_digest(path):
+    """Dosyanın SHA-256 özetini (cihaz, inode, boyut, mtime) önbelleğiyle döndürür.
+
+    Dosya değişmediği sürece özet yeniden hesaplanmaz. Hesaplama sırasında
+    değişen dosyaların özeti önbelleğe yazılmaz.
+    """
+    store = get_store()
+    st = os.stat(path)
+    digest = store.cached_digest(st)
+    if digest is None:
+        digest = hash_file(path)
+        after = os.stat(path)
+        if (after.st_size, after.st_mtime_ns) == (st.st_size, st.st_mtime_ns):
+            store.remember_digest(st, digest)
+    return digest
+
+def find_installed(sha256, sandbox, launch_cache=None, system=None):
+    """Aynı içerikle ve aynı ayarlarla kurulmuş, dosyaları yerinde duran kaydı bulur."""
+    for name, info in get_store().find_by_hash(sha256):
+        if info.get("sandbox") != sandbox:
+            continue
+        if launch_cache is not None and bool(info.get("launch_cache")) != launch_cache:
+            continue
+        if system is not None and (info.get("system") or False) != system:
+            continue
+        files = info.get("files") or []
+        if not files or not all(os.path.isfile(entry["path"]) for entry in files):
+            continue
+        if all(file_digest(entry["path"]) == sha256
+               for entry in files if entry["type"] == "AppImage"):
+            return name
+    return None
+
+def manifest_entry(kind, path, digest=True):
+    """Kurulumun yazdığı bir dosya için manifest kaydı oluşturur."""
+    return {
+        "type": kind,
+        "path": path,
+        "size": os.path.getsize(path),
+        "sha256": hash_file(path) if digest else None
+    }
+
+def legacy_manifest(app_name, info):
+    """Manifest içermeyen eski kayıtlar için kurulumun yazdığı dosyaları tahmin eder.
+
+    AppImage'ı çıkarmadan, install_appimage'ın kullandığı yol şablonlarından
+    yararlanır; yalnızca diskte bulunan dosyalar manifeste eklenir. Dosyalar
+    okunmadığından özet alanı boş bırakılır.
+    """
+    appimage_name = os.path.basename(info["path"]) if info.get("path") else f"{app_name}.AppImage"
+    candidates = [
+        ("AppImage", os.path.join(HOME, ".local", "bin", appimage_name)),
+        ("Desktop", os.path.join(HOME, ".local", "share", "applications", f"{app_name}.desktop")),
+        ("Icon", os.path.join(HOME, ".local", "share", "icons", f"{app_name}.png")),
+    ]
+    return [manifest_entry(kind, path, digest=False) for kind, path in candidates if os.path.isfile(path)]
+
+def appimage_type(path):
+    """Başlıktaki sihirli sayıdan AppImage türünü (1 ya da 2) döndürür; bilinmiyorsa None."""
+    from .elf import ELFError, read_header
+
+    fd = os.open(path, os.O_RDONLY)
+    try:
+        return read_header(fd).type
+    except ELFError:
+        return None
+    finally:
+        os.close(fd)
+
+def _is_metadata_dir(path):
+    """Dizinin masaüstü/ikon dosyaları içerebilecek bir yol üzerinde olup olmadığını döndürür."""
+    return any(d == path or d.startswith(path + "/") or path.startswith(d + "/")
+               for d in METADATA_DIRS)
+
+def _is_metadata_file(path, include=EXTRACT_INCLUDE):
+    """Dosyanın kurulum için çıkarılan .desktop ya da ikon dosyalarından olup olmadığını döndürür."""
+    from fnmatch import fnmatch
+
+    name = os.path.basename(path)
+    if not any(fnmatch(name.lower(), pattern.lower()) for pattern in include):
+        return False
+    parent = os.path.dirname(path)
+    return parent == "" or any(parent == d or parent.startswith(d + "/") for d in METADATA_DIRS)
+
+def extract_metadata(appimage_path, extract_dir):
+    """AppImage'ı çalıştırmadan yalnızca .desktop ve ikon dosyalarını çıkarır.
+
+    Çıkarmadan önce seçilen dosyaların toplam boyutu inode tablosundan
+    hesaplanır ve hedefte yeterli boş alan olup olmadığı denetlenir.
+    """
+    from .squashfs import SquashFS
+
+    include = extract_include()
+    squashfs_root = os.path.join(extract_dir, "squashfs-root")
+    with SquashFS(appimage_path) as fs:
+        ensure_space(extract_dir, fs.unpacked_size(
+            lambda path, is_dir: _is_metadata_dir(path) if is_dir else _is_metadata_file(path, include)))
+        for dirpath, dirnames, filenames in fs.walk():
+            prefix = dirpath + "/" if dirpath else ""
+            dirnames[:] = [d for d in dirnames if _is_metadata_dir(prefix + d)]
+            for name in filenames:
+                member = prefix + name
+                if not _is_metadata_file(member, include):
+                    continue
+                try:
+                    fs.extract_file(member, squashfs_root)
+                except ValueError:
+                    # Kırık ya da imaj dışını gösteren sembolik bağları atla
+                    continue
+    return squashfs_root
+
+def extract_appimage(appimage_path, extract_dir, full=False):
+    """Güvenli bir şekilde AppImage dosyasını çıkarır.
+
+    full False ise önce dahili SquashFS okuyucusuyla yalnızca kurulum için
+    gereken dosyalar çıkarılır; imaj okunamazsa (type-1 AppImage ya da
+    desteklenmeyen sıkıştırma) --appimage-extract kullanılır. Type-2
+    çalıştırıcısına çıkarılacak dosyaların desenleri verilir; .desktop
+    dosyası çıkmazsa ya da imaj type-1 ise ve boş alan yetiyorsa imajın
+    tamamı çıkarılır.
+    """
+    import shutil
+    import subprocess
+
     try:
         # AppImage dosyasını doğrula
         verify_appimage(appimage_path)
         
         # Çıkarma dizinini güvenli hale getir
         extract_dir = secure_mkdir(extract_dir)
-        
+
+        squashfs_root = os.path.join(extract_dir, "squashfs-root")
+        if not full:
+            from .squashfs import SquashFSError
+            try:
+                return extract_metadata(appimage_path, extract_dir)
+            except (SquashFSError, OSError):
+                shutil.rmtree(squashfs_root, ignore_errors=True)
+            if appimage_type(appimage_path) == 2:
+                ensure_space(extract_dir, 0)
+                for pattern in extract_include():
+                    subprocess.run([appimage_path, "--appimage-extract", pattern],
+                                   cwd=extract_dir, check=True, capture_output=True, text=True)
+                if find_file(squashfs_root, ".desktop"):
+                    return squashfs_root
+                shutil.rmtree(squashfs_root, ignore_errors=True)
+
         # AppImage'ı çıkar
+        ensure_space(extract_dir, os.path.getsize(appimage_path) * EXTRACT_EXPANSION)
         subprocess.run([appimage_path, "--appimage-extract"], 
                       cwd=extract_dir, 
                       check=True,
                       capture_output=True,
                       text=True)
                       
-        return os.path.join(extract_dir, "squashfs-root")
+        return squashfs_root
     except subprocess.CalledProcessError as e:
         raise ValueError(f"AppImage extraction failed: {e.stderr}")
     except Exception as e:
@@ -258,15 +824,107 @@ def find_file(root, extension):
             for f in filenames:
                 if f.endswith(extension):
                     file_path = os.path.join(dirpath, f)
-                    # Dosya yolunu güvenli hale getir
-                    file_path = sanitize_path(file_path)
+                    # Dosyanın çıkarma dizininin dışına çıkmadığından emin ol
+                    real_root = os.path.realpath(root)
+                    if not os.path.realpath(file_path).startswith(real_root + os.sep):
+                        continue
                     return file_path
         return None
     except Exception as e:
         raise ValueError(str(e))
 
+def index_tree(root):
+    """Çıkarılmış ağacı tek geçişte tarayıp uzantı ve ada göre indeksler.
+
+    Dönen sözlükte "ext" anahtarı uzantıdan göreli yollara, "name" anahtarı
+    dosya adından göreli yollara eşlenir. Ağacın dışını gösteren
+    sembolik bağlar indekse alınmaz.
+    """
+    index = {"root": root, "ext": {}, "name": {}}
+    if not os.path.exists(root):
+        return index
+    real_root = os.path.realpath(root)
+    for dirpath, dirnames, filenames in os.walk(root):
+        rel_dir = os.path.relpath(dirpath, root)
+        for name in filenames:
+            rel = name if rel_dir == "." else os.path.join(rel_dir, name)
+            path = os.path.join(root, rel)
+            if os.path.islink(path) and not os.path.realpath(path).startswith(real_root + os.sep):
+                continue
+            index["ext"].setdefault(os.path.splitext(name)[1].lower(), []).append(rel)
+            index["name"].setdefault(name, []).append(rel)
+    return index
+
+def find_desktop_file(index):
+    """Kök dizindeki .desktop dosyasını tercih ederek masaüstü dosyasını bulur."""
+    candidates = index["ext"].get(".desktop", [])
+    if not candidates:
+        return None
+    best = min(candidates, key=lambda rel: (rel.count(os.sep), rel))
+    return os.path.join(index["root"], best)
+
+def _icon_size_rank(rel):
+    """hicolor boyut dizinine göre sıralama değeri (küçük olan daha iyi)."""
+    import re
+
+    for part in rel.split(os.sep):
+        if part == "scalable":
+            return 1
+        match = re.fullmatch(r"(\d+)x\d+(?:@\d+)?", part)
+        if match:
+            size = int(match.group(1))
+            # 256x256 en iyisi; daha büyükler ondan sonra, daha küçükler en sonda
+            if size >= 256:
+                return 0 if size == 256 else 2
+            return 3 + (256 - size)
+    # Boyut bilgisi olmayan kök dizin ya da pixmaps ikonları
+    return 2 if os.sep not in rel else 300
+
+def _sniff_icon_type(path):
+    """Uzantısı olmayan (.DirIcon gibi) ikonların türünü içeriğinden tahmin eder."""
+    try:
+        with open(path, 'rb') as f:
+            head = f.read(256)
+    except OSError:
+        return None
+    if head.startswith(b"\x89PNG\r\n\x1a\n"):
+        return ".png"
+    if head.startswith(b"/* XPM */"):
+        return ".xpm"
+    if b"<svg" in head or head.lstrip().startswith(b"<?xml"):
+        return ".svg"
+    return None
+
+def find_icon(index, icon_name):
+    """En uygun ikonu seçer; (yol, uzantı) ya da None döndürür.
+
+    Öncelik sırası: .DirIcon, ardından adı Icon= değeriyle eşleşen ikonlar,
+    en son diğer ikonlar. Aynı gruptaki adaylar hicolor boyut dizinine göre
+    (256x256 > scalable > daha büyükler ve kök dizin > küçükler) sıralanır.
+    """
+    root = index["root"]
+    if ".DirIcon" in index["name"]:
+        rel = min(index["name"][".DirIcon"], key=lambda r: r.count(os.sep))
+        ext = _sniff_icon_type(os.path.join(root, rel))
+        if ext:
+            return os.path.join(root, rel), ext
+
+    icon_name = os.path.basename(icon_name or "")
+    candidates = []
+    for ext in ALLOWED_ICON_EXTENSIONS:
+        for rel in index["ext"].get(ext, []):
+            stem = os.path.splitext(os.path.basename(rel))[0]
+            name_rank = 0 if icon_name and stem == icon_name else 1
+            candidates.append(((name_rank, _icon_size_rank(rel), rel), rel, ext))
+    if not candidates:
+        return None
+    _rank, rel, ext = min(candidates)
+    return os.path.join(root, rel), ext
+
 def parse_desktop_file(path):
     """Güvenli bir şekilde desktop dosyasını ayrıştırır."""
+    from configparser import ConfigParser
+
     try:
         if not os.path.exists(path):
             raise ValueError(_("file_not_found"))
@@ -284,6 +942,7 @@ def parse_desktop_file(path):
             "Categories": entry.get("Categories", ""),
             "Exec": entry.get("Exec", ""),
             "Icon": entry.get("Icon", ""),
+            "MimeType": entry.get("MimeType", ""),
             "Version": entry.get("Version", "1.0")
         }
     except Exception as e:
@@ -292,154 +951,1216 @@ def parse_desktop_file(path):
 def slugify(name):
     return name.lower().replace(" ", "_")
 
-def install_appimage(appimage_path, sandbox=True):
-    """Güvenli bir şekilde AppImage dosyasını kurar."""
+def prepare_appimage(appimage_path, sandbox=True, check_signature=False, launch_cache=None,
+                     system=None):
+    """AppImage'ı doğrular ve kurulum için gereken bilgileri toplar.
+
+    Yalnızca okuma yapar ve kurulum dizinlerine dokunmaz; bu sayede toplu
+    kurulumda ayrı süreçlerde paralel çalıştırılabilir. İkon dosyasının
+    içeriği geçici dizin silinmeden önce belleğe alınır. Aynı içerik aynı
+    ayarlarla zaten kuruluysa çıkarma yapılmaz ve "installed" alanı dolu
+    döner.
+    """
+    import shutil
+
     try:
         print(_("installing"))
         
         # AppImage dosyasını doğrula
-        verify_appimage(appimage_path)
+        with timings.stage("verify", appimage_path):
+            verify_appimage(appimage_path, check_signature=check_signature)
+
+        # Aynı AppImage zaten kuruluysa hiçbir şey yapma
+        with timings.stage("hash", appimage_path):
+            sha256 = file_digest(appimage_path)
+            installed = find_installed(sha256, sandbox, launch_cache, system)
+        if installed:
+            return {"path": appimage_path, "sha256": sha256, "installed": installed,
+                    "timings": timings.export()}
         
         # Çalıştırma izni ver
         os.chmod(appimage_path, os.stat(appimage_path).st_mode | 0o111)
 
-        temp_dir = tempfile.mkdtemp()
+        prepared = {
+            "path": appimage_path,
+            "size": os.path.getsize(appimage_path),
+            "sha256": sha256,
+            "installed": None
+        }
+
+        # Bu içerik daha önce ayrıştırıldıysa çıkarma yapma
+        cache = get_metadata_cache()
+        with timings.stage("cache_lookup", appimage_path):
+            cached = cache.get(sha256)
+        if cached:
+            prepared.update(data=cached["data"], icon=cached["icon"], runtime=cached["runtime"],
+                            timings=timings.export())
+            return prepared
+
+        temp_dir = scratch_dir()
         try:
-            squashfs_root = extract_appimage(appimage_path, temp_dir)
-            desktop_src = find_file(squashfs_root, ".desktop")
+            with timings.stage("extract", appimage_path):
+                squashfs_root = extract_appimage(appimage_path, temp_dir)
+            with timings.stage("index", appimage_path):
+                index = index_tree(squashfs_root)
+                desktop_src = find_desktop_file(index)
             if not desktop_src:
                 raise ValueError(_("error_desktop"))
 
-            data = parse_desktop_file(desktop_src)
-            app_name = slugify(data["Name"])
-
-            # Versiyon bilgilerini güncelle
-            versions = load_versions()
-            versions[app_name] = {
-                "version": data["Version"],
-                "path": appimage_path
-            }
-            save_versions(versions)
-
-            # Bin dizinini oluştur
-            bin_dir = secure_mkdir(os.path.join(HOME, ".local", "bin"))
-            appimage_target = os.path.join(bin_dir, os.path.basename(appimage_path))
-            shutil.copy(appimage_path, appimage_target)
-            os.chmod(appimage_target, 0o755)
-
-            # İkon dosyasını bul ve kopyala
-            icon_filename = data["Icon"]
-            icon_src = None
-            for ext in ALLOWED_ICON_EXTENSIONS:
-                icon_src = find_file(squashfs_root, ext)
-                if icon_src and icon_filename in os.path.basename(icon_src):
-                    break
+            with timings.stage("parse", appimage_path):
+                data = parse_desktop_file(desktop_src)
 
-            icon_target_dir = secure_mkdir(os.path.join(HOME, ".local", "share", "icons"))
-            icon_target = os.path.join(icon_target_dir, f"{app_name}.png")
-            if icon_src:
-                shutil.copy(icon_src, icon_target)
-                os.chmod(icon_target, 0o644)
-            else:
-                print(_("icon_not_found"))
+                # İkon dosyasını bul
+                icon = None
+                found = find_icon(index, data["Icon"])
+                if found:
+                    icon_src, icon_ext = found
+                    with open(icon_src, 'rb') as f:
+                        icon = (f.read(), icon_ext)
 
-            # Desktop dosyasını oluştur
-            desktop_dir = secure_mkdir(os.path.join(HOME, ".local", "share", "applications"))
-            desktop_target = os.path.join(desktop_dir, f"{app_name}.desktop")
+                runtime_type = appimage_type(appimage_path)
+                runtime = f"type{runtime_type}" if runtime_type else "unknown"
+            cache.put(sha256, data, icon, runtime)
 
-            exec_command = appimage_target
-            if not sandbox:
-                exec_command = f"{appimage_target} --no-sandbox"
+            prepared.update(data=data, icon=icon, runtime=runtime, timings=timings.export())
+            return prepared
+        finally:
+            shutil.rmtree(temp_dir)
+    except Exception as e:
+        raise ValueError(str(e))
 
-            desktop_content = f"""[Desktop Entry]
+def integrate_appimage(prepared, versions, sandbox=True, move=False, launch_cache=None, system=None):
+    """Hazırlanmış bir AppImage'ı masaüstüne entegre eder.
+
+    Versiyon bilgileri yalnızca verilen sözlükte güncellenir; kaydetmek ve
+    masaüstü veritabanını yenilemek çağıranın sorumluluğundadır. move True
+    ise orijinal dosya mümkünse kopyalanmak yerine taşınır, taşınamazsa
+    kopyalandıktan sonra silinir; imaj depoda zaten varsa dosyaya
+    dokunulmaz. launch_cache True
+    ise imaj başlatma önbelleğine çıkarılır ve masaüstü girdisi AppRun'ı
+    oradan başlatan betiği çalıştırır; None ise önceki kaydın ayarı korunur.
+    system bir önek ise imaj ve ikonu o önekteki paylaşılan depoya bir kez
+    yazılır, kullanıcıya yalnızca bağlantı ve masaüstü girdisi kalır; False
+    kullanıcı deposunu seçer, None önceki kaydın ayarını korur.
+    """
+    try:
+        appimage_path = prepared["path"]
+        data = prepared["data"]
+        app_name = slugify(data["Name"])
+        files = []
+        previous = versions.get(app_name)
+        if system is None:
+            system = previous.get("system") if previous else None
+        system = system or None
+        history = []
+        if previous and previous.get("system") == system:
+            history = version_history(app_name, previous)
+        elif previous:
+            # Depo değişti; eski depodaki sürümlere artık dönülemez
+            release_objects(app_name, previous, referenced_objects({app_name: previous}))
+
+        # İmajı depoya ekle ve bin dizinindeki bağlantıyı ona çevir
+        bin_dir = secure_mkdir(os.path.join(HOME, ".local", "bin"))
+        appimage_target = os.path.join(bin_dir, os.path.basename(appimage_path))
+        objects = get_objects(system, trusted=True)
+        with timings.stage("place", appimage_path):
+            obj, method = objects.add(appimage_path, prepared["sha256"], _place_object, move,
+                                      ref=_object_ref(app_name), digest=hash_file)
+            if move and method != "dedup" and os.path.exists(appimage_path):
+                os.remove(appimage_path)
+                print(_("original_deleted", path=appimage_path))
+            objects.link(obj, appimage_target)
+        print(_("copy_method", method=method))
+        if not system:
+            get_store().remember_digest(os.stat(obj), prepared["sha256"])
+        old_entry = appimage_entry(previous) if previous else None
+        if (old_entry and old_entry["path"] != appimage_target
+                and get_objects(previous.get("system")).owns(old_entry["path"])):
+            # Dosya adı değişen sürümün eski bağlantısını kaldır
+            os.remove(old_entry["path"])
+        files.append({
+            "type": "AppImage",
+            "path": appimage_target,
+            "size": prepared["size"],
+            "sha256": prepared["sha256"]
+        })
+
+        # İkon dosyasını kopyala
+        icon_target_dir = secure_mkdir(os.path.join(HOME, ".local", "share", "icons"))
+        icon_target = None
+        if prepared["icon"] is not None and system:
+            # Paylaşılan ikon kullanıcının manifestine girmez
+            with timings.stage("icon", appimage_path):
+                icon_target = objects.add_icon(prepared["sha256"], *prepared["icon"])
+            for item in (previous or {}).get("files") or ():
+                if item["type"] == "Icon" and os.path.isfile(item["path"]):
+                    os.remove(item["path"])
+        elif prepared["icon"] is not None:
+            icon_data, icon_ext = prepared["icon"]
+            icon_target = os.path.join(icon_target_dir, f"{app_name}{icon_ext}")
+            with timings.stage("icon", appimage_path):
+                with open(icon_target, 'wb') as f:
+                    f.write(icon_data)
+                os.chmod(icon_target, 0o644)
+                files.append(manifest_entry("Icon", icon_target))
+        else:
+            print(_("icon_not_found"))
+
+        # Desktop dosyasını oluştur
+        desktop_dir = secure_mkdir(os.path.join(HOME, ".local", "share", "applications"))
+        desktop_target = os.path.join(desktop_dir, f"{app_name}.desktop")
+
+        exec_command = appimage_target
+        if launch_cache is None:
+            launch_cache = bool(previous and previous.get("launch_cache"))
+        launcher = os.path.join(LAUNCHER_DIR, app_name)
+        if launch_cache:
+            from .launchcache import launcher_script
+            with timings.stage("launch_cache", appimage_path):
+                populate_launch_cache(prepared["sha256"], obj)
+            secure_mkdir(LAUNCHER_DIR)
+            secure_write(launcher, launcher_script(app_name, appimage_target, LAUNCH_CACHE_DIR))
+            os.chmod(launcher, 0o755)
+            files.append(manifest_entry("Launcher", launcher))
+            exec_command = launcher
+        elif os.path.isfile(launcher):
+            os.remove(launcher)
+
+        if not sandbox:
+            exec_command = f"{exec_command} --no-sandbox"
+
+        # Dosya ilişkilendirmeleri için MIME türlerini ve dosya argümanını koru
+        mime_type = data.get("MimeType", "")
+        if mime_type:
+            field_codes = [arg for arg in data["Exec"].split() if arg in ("%f", "%F", "%u", "%U")]
+            exec_command = f"{exec_command} {field_codes[0] if field_codes else '%U'}"
+
+        desktop_content = f"""[Desktop Entry]
 Type=Application
 Name={data['Name']}
 Comment={data['Comment']}
 Exec={exec_command}
-Icon={icon_target if icon_src else data['Icon']}
+Icon={icon_target or data['Icon']}
 Terminal=false
 Categories={data['Categories']};
 """
+        if mime_type:
+            desktop_content += f"MimeType={mime_type}\n"
+        with timings.stage("desktop_entry", appimage_path):
             secure_write(desktop_target, desktop_content)
             os.chmod(desktop_target, 0o644)
+            files.append(manifest_entry("Desktop", desktop_target))
+
+        # Versiyon bilgilerini, sürüm geçmişini ve kurulum manifestini güncelle
+        history = [item for item in history if item["sha256"] != prepared["sha256"]]
+        history.append({"version": data["Version"], "sha256": prepared["sha256"], "size": prepared["size"]})
+        versions[app_name] = {
+            "name": data["Name"],
+            "version": data["Version"],
+            "path": appimage_path,
+            "sandbox": sandbox,
+            "files": files,
+            "history": history,
+            "launch_cache": launch_cache,
+            "system": system
+        }
+        return app_name
+    except Exception as e:
+        raise ValueError(str(e))
 
-            subprocess.run(["update-desktop-database", desktop_dir], check=True)
+def refresh_desktop_database(added=(), removed=()):
+    """Kurulan ve kaldırılan uygulamaları mimeinfo.cache dosyasına işler.
 
-            print(_("installation_complete", name=data["Name"]))
-        finally:
-            shutil.rmtree(temp_dir)
+    update-desktop-database ile tüm dizini yeniden taramak yerine yalnızca
+    verilen uygulamaların .desktop dosyaları okunur.
+    """
+    from . import mimecache
+
+    apps_dir = os.path.join(HOME, ".local", "share", "applications")
+    if not os.path.isdir(apps_dir):
+        return
+    with timings.stage("desktop_database"):
+        mimecache.update(apps_dir,
+                         added=[os.path.join(apps_dir, f"{name}.desktop") for name in added],
+                         removed=[f"{name}.desktop" for name in removed])
+
+def rebuild_desktop_database():
+    """mimeinfo.cache dosyasını tüm .desktop dosyalarını okuyarak yeniden oluşturur."""
+    from . import mimecache
+
+    apps_dir = secure_mkdir(os.path.join(HOME, ".local", "share", "applications"))
+    with timings.stage("desktop_database"):
+        count = mimecache.rebuild(apps_dir)
+    print(_("desktop_database_rebuilt", count=count, path=os.path.join(apps_dir, mimecache.CACHE_NAME)))
+
+def install_appimage(appimage_path, sandbox=True, move=False, check_signature=False,
+                     launch_cache=None, system=None):
+    """Güvenli bir şekilde AppImage dosyasını kurar."""
+    try:
+        prepared = prepare_appimage(appimage_path, sandbox, check_signature, launch_cache, system)
+        if prepared["installed"]:
+            print(_("already_installed", name=prepared["installed"]))
+            return
+        versions = load_versions()
+        app_name = integrate_appimage(prepared, versions, sandbox, move, launch_cache, system)
+        with timings.stage("store"):
+            save_versions(versions)
+        refresh_desktop_database(added=[app_name])
+
+        print(_("installation_complete", name=prepared["data"]["Name"]))
     except Exception as e:
         raise ValueError(str(e))
 
-def uninstall_app(app_name):
-    """Güvenli bir şekilde uygulamayı kaldırır."""
+def collect_appimages(paths):
+    """Verilen dosya ve dizinlerden kurulacak AppImage dosyalarını toplar."""
+    result = []
+    for path in paths:
+        if os.path.isdir(path):
+            for name in sorted(os.listdir(path)):
+                candidate = os.path.join(path, name)
+                if os.path.isfile(candidate) and os.path.splitext(name)[1] in ALLOWED_EXTENSIONS:
+                    result.append(candidate)
+        else:
+            result.append(path)
+    # Aynı dosyanın iki kez kurulmasını önle
+    return list(dict.fromkeys(os.path.abspath(p) for p in result))
+
+def prepare_many(items, jobs=None, check_signature=False, launch_cache=None, system=None):
+    """(yol, sandbox) çiftlerini işlem havuzunda paralel hazırlar.
+
+    Hazırlanan kayıtların ve (yol, hata) çiftlerinin listesini döndürür.
+    """
+    from concurrent.futures import ProcessPoolExecutor
+
+    prepared, failed = [], []
+    if not items:
+        return prepared, failed
+
+    jobs = max(1, min(jobs or os.cpu_count() or 1, len(items)))
+    if jobs == 1:
+        for path, sandbox in items:
+            try:
+                item = prepare_appimage(path, sandbox, check_signature, launch_cache, system)
+                timings.merge(item.pop("timings", None))
+                prepared.append(item)
+            except Exception as e:
+                failed.append((path, str(e)))
+    else:
+        with ProcessPoolExecutor(max_workers=jobs) as pool:
+            futures = [(path, pool.submit(prepare_appimage, path, sandbox, check_signature, launch_cache, system))
+                       for path, sandbox in items]
+            for path, future in futures:
+                try:
+                    item = future.result()
+                    timings.merge(item.pop("timings", None))
+                    prepared.append(item)
+                except Exception as e:
+                    failed.append((path, str(e)))
+    return prepared, failed
+
+def install_many(appimage_paths, sandbox=True, jobs=None, move=False, check_signature=False,
+                 launch_cache=None, system=None):
+    """Birden çok AppImage'ı paralel hazırlayıp tek seferde kaydeder.
+
+    Doğrulama, çıkarma ve ayrıştırma işlem havuzunda yürütülür; dosyalar
+    sırayla yerleştirilir, versiyon dosyası bir kez yazılır ve masaüstü
+    veritabanı bir kez yenilenir. Başarısız dosyalar diğerlerini etkilemez;
+    zaten kurulu olanlar atlanır. Başarıyla kurulan (ya da zaten kurulu
+    olan) yolların listesini ve (yol, hata) çiftlerini döndürür.
+    """
+    installed = []
+    prepared, failed = prepare_many([(path, sandbox) for path in appimage_paths], jobs,
+                                    check_signature, launch_cache, system)
+
+    for item in prepared:
+        if item["installed"]:
+            installed.append(item["path"])
+            print(_("already_installed", name=item["installed"]))
+    prepared = [item for item in prepared if not item["installed"]]
+
+    if prepared:
+        versions = load_versions()
+        added = []
+        for item in prepared:
+            try:
+                added.append(integrate_appimage(item, versions, sandbox, move, launch_cache, system))
+                installed.append(item["path"])
+                print(_("installation_complete", name=item["data"]["Name"]))
+            except Exception as e:
+                failed.append((item["path"], str(e)))
+        if added:
+            with timings.stage("store"):
+                save_versions(versions)
+            refresh_desktop_database(added=added)
+    return installed, failed
+
+def print_plan(actions):
+    """Manifest planını özet satırı ve adım listesi olarak yazdırır."""
+    from .apply import ERROR, INSTALL, REMOVE, UNCHANGED, UPGRADE
+
+    counts = {kind: 0 for kind in (INSTALL, UPGRADE, REMOVE, UNCHANGED, ERROR)}
+    for action in actions:
+        counts[action.kind] += 1
+    print(_("plan_summary", install=counts[INSTALL], upgrade=counts[UPGRADE],
+            remove=counts[REMOVE], unchanged=counts[UNCHANGED]))
+    symbols = {INSTALL: "+", UPGRADE: "~", REMOVE: "-", ERROR: "!"}
+    for action in actions:
+        if action.kind == UNCHANGED:
+            continue
+        detail = action.source or ""
+        if action.reason:
+            detail = _(f"plan_reason_{action.reason}") + (f": {detail}" if detail else "")
+        print(f"  {symbols[action.kind]} {action.name}" + (f"  ({detail})" if detail else ""))
+
+def _cached_app_name(sha256):
+    """Özeti ayrıştırılmış bir imajın kayıt adını önbellekten döndürür; yoksa None."""
+    cached = get_metadata_cache().get(sha256)
+    name = cached["data"].get("Name") if cached else None
+    return slugify(name) if name else None
+
+def apply_manifest(manifest_path, dry_run=False, prune=False, jobs=None, check_signature=False):
+    """Manifestteki istenen durumu en az kurulum, güncelleme ve kaldırmayla uygular.
+
+    Kurulacak AppImage'lar paralel hazırlanır; tüm değişiklikler depoya tek
+    işlemde yazılır ve masaüstü veritabanı bir kez güncellenir. Başarısız
+    adımların (ad, hata) listesini döndürür.
+    """
+    from .apply import ERROR, INSTALL, REMOVE, UPGRADE, load_manifest, plan
+
+    with timings.stage("plan", manifest_path):
+        apps, manifest_prune = load_manifest(manifest_path, slugify)
+        versions = load_versions()
+        actions = plan(apps, versions, file_digest, prune or manifest_prune, _cached_app_name)
+    print_plan(actions)
+
+    failed = [(action.name, _(f"plan_reason_{action.reason}"))
+              for action in actions if action.kind == ERROR]
+    changes = [action for action in actions if action.kind in (INSTALL, UPGRADE, REMOVE)]
+    if dry_run or not changes:
+        return failed
+
+    # Hazırlık paralel yürür; yerleştirme ve kayıt tek süreçte yapılır
+    sources = [action for action in changes if action.kind != REMOVE]
+    prepared, prepare_failed = prepare_many([(a.source, a.sandbox) for a in sources], jobs,
+                                            check_signature)
+    by_source = {action.source: action for action in sources}
+    failed.extend((by_source[path].name, message) for path, message in prepare_failed)
+
+    added, removed = [], []
+    for item in prepared:
+        action = by_source[item["path"]]
+        if item["installed"]:
+            print(_("already_installed", name=item["installed"]))
+            continue
+        old = versions.get(action.name)
+        try:
+            name = integrate_appimage(item, versions, action.sandbox)
+        except Exception as e:
+            failed.append((action.name, str(e)))
+            continue
+        if old is not None:
+            # Yeni kurulumda yeri değişen eski dosyaları temizle
+            remove_manifest_files(old.get("files") or (),
+                                  keep={entry["path"] for entry in versions[name]["files"]})
+            if name != action.name:
+                del versions[action.name]
+                removed.append(action.name)
+        added.append(name)
+        print(_("installation_complete", name=item["data"]["Name"]))
+
+    for action in changes:
+        if action.kind == REMOVE and action.name not in added:
+            print(_("uninstalling", name=action.name))
+            with timings.stage("remove", action.name):
+                remove_manifest_files(versions[action.name].get("files") or ())
+            del versions[action.name]
+            removed.append(action.name)
+
+    if added or removed:
+        with timings.stage("store"):
+            save_versions(versions)
+        refresh_desktop_database(added=added, removed=removed)
+    return failed
+
+def read_update_info(path):
+    """AppImage'ın .upd_info bölümündeki güncelleme bilgisini döndürür; yoksa None."""
+    from .elf import UPDATE_INFO_SECTION, ELFError, read_header, read_section
+
+    fd = os.open(path, os.O_RDONLY)
     try:
-        app_name = slugify(app_name)
-        print(_("uninstalling", name=app_name))
+        info = read_section(fd, read_header(fd), UPDATE_INFO_SECTION)
+    except ELFError:
+        return None
+    finally:
+        os.close(fd)
+    if not info:
+        return None
+    return info.decode("utf-8", "replace").strip() or None
+
+def installed_appimage(info):
+    """Kayıttaki kurulu AppImage kopyasının yolunu döndürür."""
+    entry = appimage_entry(info)
+    if entry is not None:
+        return entry["path"]
+    return os.path.join(HOME, ".local", "bin", os.path.basename(info["path"]))
+
+def update_app(app_name, client):
+    """Kurulu bir uygulamayı gömülü zsync bilgisiyle günceller.
+
+    Kurulu kopya yeni sürümün blok özetleriyle taranır, yalnızca değişen
+    bloklar HTTP aralık istekleriyle indirilir. Birleştirilen dosya aynı
+    dizinde hazırlanır, doğrulanır ve eski kopyanın yerine atomik olarak
+    taşınır. Güncelleme yapıldıysa True döndürür.
+    """
+    import shutil
+    from . import scratch
+    from .zsync import ControlFile, file_sha1, resolve_control_url, synchronize
+
+    app_name = slugify(app_name)
+    versions = load_versions()
+    info = versions.get(app_name)
+    if info is None:
+        raise ValueError(_("app_not_installed", name=app_name))
+    target = installed_appimage(info)
+    update_info = read_update_info(target)
+    if not update_info:
+        print(_("no_update_info", name=app_name))
+        return False
+
+    print(_("checking_update", name=app_name))
+    with timings.stage("update_check", app_name):
+        raw, control_url = client.get(resolve_control_url(update_info, client))
+        control = ControlFile(raw, control_url)
+        current = file_sha1(target)
+    if current == control.sha1:
+        print(_("up_to_date", name=app_name))
+        return False
+
+    scratch.clean_stale(os.path.dirname(target), ".update-")
+    stage_dir = scratch.make(os.path.dirname(target), ".update-")
+    try:
+        staged = os.path.join(stage_dir, os.path.basename(target))
+        with timings.stage("delta_download", app_name):
+            stats = synchronize(control, target, staged, client)
+        mb = 1024 * 1024
+        print(_("update_transfer", reused=f"{stats['reused'] / mb:.1f}",
+                downloaded=f"{stats['downloaded'] / mb:.1f}", total=f"{stats['length'] / mb:.1f}"))
+
+        sandbox = info.get("sandbox", True)
+        prepared = prepare_appimage(staged, sandbox)
+        timings.merge(prepared.pop("timings", None))
+        if prepared["installed"]:
+            print(_("already_installed", name=prepared["installed"]))
+            return False
+        # Yeni sürüm yeniden adlandırmayla eski kopyanın yerine geçer
+        new_name = integrate_appimage(prepared, versions, sandbox, move=True,
+                                      launch_cache=info.get("launch_cache"),
+                                      system=info.get("system") or False)
+        # Hazırlık dizini silineceğinden kaynak yolu güncellemeden önceki hâliyle kalır
+        record = versions[new_name]
+        record["path"] = info.get("path")
+        removed = []
+        if new_name != app_name:
+            remove_manifest_files(info.get("files") or (),
+                                  keep={entry["path"] for entry in record["files"]})
+            # Eski adın sürüm geçmişi yeni kayda taşınır; rollback eski sürümlere dönebilsin
+            current = {item["sha256"] for item in record["history"]}
+            carried = [item for item in info.get("history") or () if item["sha256"] not in current]
+            record["history"] = carried + record["history"]
+            if record.get("system"):
+                shared = get_objects(record["system"], trusted=True)
+                for item in carried:
+                    shared.add_ref(item["sha256"], _object_ref(new_name))
+            release_objects(app_name, info, referenced_objects({app_name: info}))
+            del versions[app_name]
+            removed.append(app_name)
+        with timings.stage("store", app_name):
+            save_versions(versions)
+        refresh_desktop_database(added=[new_name], removed=removed)
+        print(_("update_complete", name=prepared["data"]["Name"], version=prepared["data"]["Version"]))
+        return True
+    finally:
+        shutil.rmtree(stage_dir, ignore_errors=True)
 
-        appimage_path = os.path.join(HOME, ".local", "bin", f"{app_name}.AppImage")
-        if not os.path.exists(appimage_path):
-            print(_("appimage_not_found", path=appimage_path))
-            return
+def update_command(app_names=()):
+    """Verilen (ya da tüm) uygulamaları günceller; başarısız olanları döndürür."""
+    from .zsync import HTTPClient
 
-        temp_dir = tempfile.mkdtemp()
-        try:
-            squashfs_root = extract_appimage(appimage_path, temp_dir)
-            desktop_src = find_file(squashfs_root, ".desktop")
-            if not desktop_src:
-                raise ValueError(_("error_desktop"))
+    names = list(app_names) or [name for name, _info in get_store().items()]
+    client = HTTPClient()
+    failed = []
+    try:
+        for name in names:
+            try:
+                update_app(name, client)
+            except Exception as e:
+                failed.append(name)
+                print(_("update_failed", name=name, message=str(e)))
+    finally:
+        client.close()
+    return failed
+
+def verify_command(appimage_path, check_signature=False):
+    """AppImage başlığını doğrular ve bulunan bilgileri yazdırır."""
+    from .elf import (DIGEST_SECTION, SIGNATURE_SECTION, UPDATE_INFO_SECTION,
+                      read_header, read_section)
+
+    verify_appimage(appimage_path, check_signature=check_signature)
+    fd = os.open(appimage_path, os.O_RDONLY)
+    try:
+        header = read_header(fd)
+        update_info = read_section(fd, header, UPDATE_INFO_SECTION)
+        signed = bool(read_section(fd, header, SIGNATURE_SECTION))
+        has_digest = bool(read_section(fd, header, DIGEST_SECTION))
+    finally:
+        os.close(fd)
+
+    print(_("verify_ok", path=appimage_path))
+    print("-" * 50)
+    print(f"{_('verify_type')}: {header.type} (ELF{header.elf_class})")
+    print(f"{_('verify_update_info')}: {update_info.decode('utf-8', 'replace') if update_info else '-'}")
+    print(f"{_('verify_signed')}: {_('yes') if signed else _('no')}")
+    print(f"{_('verify_digest')}: {_('yes') if has_digest else _('no')}")
+    print("-" * 50)
 
-            data = parse_desktop_file(desktop_src)
-            actual_app_name = slugify(data["Name"])
+def remove_manifest_files(entries, keep=()):
+    """Manifestteki dosyaları siler; keep içindeki ve değiştirilmiş dosyalara dokunmaz."""
+    for entry in entries:
+        path = entry["path"]
+        if path in keep:
+            continue
+        if not os.path.isfile(path):
+            print(_("not_found", type=entry["type"], path=path))
+        elif os.path.getsize(path) != entry["size"]:
+            # Kurulumdan sonra değiştirilmiş dosyalara dokunma
+            print(_("modified_skipped", type=entry["type"], path=path))
+        else:
+            os.remove(path)
+            print(_("deleted", type=entry["type"], path=path))
 
-            paths = {
-                "AppImage": appimage_path,
-                "Desktop": os.path.join(HOME, ".local", "share", "applications", f"{actual_app_name}.desktop"),
-                "Icon": os.path.join(HOME, ".local", "share", "icons", f"{actual_app_name}.png"),
-            }
+def uninstall_many(app_names):
+    """Uygulamaları kaldırır; depo ve masaüstü veritabanı bir kez güncellenir.
 
-            for key, path in paths.items():
-                if os.path.exists(path):
-                    os.remove(path)
-                    print(_("deleted", type=key, path=path))
-                else:
-                    print(_("not_found", type=key, path=path))
+    Silinecek dosyalar kurulum manifestinden okunur; AppImage çıkarılmaz.
+    Manifesti olmayan eski kayıtlar ilk kaldırmada manifeste dönüştürülür.
+    """
+    versions = load_versions()
+    removed = []
+    objects = set()
+    for app_name in app_names:
+        app_name = slugify(app_name)
+        print(_("uninstalling", name=app_name))
 
-            versions = load_versions()
-            if actual_app_name in versions:
-                del versions[actual_app_name]
-                save_versions(versions)
+        with timings.stage("manifest", app_name):
+            info = versions.get(app_name)
+            if info is None:
+                appimage_path = os.path.join(HOME, ".local", "bin", f"{app_name}.AppImage")
+                if not os.path.exists(appimage_path):
+                    print(_("appimage_not_found", path=appimage_path))
+                    continue
+                info = {"path": appimage_path}
+
+            if "files" not in info:
+                info["files"] = legacy_manifest(app_name, info)
+
+        with timings.stage("remove", app_name):
+            remove_manifest_files(info["files"])
+
+        hashes = referenced_objects({app_name: info})
+        release_objects(app_name, info, hashes)
+        objects.update(hashes)
+        versions.pop(app_name, None)
+        removed.append(app_name)
+
+    if removed:
+        with timings.stage("store"):
+            save_versions(versions)
+        # Başka bir kaydın kullanmadığı sürümleri depodan sil
+        store, launch_cache = get_objects(), get_launch_cache()
+        for sha256 in objects - referenced_objects(versions, personal=True):
+            store.discard(sha256)
+        for sha256 in objects - referenced_objects(versions, launch_cache=True):
+            launch_cache.discard(sha256)
+        refresh_desktop_database(removed=removed)
+        print(_("uninstall_complete"))
+    return removed
 
-            subprocess.run(["update-desktop-database", os.path.join(HOME, ".local", "share", "applications")], check=True)
-            print(_("uninstall_complete"))
-        finally:
-            shutil.rmtree(temp_dir)
+def uninstall_app(app_name):
+    """Güvenli bir şekilde uygulamayı kaldırır."""
+    try:
+        uninstall_many([app_name])
     except Exception as e:
         raise ValueError(str(e))
 
-def list_installed_apps():
+def _file_signature(path):
+    """Dosyanın (boyut, mtime) çiftini döndürür; dosya yoksa None."""
+    try:
+        st = os.stat(path)
+    except OSError:
+        return None
+    return st.st_size, st.st_mtime_ns
+
+def watch_folders(folders, sandbox=True, jobs=None, debounce=WATCH_DEBOUNCE, initial_scan=True,
+                  system=None):
+    """Klasörleri inotify ile izler; bırakılan AppImage'ları kurar, silinenleri kaldırır.
+
+    Yazması biten ya da klasöre taşınan dosyalar debounce saniye bekletilir
+    ve boyutu ile mtime'ı bu sürede değişmediyse kurulur. Aynı anda hazır
+    olan dosyalar install_many ile sınırlı bir işlem havuzunda hazırlanır;
+    depo ve masaüstü veritabanı her grup için bir kez güncellenir. Silinen ya
+    da klasörden taşınan dosyanın kaydı uninstall_many ile kaldırılır.
+    SIGTERM ya da Ctrl+C ile durur.
+    """
+    import signal
+    import time
+    from . import inotify
+
+    folders = [os.path.abspath(os.path.expanduser(folder)) for folder in folders]
+    for folder in folders:
+        if not os.path.isdir(folder):
+            raise ValueError(_("watch_folder_missing", path=folder))
+
+    stopping = []
+    def stop(signum, frame):
+        stopping.append(signum)
+    signal.signal(signal.SIGTERM, stop)
+    signal.signal(signal.SIGINT, stop)
+
+    pending = {}  # yol -> (son tarih, (boyut, mtime))
+    removed = {}  # yol -> son tarih
+
+    def schedule(path):
+        pending[path] = (time.monotonic() + debounce, _file_signature(path))
+        removed.pop(path, None)
+
+    def scan():
+        for folder in folders:
+            for path in collect_appimages([folder]):
+                schedule(path)
+
+    try:
+        watcher = inotify.Inotify()
+    except (OSError, AttributeError) as e:
+        raise ValueError(_("inotify_unavailable", message=str(e)))
+
+    mask = (inotify.IN_CLOSE_WRITE | inotify.IN_MOVED_TO | inotify.IN_MOVED_FROM |
+            inotify.IN_DELETE | inotify.IN_DELETE_SELF | inotify.IN_MOVE_SELF | inotify.IN_ONLYDIR)
+    with watcher:
+        for folder in folders:
+            watcher.add_watch(folder, mask)
+            print(_("watching", path=folder))
+        if initial_scan:
+            scan()
+
+        while not stopping and watcher.watches:
+            deadlines = [deadline for deadline, _signature in pending.values()]
+            deadlines.extend(removed.values())
+            timeout = 1.0
+            if deadlines:
+                timeout = min(timeout, max(0.0, min(deadlines) - time.monotonic()))
+            try:
+                events = watcher.read(timeout)
+            except InterruptedError:
+                events = []
+
+            for event in events:
+                if event.mask & inotify.IN_Q_OVERFLOW:
+                    # Olaylar kaçırıldı; klasörleri yeniden tara
+                    scan()
+                    continue
+                folder = watcher.watches.get(event.wd)
+                if folder is None:
+                    continue
+                if event.mask & (inotify.IN_DELETE_SELF | inotify.IN_MOVE_SELF):
+                    print(_("watch_folder_gone", path=folder))
+                    watcher.remove_watch(event.wd)
+                    continue
+                if event.mask & inotify.IN_ISDIR or not event.name:
+                    continue
+                if os.path.splitext(event.name)[1] not in ALLOWED_EXTENSIONS:
+                    continue
+                path = os.path.join(folder, event.name)
+                if event.mask & (inotify.IN_CLOSE_WRITE | inotify.IN_MOVED_TO):
+                    schedule(path)
+                elif event.mask & (inotify.IN_DELETE | inotify.IN_MOVED_FROM):
+                    pending.pop(path, None)
+                    removed[path] = time.monotonic() + debounce
+
+            now = time.monotonic()
+            ready = []
+            for path, (deadline, signature) in list(pending.items()):
+                if deadline > now:
+                    continue
+                current = _file_signature(path)
+                if current is None:
+                    del pending[path]
+                elif current != signature:
+                    # Hâlâ yazılıyor; süreyi yeniden başlat
+                    pending[path] = (now + debounce, current)
+                else:
+                    del pending[path]
+                    ready.append(path)
+            if ready:
+                _installed, failed = install_many(sorted(ready), sandbox, jobs, system=system)
+                for path, message in failed:
+                    print(_("install_failed", path=path, message=message))
+
+            gone = [path for path, deadline in removed.items() if deadline <= now]
+            for path in gone:
+                del removed[path]
+            # Aynı adla geri konan dosyalar kaldırılmaz; yeni sürüm kurulur
+            gone = {path for path in gone if not os.path.exists(path)}
+            if gone:
+                names = [name for name, info in load_versions().items() if info.get("path") in gone]
+                if names:
+                    uninstall_many(names)
+
+    print(_("watch_stopped"))
+
+def activate_version(app_name, selector=None):
+    """Uygulamanın bağlantısını geçmişteki başka bir sürüme çevirir.
+
+    selector bir sürüm adı ya da özet öneki olabilir; None ise etkin
+    sürümden önce kurulmuş sürüme dönülür. Yalnızca bin dizinindeki
+    sembolik bağlantı ve kayıt değiştirilir; dosya kopyalanmaz.
+    """
+    app_name = slugify(app_name)
+    versions = load_versions()
+    info = versions.get(app_name)
+    if info is None:
+        raise ValueError(_("app_not_installed", name=app_name))
+    history = info.get("history") or []
+    entry = appimage_entry(info)
+    current = entry.get("sha256") if entry else None
+
+    if selector is None:
+        index = next((i for i, item in enumerate(history) if item["sha256"] == current), len(history))
+        earlier = history[:index]
+        if not earlier:
+            raise ValueError(_("no_previous_version", name=app_name))
+        chosen = earlier[-1]
+    else:
+        matches = [item for item in history if item["version"] == selector]
+        if not matches and len(selector) >= 7:
+            matches = [item for item in history if item["sha256"].startswith(selector.lower())]
+        if not matches:
+            raise ValueError(_("version_not_found", name=app_name, version=selector))
+        chosen = matches[-1]
+
+    if chosen["sha256"] == current:
+        print(_("version_already_active", name=app_name, version=chosen["version"]))
+        return False
+    objects = get_objects(info.get("system"), trusted=True)
+    if entry is None or not objects.contains(chosen["sha256"], chosen["size"]):
+        raise ValueError(_("version_missing", name=app_name, version=chosen["version"]))
+
+    if info.get("launch_cache"):
+        with timings.stage("launch_cache", app_name):
+            populate_launch_cache(chosen["sha256"], objects.path(chosen["sha256"]))
+    with timings.stage("place", app_name):
+        objects.link(objects.path(chosen["sha256"]), entry["path"])
+    entry["sha256"], entry["size"] = chosen["sha256"], chosen["size"]
+    info["version"] = chosen["version"]
+    with timings.stage("store", app_name):
+        save_versions(versions)
+    print(_("version_activated", name=app_name, version=chosen["version"]))
+    return True
+
+def list_versions(app_name):
+    """Uygulamanın depoda tutulan sürümlerini listeler."""
+    app_name = slugify(app_name)
+    info = load_versions().get(app_name)
+    if info is None:
+        raise ValueError(_("app_not_installed", name=app_name))
+    entry = appimage_entry(info)
+    current = entry.get("sha256") if entry else None
+    objects = get_objects(info.get("system"))
+    print(f"\n{_('app')}: {app_name}")
+    print("-" * 50)
+    for item in info.get("history") or ():
+        marker = "*" if item["sha256"] == current else " "
+        state = "" if objects.contains(item["sha256"], item["size"]) else f"  ({_('missing')})"
+        print(f"{marker} {item['version']:<20} {item['sha256'][:12]}  "
+              f"{item['size'] / 1024 / 1024:.1f} MB{state}")
+    print("-" * 50)
+
+def gc_command(keep=KEEP_VERSIONS, dry_run=False, system=None):
+    """Sürüm geçmişlerini keep sürüme indirir ve kullanılmayan nesneleri siler.
+
+    Etkin sürüm her zaman tutulur. Geçmişi olmayan eski kayıtlara dokunulmaz.
+    system bir önek ise kullanıcı deposu yerine o önekteki paylaşılan
+    depodan hiçbir kullanıcının başvurmadığı nesneler silinir.
+    """
+    if keep < 1:
+        raise ValueError(_("gc_keep_invalid"))
+    versions = load_versions()
+    for app_name, info in versions.items():
+        history = info.get("history")
+        if not history:
+            continue
+        entry = appimage_entry(info)
+        current = entry.get("sha256") if entry else None
+        kept = {item["sha256"] for item in history[-keep:]}
+        info["history"] = [item for item in history
+                           if item["sha256"] in kept or item["sha256"] == current]
+        if not dry_run:
+            release_objects(app_name, info, {item["sha256"] for item in history} -
+                            {item["sha256"] for item in info["history"]})
+
+    referenced = referenced_objects(versions, personal=True)
+    if system:
+        removed, freed = get_objects(system, trusted=True).collect_unreferenced(dry_run)
+    else:
+        removed, freed = get_objects().collect(referenced, dry_run)
+    if not dry_run:
+        get_launch_cache().prune(referenced=referenced_objects(versions, launch_cache=True))
+        with timings.stage("store"):
+            save_versions(versions)
+    key = "gc_dry_run" if dry_run else "gc_complete"
+    print(_(key, count=len(removed), size=f"{freed / 1024 / 1024:.1f}"))
+    return removed
+
+def _reintegrate(app_name, versions):
+    """Eksik masaüstü girdisini, ikonu ya da başlatıcıyı kurulu AppImage'dan yeniden yazar.
+
+    Kaynak yolu ve sürüm geçmişi korunur; AppImage depoda zaten
+    bulunduğundan kopyalama yapılmaz.
+    """
+    info = versions[app_name]
+    sandbox = info.get("sandbox", True)
+    prepared = prepare_appimage(appimage_entry(info)["path"], sandbox,
+                                launch_cache=info.get("launch_cache"))
+    timings.merge(prepared.pop("timings", None))
+    if prepared["installed"]:
+        return False
+    if slugify(prepared["data"]["Name"]) != app_name:
+        raise ValueError(_("app_name_changed", name=app_name))
+    integrate_appimage(prepared, versions, sandbox, launch_cache=info.get("launch_cache"))
+    versions[app_name].update(path=info.get("path"), history=info.get("history", []))
+    return True
+
+def _restore_object(info, entry, objects):
+    """Etkin sürümün nesnesi sağlamsa ya da kaynaktan yeniden eklendiyse True.
+
+    İçeriği adıyla uyuşmayan nesne, kaynak dosya hâlâ aynı özete sahipse
+    kullanıcı deposunda kaynaktan yeniden oluşturulur.
+    """
+    sha256 = entry["sha256"]
+    if objects.contains(sha256, entry["size"]) and hash_file(objects.path(sha256)) == sha256:
+        return True
+    source = info.get("path")
+    if info.get("system") or not source or not os.path.isfile(source) or hash_file(source) != sha256:
+        return False
+    objects.discard(sha256)
+    objects.add(source, sha256, _place_object, digest=hash_file)
+    return objects.contains(sha256, entry["size"])
+
+def sync_command(repair=True):
+    """Kayıtları ~/.local/bin, masaüstü girdileri ve ikonlarla karşılaştırır.
+
+    repair False ise (doctor) yalnızca bulunan sorunlar yazdırılır. Aksi
+    hâlde depoda bulunan AppImage'ların bağlantıları yeniden kurulur (içeriği
+    bozulmuş nesneler kaynak dosyadan yeniden oluşturulur), eksik
+    masaüstü girdileri ve ikonlar yeniden yazılır, AppImage'ı kurtarılamayan
+    kayıtlar ve hiçbir kayda ait olmayan dosyalar silinir. Kullanıcının
+    değiştirdiği dosyalara dokunulmaz. Giderilemeyen sorunları döndürür.
+    """
+    from .reconcile import (MISSING, MODIFIED, NO_MANIFEST, NO_VERSION, ORPHAN,
+                            StatCache, check_records, find_orphans)
+
+    store = get_store()
     versions = load_versions()
-    if not versions:
-        print(_("no_installed_apps"))
+    dirs = {
+        "bin": os.path.join(HOME, ".local", "bin"),
+        "applications": os.path.join(HOME, ".local", "share", "applications"),
+        "icons": os.path.join(HOME, ".local", "share", "icons"),
+        "launchers": LAUNCHER_DIR
+    }
+    with timings.stage("check"):
+        stat_cache = StatCache(store.file_states())
+        owns = lambda path: owns_link(path, versions)
+        problems = check_records(versions, owns, hash_file, stat_cache)
+        problems += find_orphans(versions, dirs, owns, stat_cache,
+                                 sorted(ALLOWED_ICON_EXTENSIONS), ALLOWED_EXTENSIONS)
+        store.update_file_states(stat_cache.changed, stat_cache.stale())
+
+    for problem in problems:
+        subject = problem.name or problem.type
+        print(f"{subject}: {_('problem_' + problem.kind)}{' ' + problem.path if problem.path else ''}")
+    if not problems:
+        print(_("sync_clean"))
+        return []
+    if not repair:
+        return problems
+
+    unresolved, added, removed = [], [], []
+    by_app = {}
+    for problem in problems:
+        if problem.kind == ORPHAN:
+            os.remove(problem.path)
+            print(_("deleted", type=problem.type, path=problem.path))
+            if problem.type == "Desktop":
+                removed.append(os.path.basename(problem.path)[:-len(".desktop")])
+        else:
+            by_app.setdefault(problem.name, []).append(problem)
+
+    for app_name, items in by_app.items():
+        info = versions[app_name]
+        kinds = {problem.kind for problem in items}
+        if NO_MANIFEST in kinds:
+            info["files"] = legacy_manifest(app_name, info)
+        entry = appimage_entry(info)
+        if NO_VERSION in kinds:
+            sha256 = entry.get("sha256") if entry else None
+            known = [item["version"] for item in info.get("history") or ()
+                     if item["sha256"] == sha256 and item.get("version")]
+            cached = get_metadata_cache().get(sha256) if sha256 and not known else None
+            if known or cached:
+                info["version"] = known[-1] if known else cached["data"].get("Version")
+            else:
+                unresolved.extend(problem for problem in items if problem.kind == NO_VERSION)
+
+        broken = [problem for problem in items if problem.kind in (MISSING, MODIFIED)]
+        if entry is None and not broken:
+            continue
+        appimage = [problem for problem in broken if problem.type == "AppImage"]
+        objects = get_objects(info.get("system"))
+        if appimage or entry is None:
+            if entry is not None and entry.get("sha256") and _restore_object(info, entry, objects):
+                objects.link(objects.path(entry["sha256"]), entry["path"])
+                print(_("sync_relinked", name=app_name, path=entry["path"]))
+            elif entry is None or appimage[0].kind == MISSING:
+                # AppImage kurtarılamıyor; kalan dosyaları ve kaydı sil
+                remove_manifest_files([item for item in info.get("files") or ()
+                                       if os.path.lexists(item["path"])])
+                release_objects(app_name, info, referenced_objects({app_name: info}))
+                versions.pop(app_name)
+                removed.append(app_name)
+                print(_("sync_pruned", name=app_name))
+                continue
+            else:
+                unresolved.extend(appimage)
+        if any(problem.kind == MISSING and problem.type != "AppImage" for problem in broken):
+            try:
+                if _reintegrate(app_name, versions):
+                    added.append(app_name)
+                    print(_("sync_repaired", name=app_name))
+            except Exception as e:
+                unresolved.extend(problem for problem in broken if problem.type != "AppImage")
+                print(_("error", message=str(e)))
+        unresolved.extend(problem for problem in broken
+                          if problem.kind == MODIFIED and problem.type != "AppImage")
+
+    with timings.stage("store"):
+        save_versions(versions)
+    if added or removed:
+        refresh_desktop_database(added=added, removed=removed)
+    for problem in unresolved:
+        print(f"{problem.name}: {_('sync_unresolved')} ({_('problem_' + problem.kind)})"
+              f"{' ' + problem.path if problem.path else ''}")
+    return unresolved
+
+# list ve info komutlarının yazdırabildiği alanlar
+LIST_FIELDS = ("name", "title", "version", "path", "install_path", "sha256", "size",
+               "sandbox", "launch_cache", "system", "versions")
+# Depo indeksinden, kayıt çözülmeden okunabilen alanlar ve karşılık gelen sütunlar
+INDEXED_FIELDS = {"name": "name", "version": "version", "path": "source_path",
+                  "install_path": "install_path", "sha256": "sha256"}
+TSV_FIELDS = ("name", "version", "path")
+LIST_FORMATS = ("text", "json", "jsonl", "tsv")
+
+def app_fields(app_name, info):
+    """Bir kaydı list ve info çıktısındaki alanlara dönüştürür."""
+    entry = appimage_entry(info) or {}
+    return {
+        "name": app_name,
+        "title": info.get("name"),
+        "version": info.get("version"),
+        "path": info.get("path"),
+        "install_path": entry.get("path"),
+        "sha256": entry.get("sha256"),
+        "size": entry.get("size"),
+        "sandbox": info.get("sandbox", True),
+        "launch_cache": bool(info.get("launch_cache")),
+        "system": info.get("system"),
+        "versions": [item["version"] for item in info.get("history") or ()]
+    }
+
+def parse_list_filters(expressions):
+    """"alan=desen" ifadelerini {sütun: glob deseni} sözlüğüne çevirir."""
+    filters = {}
+    for expression in expressions or ():
+        field, sep, pattern = expression.partition("=")
+        if not sep or field not in INDEXED_FIELDS:
+            raise ValueError(_("invalid_filter", filter=expression,
+                               fields=", ".join(INDEXED_FIELDS)))
+        filters[INDEXED_FIELDS[field]] = pattern
+    return filters
+
+def _tsv_value(value):
+    if value is None:
+        return ""
+    if isinstance(value, bool):
+        return "true" if value else "false"
+    if isinstance(value, list):
+        value = ",".join(str(item) for item in value)
+    return str(value).replace("\\", "\\\\").replace("\t", "\\t").replace("\n", "\\n")
+
+def _write_stream(lines):
+    """Satırları üretildikçe yazar; okuyucu erken kapanırsa sessizce durur."""
+    write = sys.stdout.write
+    try:
+        for line in lines:
+            write(line)
+        sys.stdout.flush()
+    except BrokenPipeError:
+        # Okuyucu kapandı (ör. head); çıkışta yeniden hata verilmesin
+        devnull = os.open(os.devnull, os.O_WRONLY)
+        os.dup2(devnull, sys.stdout.fileno())
+
+def list_installed_apps(fmt="text", filters=None, fields=None):
+    """Kurulu uygulamaları depo indeksinden okuyarak akış hâlinde listeler.
+
+    Kayıtlar ada göre sıralı olarak tek tek okunur ve hemen yazılır; istenen
+    alanların hepsi indeksli sütunlardaysa kayıtlar çözülmez. AppImage
+    dosyalarına dokunulmaz.
+    """
+    import json
+
+    if fmt not in LIST_FORMATS:
+        raise ValueError(_("invalid_format", format=fmt))
+    filters = parse_list_filters(filters)
+    if fields:
+        unknown = [field for field in fields if field not in LIST_FIELDS]
+        if unknown:
+            raise ValueError(_("invalid_field", field=unknown[0], fields=", ".join(LIST_FIELDS)))
+    else:
+        fields = TSV_FIELDS if fmt == "tsv" else LIST_FIELDS
+    decode = fmt == "text" or not set(fields) <= set(INDEXED_FIELDS)
+
+    def records():
+        for columns, info in get_store().query(filters, decode):
+            if info is None:
+                yield {field: columns[INDEXED_FIELDS[field]] for field in fields}
+            else:
+                record = app_fields(columns["name"], info)
+                yield {field: record[field] for field in fields}
+
+    def text():
+        empty = True
+        for record in get_store().query(filters):
+            if empty:
+                yield f"\n{_('installed_apps')}\n" + "-" * 50 + "\n"
+                empty = False
+            app_name, info = record[0]["name"], record[1]
+            yield (f"{_('app')}: {app_name}\n"
+                   f"{_('version')}: {info.get('version') or '-'}\n"
+                   f"{_('location')}: {info.get('path') or '-'}\n" + "-" * 50 + "\n")
+        if empty:
+            yield _("no_installed_apps") + "\n"
+
+    def json_array():
+        separator = "[\n"
+        for record in records():
+            yield separator + json.dumps(record, sort_keys=True)
+            separator = ",\n"
+        yield "[]\n" if separator == "[\n" else "\n]\n"
+
+    if fmt == "text":
+        _write_stream(text())
+    elif fmt == "json":
+        _write_stream(json_array())
+    elif fmt == "jsonl":
+        _write_stream(json.dumps(record, sort_keys=True) + "\n" for record in records())
+    else:
+        from itertools import chain
+        rows = ("\t".join(_tsv_value(record[field]) for field in fields) + "\n" for record in records())
+        _write_stream(chain(["\t".join(fields) + "\n"], rows))
+
+def info_command(app_name, fmt="text"):
+    """Tek bir uygulamanın kaydını, dosyalarını ve sürüm geçmişini yazdırır."""
+    import json
+
+    app_name = slugify(app_name)
+    info = get_store().get(app_name)
+    if info is None:
+        raise ValueError(_("app_not_installed", name=app_name))
+    record = app_fields(app_name, info)
+    entry = appimage_entry(info) or {}
+    record["files"] = info.get("files") or []
+    record["history"] = [dict(item, active=item["sha256"] == entry.get("sha256"))
+                         for item in info.get("history") or ()]
+    if fmt == "json":
+        print(json.dumps(record, indent=2, sort_keys=True))
         return
 
-    print(f"\n{_('installed_apps')}")
+    print(f"\n{_('app')}: {app_name}")
     print("-" * 50)
-    for app_name, info in versions.items():
-        print(f"{_('app')}: {app_name}")
-        print(f"{_('version')}: {info['version']}")
-        print(f"{_('location')}: {info['path']}")
+    for field in LIST_FIELDS[1:]:
+        value = record[field]
+        if isinstance(value, bool):
+            value = _("yes") if value else _("no")
+        elif isinstance(value, list):
+            value = ", ".join(value)
+        print(f"{field:<14}{'-' if value is None or value == '' else value}")
+    print("-" * 50)
+    for item in record["files"]:
+        print(f"{item['type']:<14}{item['path']}")
+    if record["history"]:
         print("-" * 50)
+        for item in record["history"]:
+            print(f"{'*' if item['active'] else ' '} {item['version']:<20} {item['sha256'][:12]}")
+    print("-" * 50)
+
+def cache_command(action, max_size=None):
+    """Metadata önbelleğinin istatistiklerini gösterir ya da önbelleği budar."""
+    cache = get_metadata_cache()
+    if action == "prune":
+        evicted = cache.prune(None if max_size is None else max_size * 1024 * 1024)
+        print(_("cache_pruned", count=evicted))
+        return
+
+    stats = cache.stats()
+    print(f"\n{_('cache_stats')}")
+    print("-" * 50)
+    print(f"{_('cache_location')}: {cache.path}")
+    print(f"{_('cache_entries')}: {stats['entries']}")
+    print(f"{_('cache_size')}: {stats['size'] / 1024 / 1024:.1f} / {stats['max_size'] / 1024 / 1024:.0f} MB")
+    print(f"{_('cache_hits')}: {stats['hits']}")
+    print(f"{_('cache_misses')}: {stats['misses']}")
+    print(f"{_('cache_evictions')}: {stats['evictions']}")
+    print(f"{_('cache_hit_rate')}: {stats['hit_rate'] * 100:.1f}%")
+    print("-" * 50)
+
+def launch_cache_command(action, max_size=None):
+    """Başlatma önbelleğinin istatistiklerini gösterir ya da önbelleği budar.
+
+    Budama önce hiçbir kaydın kullanmadığı dizinleri, ardından boyut sınırı
+    aşılıyorsa en uzun süre kullanılmayanları siler.
+    """
+    cache = get_launch_cache()
+    if action == "prune":
+        referenced = referenced_objects(load_versions(), launch_cache=True)
+        evicted = cache.prune(None if max_size is None else max_size * 1024 * 1024, referenced)
+        print(_("cache_pruned", count=len(evicted)))
+        return
+
+    stats = cache.stats()
+    print(f"\n{_('launch_cache_stats')}")
+    print("-" * 50)
+    print(f"{_('cache_location')}: {cache.root}")
+    print(f"{_('cache_entries')}: {stats['entries']}")
+    print(f"{_('cache_size')}: {stats['size'] / 1024 / 1024:.1f} / {stats['max_size'] / 1024 / 1024:.0f} MB")
 
 def report_missing_translations():
     """Reports missing translations by comparing with English."""
-    en_data = load_language("en")
+    en_data = read_language("en")
     if not en_data:
         print(_("error", message="Could not load English translations"))
         return
 
-    for lang in ["de", "fr", "tr"]:
-        lang_data = load_language(lang)
+    for lang in LANGUAGES[1:]:
+        lang_data = read_language(lang)
         if not lang_data:
             print(f"Missing translations for {lang}")
             continue
@@ -450,8 +2171,42 @@ def report_missing_translations():
             for key in sorted(missing):
                 print(f"  {key}: {en_data[key]}")
 
+STARTUP_BUDGET_MS = 60
+
+def startup_bench(runs=10, budget_ms=STARTUP_BUDGET_MS):
+    """`list` komutunun soğuk açılış süresini ölçer ve bütçeyle karşılaştırır.
+
+    Yorumlayıcının kendi açılış süresi ayrıca ölçülüp çıkarılır; böylece
+    bütçe yalnızca bu paketin getirdiği ek yükü kapsar. Bütçe aşılırsa
+    False döndürür.
+    """
+    import statistics
+    import subprocess
+    import time
+
+    def measure(code):
+        timings = []
+        for _run in range(runs):
+            start = time.perf_counter()
+            subprocess.run([sys.executable, "-c", code], check=True,
+                           stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+            timings.append((time.perf_counter() - start) * 1000)
+        return statistics.median(timings)
+
+    baseline = measure("pass")
+    total = measure("import sys; sys.argv = ['appimage-installer', 'list']; "
+                    "import appimage_installer; appimage_installer.main()")
+    overhead = total - baseline
+    print(_("startup_bench_result", total=f"{total:.1f}", baseline=f"{baseline:.1f}",
+            overhead=f"{overhead:.1f}", budget=budget_ms))
+    return overhead <= budget_ms
+
 def main():
-    print(f"\nLinux systems AppImage Installer v{get_version()}.nAltay Kireççi\nopriori\nwww.opriori.com.tr\n")
+    import argparse
+
+    # Başlık standart hataya yazılır; böylece list --format json gibi çıktılar bozulmaz
+    print(f"\nLinux systems AppImage Installer v{get_version()}.nAltay Kireççi\nopriori\nwww.opriori.com.tr\n",
+          file=sys.stderr)
 
     # Check operating system
     if sys.platform != "linux":
@@ -462,18 +2217,23 @@ def main():
     pre_parser = argparse.ArgumentParser(add_help=False)
     pre_parser.add_argument("-L", "--lang", default="en")
     pre_parser.add_argument("-al", "--available-languages", action="store_true")
+    pre_parser.add_argument("--startup-bench", action="store_true")
+    pre_parser.add_argument("--startup-budget", type=float, default=STARTUP_BUDGET_MS)
     args, remaining = pre_parser.parse_known_args()
 
     if args.available_languages:
         print("\nAvailable Languages:")
         print("=" * 50)
-        for lang in ["en", "tr", "de", "fr"]:
+        for lang in LANGUAGES:
             print(f"- {lang}")
         print("=" * 50)
         sys.exit(0)
 
-    # Load language
-    load_language(args.lang)
+    # Select language; translations are loaded on first use
+    set_language(args.lang)
+
+    if args.startup_bench:
+        sys.exit(0 if startup_bench(budget_ms=args.startup_budget) else 1)
 
     # Create main parser
     parser = argparse.ArgumentParser(description="AppImage Installer")
@@ -481,9 +2241,41 @@ def main():
 
     # Install command
     install_parser = subparsers.add_parser("install", help=_("help_install"))
-    install_parser.add_argument("appimage_path", help="Path to the AppImage file")
+    install_parser.add_argument("appimage_paths", nargs="+", metavar="appimage_path",
+                                help="Path to an AppImage file or a directory of AppImage files")
     install_parser.add_argument("-s", "--sandbox", action="store_true", help=_("help_sandbox"))
     install_parser.add_argument("-c", "--clean", action="store_true", help=_("help_clean"))
+    install_parser.add_argument("-j", "--jobs", type=int, default=None, help=_("help_jobs"))
+    install_parser.add_argument("--check-signature", action="store_true", help=_("help_check_signature"))
+    install_parser.add_argument("--trusted-key", metavar="PATH", help=_("help_trusted_key"))
+    install_parser.add_argument("--launch-cache", dest="launch_cache", action="store_true", default=None,
+                                help=_("help_launch_cache"))
+    install_parser.add_argument("--no-launch-cache", dest="launch_cache", action="store_false",
+                                help=_("help_no_launch_cache"))
+    install_parser.add_argument("--system", action="store_true", default=None, help=_("help_system"))
+    install_parser.add_argument("--no-system", dest="system", action="store_false",
+                                help=_("help_no_system"))
+    install_parser.add_argument("--system-prefix", default=None, metavar="PREFIX",
+                                help=_("help_system_prefix"))
+
+    # Verify command
+    verify_parser = subparsers.add_parser("verify", help=_("help_verify"))
+    verify_parser.add_argument("appimage_path", help="Path to the AppImage file")
+    verify_parser.add_argument("--check-signature", action="store_true", help=_("help_check_signature"))
+    verify_parser.add_argument("--trusted-key", metavar="PATH", help=_("help_trusted_key"))
+
+    # Update command
+    update_parser = subparsers.add_parser("update", help=_("help_update"))
+    update_parser.add_argument("app_names", nargs="*", metavar="app_name", help=_("help_update_apps"))
+
+    # Apply command
+    apply_parser = subparsers.add_parser("apply", help=_("help_apply"))
+    apply_parser.add_argument("manifest", help=_("help_apply_manifest"))
+    apply_parser.add_argument("-n", "--dry-run", action="store_true", help=_("help_dry_run"))
+    apply_parser.add_argument("--prune", action="store_true", help=_("help_prune"))
+    apply_parser.add_argument("-j", "--jobs", type=int, default=None, help=_("help_jobs"))
+    apply_parser.add_argument("--check-signature", action="store_true", help=_("help_check_signature"))
+    apply_parser.add_argument("--trusted-key", metavar="PATH", help=_("help_trusted_key"))
 
     # Uninstall command
     uninstall_parser = subparsers.add_parser("uninstall", help=_("help_uninstall"))
@@ -491,28 +2283,206 @@ def main():
 
     # List command
     list_parser = subparsers.add_parser("list", help=_("help_list"))
+    list_parser.add_argument("--format", choices=LIST_FORMATS, default="text", help=_("help_list_format"))
+    list_parser.add_argument("--filter", action="append", default=[], metavar="FIELD=GLOB",
+                             dest="filters", help=_("help_list_filter"))
+    list_parser.add_argument("--fields", type=lambda value: [f for f in value.split(",") if f],
+                             default=None, metavar="FIELD,...", help=_("help_list_fields"))
+
+    # Info command
+    info_parser = subparsers.add_parser("info", help=_("help_info"))
+    info_parser.add_argument("app_name", help="Name of the application")
+    info_parser.add_argument("--format", choices=("text", "json"), default="text", help=_("help_list_format"))
+
+    # Cache command
+    cache_parser = subparsers.add_parser("cache", help=_("help_cache"))
+    cache_parser.add_argument("action", choices=["stats", "prune"], help=_("help_cache_action"))
+    cache_parser.add_argument("--max-size", type=int, default=None, metavar="MB",
+                              help=_("help_cache_max_size"))
+
+    # Launch cache command
+    launch_cache_parser = subparsers.add_parser("launch-cache", help=_("help_launch_cache_command"))
+    launch_cache_parser.add_argument("action", choices=["stats", "prune"], help=_("help_cache_action"))
+    launch_cache_parser.add_argument("--max-size", type=int, default=None, metavar="MB",
+                                     help=_("help_cache_max_size"))
+
+    # Rebuild desktop database command
+    subparsers.add_parser("rebuild-desktop-db", help=_("help_rebuild_desktop_db"))
+
+    # Rollback and activate commands
+    rollback_parser = subparsers.add_parser("rollback", help=_("help_rollback"))
+    rollback_parser.add_argument("app_name", help="Name of the application")
+    activate_parser = subparsers.add_parser("activate", help=_("help_activate"))
+    activate_parser.add_argument("app_name", help="Name of the application")
+    activate_parser.add_argument("app_version", nargs="?", metavar="version", help=_("help_activate_version"))
+
+    # Garbage collection command
+    gc_parser = subparsers.add_parser("gc", help=_("help_gc"))
+    gc_parser.add_argument("--keep", type=int, default=KEEP_VERSIONS, metavar="N", help=_("help_gc_keep"))
+    gc_parser.add_argument("-n", "--dry-run", action="store_true", help=_("help_dry_run"))
+    gc_parser.add_argument("--system", action="store_true", default=None, help=_("help_gc_system"))
+    gc_parser.add_argument("--system-prefix", default=None, metavar="PREFIX", help=_("help_system_prefix"))
+
+    # Sync and doctor commands
+    subparsers.add_parser("sync", help=_("help_sync"))
+    subparsers.add_parser("doctor", help=_("help_doctor"))
+
+    # Watch command
+    watch_parser = subparsers.add_parser("watch", help=_("help_watch"))
+    watch_parser.add_argument("folders", nargs="*", metavar="folder",
+                              default=[os.path.join(HOME, "Applications")], help=_("help_watch_folders"))
+    watch_parser.add_argument("-s", "--sandbox", action="store_true", help=_("help_sandbox"))
+    watch_parser.add_argument("-j", "--jobs", type=int, default=None, help=_("help_jobs"))
+    watch_parser.add_argument("--debounce", type=float, default=WATCH_DEBOUNCE, metavar="SECONDS",
+                              help=_("help_debounce"))
+    watch_parser.add_argument("--no-initial-scan", action="store_true", help=_("help_no_initial_scan"))
+    watch_parser.add_argument("--system", action="store_true", default=None, help=_("help_system"))
+    watch_parser.add_argument("--system-prefix", default=None, metavar="PREFIX",
+                              help=_("help_system_prefix"))
 
     # Common arguments
     parser.add_argument("-L", "--lang", help=_("help_lang"), default="en")
     parser.add_argument("-v", "--version", action="store_true", help=_("help_version"))
     parser.add_argument("--report-translations", action="store_true", help=_("help_report_translations"))
+    parser.add_argument("--timings", action="store_true", help=_("help_timings"))
+    parser.add_argument("--extract-dir", default=None, metavar="DIR", help=_("help_extract_dir"))
+    parser.add_argument("--extract-include", action="append", default=None, metavar="PATTERN",
+                        help=_("help_extract_include"))
+    parser.add_argument("--timings-json", nargs="?", const="-", default=None, metavar="FILE",
+                        help=_("help_timings_json"))
+    parser.add_argument("--profile", default=None, metavar="FILE", help=_("help_profile"))
+    parser.add_argument("--startup-bench", action="store_true", help=_("help_startup_bench"))
+    parser.add_argument("--startup-budget", type=float, default=STARTUP_BUDGET_MS, metavar="MS",
+                        help=_("help_startup_budget"))
 
     args = parser.parse_args()
 
+    # Paralel hazırlayan alt süreçler de aynı ayarları görsün diye ortama yazılır
+    if args.extract_dir:
+        os.environ["APPIMAGE_INSTALLER_EXTRACT_DIR"] = os.path.abspath(args.extract_dir)
+    if args.extract_include:
+        os.environ["APPIMAGE_INSTALLER_EXTRACT_INCLUDE"] = ":".join(args.extract_include)
+
+    if args.timings or args.timings_json:
+        timings.enable()
+
+    profiler = None
+    if args.profile:
+        import cProfile
+        profiler = cProfile.Profile()
+        profiler.enable()
+
+    try:
+        run_command(args, parser)
+    finally:
+        if profiler:
+            profiler.disable()
+            profiler.dump_stats(args.profile)
+            print(_("profile_written", path=args.profile), file=sys.stderr)
+        if args.timings:
+            print_timings()
+        if args.timings_json:
+            write_timings_json(args.timings_json)
+
+def print_timings():
+    """Aşama ölçümlerini tablo olarak standart hata akışına yazar."""
+    rows = timings.summary()
+    if not rows:
+        return
+    out = sys.stderr
+    print(f"\n{_('timings_header')}", file=out)
+    print(f"{'stage':<16}{'count':>6}{'wall ms':>12}{'read KiB':>12}{'write KiB':>12}{'peak RSS KiB':>14}",
+          file=out)
+    print("-" * 72, file=out)
+    for stage, count, wall, read, written, rss in rows:
+        print(f"{stage:<16}{count:>6}{wall:>12.1f}{read / 1024:>12.1f}{written / 1024:>12.1f}{rss:>14}",
+              file=out)
+
+def write_timings_json(path):
+    """Aşama ölçümlerini JSON satırları olarak dosyaya ya da standart çıktıya yazar."""
+    import json
+
+    lines = "".join(json.dumps(record, sort_keys=True) + "\n" for record in timings.records)
+    if path == "-":
+        sys.stdout.write(lines)
+    else:
+        with open(path, "a") as f:
+            f.write(lines)
+
+def signature_check(args):
+    """--check-signature ve --trusted-key seçeneklerinden imza denetimini çıkarır.
+
+    --trusted-key verildiyse anahtar dosyasının yolu, yalnızca
+    --check-signature verildiyse True (kendinden imzalı denetim) döner.
+    """
+    return args.trusted_key or args.check_signature
+
+def system_prefix(args):
+    """--system ve --system-prefix seçeneklerinden sistem deposu önekini çıkarır.
+
+    Seçenek verilmediyse None, --no-system ile False döner; --system-prefix
+    tek başına da sistem deposunu seçer.
+    """
+    if args.system is False:
+        return False
+    if args.system or args.system_prefix:
+        return args.system_prefix or SYSTEM_PREFIX
+    return None
+
+def run_command(args, parser):
+    """Ayrıştırılmış komut satırı argümanlarına göre ilgili komutu çalıştırır."""
     try:
         if args.version:
             print(_("version_info", version=get_version()))
             return
 
         if args.command == "install":
-            install_appimage(args.appimage_path, not args.sandbox)
-            if args.clean and os.path.exists(args.appimage_path):
-                os.remove(args.appimage_path)
-                print(_("original_deleted", path=args.appimage_path))
+            installed, failed = install_many(collect_appimages(args.appimage_paths),
+                                             not args.sandbox, args.jobs, args.clean,
+                                             signature_check(args), args.launch_cache, system_prefix(args))
+            for path, message in failed:
+                print(_("install_failed", path=path, message=message))
+            if failed or not installed:
+                sys.exit(1)
+        elif args.command == "apply":
+            failed = apply_manifest(args.manifest, args.dry_run, args.prune, args.jobs,
+                                    signature_check(args))
+            for name, message in failed:
+                print(_("install_failed", path=name, message=message))
+            if failed:
+                sys.exit(1)
+        elif args.command == "update":
+            if update_command(args.app_names):
+                sys.exit(1)
+        elif args.command == "verify":
+            verify_command(args.appimage_path, signature_check(args))
         elif args.command == "uninstall":
             uninstall_app(args.app_name)
         elif args.command == "list":
-            list_installed_apps()
+            list_installed_apps(args.format, args.filters, args.fields)
+        elif args.command == "info":
+            info_command(args.app_name, args.format)
+        elif args.command == "cache":
+            cache_command(args.action, args.max_size)
+        elif args.command == "launch-cache":
+            launch_cache_command(args.action, args.max_size)
+        elif args.command == "rebuild-desktop-db":
+            rebuild_desktop_database()
+        elif args.command == "rollback":
+            activate_version(args.app_name)
+        elif args.command == "activate":
+            if args.app_version is None:
+                list_versions(args.app_name)
+            else:
+                activate_version(args.app_name, args.app_version)
+        elif args.command == "gc":
+            gc_command(args.keep, args.dry_run, system_prefix(args))
+        elif args.command in ("sync", "doctor"):
+            if sync_command(repair=args.command == "sync"):
+                sys.exit(1)
+        elif args.command == "watch":
+            watch_folders(args.folders, not args.sandbox, args.jobs, args.debounce,
+                          not args.no_initial_scan, system_prefix(args))
         elif args.report_translations:
             report_missing_translations()
         else:
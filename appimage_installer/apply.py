@@ -0,0 +1,208 @@
+"""İstenen durumu tanımlayan kurulum manifesti ve plan hesabı.
+
+Manifest TOML biçimindedir::
+
+    prune = false                 # manifestte olmayan uygulamaları kaldır
+
+    [apps.firefox]
+    source = "/srv/appimages/Firefox.AppImage"
+    sha256 = "3b1f..."            # isteğe bağlı
+    sandbox = true                # varsayılan: true
+    state = "present"             # ya da "absent"
+
+Plan yalnızca kayıtlar ve dosya özetleri karşılaştırılarak çıkarılır;
+değişmemiş uygulamalar için hiçbir AppImage açılmaz. Kaynak dosyanın özeti
+depodaki (cihaz, inode, boyut, mtime) önbelleğinden okunduğundan yakınsamış
+bir makinede plan birkaç stat çağrısına mal olur.
+"""
+import os
+import re
+
+INSTALL = "install"
+UPGRADE = "upgrade"
+REMOVE = "remove"
+UNCHANGED = "unchanged"
+ERROR = "error"
+
+STATES = ("present", "absent")
+
+
+class ManifestError(ValueError):
+    """Okunamayan ya da geçersiz manifestler için hata."""
+
+
+class Action:
+    """Plandaki tek bir adım."""
+    __slots__ = ("kind", "name", "source", "sandbox", "sha256", "reason")
+
+    def __init__(self, kind, name, source=None, sandbox=True, sha256=None, reason=None):
+        self.kind = kind
+        self.name = name
+        self.source = source
+        self.sandbox = sandbox
+        self.sha256 = sha256
+        self.reason = reason
+
+
+def _toml():
+    try:
+        import tomllib
+    except ImportError:
+        try:
+            import tomli as tomllib
+        except ImportError:
+            raise ManifestError("reading manifests requires Python 3.11 or the tomli package")
+    return tomllib
+
+
+def load_manifest(path, slugify):
+    """Manifesti okur; ({uygulama: tanım}, prune) döndürür.
+
+    Göreli kaynak yolları manifestin bulunduğu dizine göre çözülür. Aynı
+    kaynak dosyayı ya da aynı uygulama adını kullanan iki girdi hata sayılır.
+    """
+    tomllib = _toml()
+    try:
+        with open(path, "rb") as f:
+            document = tomllib.load(f)
+    except tomllib.TOMLDecodeError as e:
+        raise ManifestError(f"{path}: {e}")
+
+    prune = document.get("prune", False)
+    if not isinstance(prune, bool):
+        raise ManifestError(f"{path}: prune must be true or false")
+    base = os.path.dirname(os.path.abspath(path))
+    apps = {}
+    sources = {}
+    for label, spec in (document.get("apps") or {}).items():
+        if not isinstance(spec, dict):
+            raise ManifestError(f"{path}: [apps.{label}] must be a table")
+        state = spec.get("state", "present")
+        if state not in STATES:
+            raise ManifestError(f"{path}: [apps.{label}] state must be one of {', '.join(STATES)}")
+        source = spec.get("source")
+        if state == "present" and not isinstance(source, str):
+            raise ManifestError(f"{path}: [apps.{label}] needs a source path")
+        sha256 = spec.get("sha256")
+        if sha256 is not None and (not isinstance(sha256, str)
+                                   or not re.fullmatch("[0-9a-f]{64}", sha256.lower())):
+            raise ManifestError(f"{path}: [apps.{label}] sha256 must be a 64 character hex digest")
+        sandbox = spec.get("sandbox", True)
+        if not isinstance(sandbox, bool):
+            raise ManifestError(f"{path}: [apps.{label}] sandbox must be true or false")
+        name = slugify(label)
+        if name in apps:
+            raise ManifestError(f"{path}: [apps.{label}] names the same application as another entry")
+        if source:
+            source = os.path.join(base, os.path.expanduser(source))
+            key = os.path.realpath(source)
+            if state == "present" and key in sources:
+                raise ManifestError(f"{path}: [apps.{label}] and [apps.{sources[key]}] use the same source")
+            if state == "present":
+                sources[key] = label
+        apps[name] = {
+            "source": source or None,
+            "sha256": sha256.lower() if sha256 else None,
+            "sandbox": sandbox,
+            "state": state
+        }
+    return apps, prune
+
+
+def _installed(info):
+    """Kayıttaki AppImage manifest girdisini döndürür; yoksa None."""
+    for entry in info.get("files") or ():
+        if entry.get("type") == "AppImage":
+            return entry
+    return None
+
+
+def _intact(entry):
+    """Kurulu AppImage yerinde ve boyutu değişmemişse True."""
+    try:
+        return os.stat(entry["path"]).st_size == entry["size"]
+    except OSError:
+        return False
+
+
+def plan(apps, versions, digest, prune=False, derived_name=None):
+    """Manifesti kayıtlarla karşılaştırıp adımların listesini döndürür.
+
+    digest, bir dosya yolu için SHA-256 özetini döndüren fonksiyondur.
+    derived_name verilirse bir özet için masaüstü girdisinden türetilecek
+    kayıt adını (bilinmiyorsa None) döndürür. Manifestteki adla kayıt
+    bulunamazsa kayıt sırasıyla özet, kaynak yolu ve türetilen adla aranır;
+    böylece aynı uygulama hem kurulup hem budanmaz.
+    """
+    actions = []
+    # Manifestteki ad ile masaüstü girdisinden türetilen ad farklı olabilir
+    by_hash, by_source = {}, {}
+    for name, info in versions.items():
+        entry = _installed(info)
+        if entry and entry.get("sha256"):
+            by_hash.setdefault((entry["sha256"], info.get("sandbox", True)), name)
+        if info.get("path"):
+            by_source.setdefault(os.path.realpath(info["path"]), name)
+    claimed = set()
+
+    for name, spec in sorted(apps.items()):
+        info = versions.get(name)
+        if spec["state"] == "absent":
+            if info is not None:
+                actions.append(Action(REMOVE, name))
+            claimed.add(name)
+            continue
+
+        source = spec["source"]
+        sha256 = digest(source) if os.path.isfile(source) else None
+        if spec["sha256"] and sha256 and sha256 != spec["sha256"]:
+            actions.append(Action(ERROR, name, source, reason="hash_mismatch"))
+            claimed.add(name)
+            continue
+        wanted = spec["sha256"] or sha256
+
+        if info is None:
+            alias = by_hash.get((wanted, spec["sandbox"])) if wanted else None
+            if alias is None:
+                alias = by_source.get(os.path.realpath(source))
+            if alias is None and wanted and derived_name is not None:
+                alias = derived_name(wanted)
+            if alias is not None and alias in versions:
+                info, name = versions[alias], alias
+        claimed.add(name)
+
+        entry = _installed(info) if info is not None else None
+        if info is not None and wanted is None:
+            # Kaynak silinmiş ve beklenen özet verilmemiş; kurulu olanı koru
+            actions.append(Action(UNCHANGED, name, source, spec["sandbox"]))
+            continue
+        if wanted is None:
+            actions.append(Action(ERROR, name, source, reason="source_missing"))
+            continue
+
+        if info is None:
+            kind, reason = INSTALL, None
+        elif entry is None or entry.get("sha256") != wanted:
+            kind, reason = UPGRADE, "hash"
+        elif info.get("sandbox", True) != spec["sandbox"]:
+            kind, reason = UPGRADE, "sandbox"
+        elif not _intact(entry):
+            kind, reason = UPGRADE, "modified"
+        else:
+            actions.append(Action(UNCHANGED, name, source, spec["sandbox"], wanted))
+            continue
+        if sha256 is None:
+            actions.append(Action(ERROR, name, source, reason="source_missing"))
+            continue
+        actions.append(Action(kind, name, source, spec["sandbox"], wanted, reason))
+
+    if prune:
+        for name in versions:
+            if name not in claimed:
+                actions.append(Action(REMOVE, name))
+
+    changed = {action.name for action in actions if action.kind in (INSTALL, UPGRADE)}
+    conflict = changed & {action.name for action in actions if action.kind == REMOVE}
+    if conflict:
+        raise ManifestError(f"plan both installs and removes {', '.join(sorted(conflict))}")
+    return actions
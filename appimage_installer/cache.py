@@ -0,0 +1,154 @@
+"""AppImage içerik özetine göre anahtarlanan metadata önbelleği.
+
+Ayrıştırılmış masaüstü girdisi, ikon içeriği ve çalıştırıcı türü saklanır;
+böylece bilinen bir imaj için yapılan her işlem çıkarma adımını atlar.
+Önbellek boyutu sınırlıdır ve en uzun süre kullanılmayan kayıtlar atılır.
+"""
+import json
+import os
+import sqlite3
+import time
+from contextlib import contextmanager
+
+DEFAULT_MAX_BYTES = 64 * 1024 * 1024
+LOCK_TIMEOUT = 30  # saniye
+
+SCHEMA = (
+    """CREATE TABLE IF NOT EXISTS entries (
+        sha256 TEXT PRIMARY KEY,
+        data TEXT NOT NULL,
+        icon BLOB,
+        icon_ext TEXT,
+        runtime TEXT,
+        size INTEGER NOT NULL,
+        last_used REAL NOT NULL
+    )""",
+    "CREATE INDEX IF NOT EXISTS entries_last_used ON entries (last_used)",
+    """CREATE TABLE IF NOT EXISTS counters (
+        name TEXT PRIMARY KEY,
+        value INTEGER NOT NULL
+    )""",
+)
+
+
+class MetadataCache:
+    """Kalıcı, boyutu sınırlı (LRU) metadata önbelleği."""
+
+    def __init__(self, directory, max_bytes=DEFAULT_MAX_BYTES):
+        self.directory = directory
+        self.path = os.path.join(directory, "metadata.db")
+        self.max_bytes = max_bytes
+        self._conn = None
+
+    def _connect(self):
+        if self._conn is None:
+            os.makedirs(self.directory, mode=0o700, exist_ok=True)
+            conn = sqlite3.connect(self.path, timeout=LOCK_TIMEOUT, isolation_level=None)
+            os.chmod(self.path, 0o600)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            for statement in SCHEMA:
+                conn.execute(statement)
+            self._conn = conn
+        return self._conn
+
+    def close(self):
+        if self._conn is not None:
+            self._conn.close()
+            self._conn = None
+
+    @contextmanager
+    def _transaction(self):
+        conn = self._connect()
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            yield conn
+        except BaseException:
+            conn.execute("ROLLBACK")
+            raise
+        conn.execute("COMMIT")
+
+    @staticmethod
+    def _count(conn, name):
+        conn.execute("INSERT INTO counters (name, value) VALUES (?, 1) "
+                     "ON CONFLICT (name) DO UPDATE SET value = value + 1", (name,))
+
+    def get(self, sha256):
+        """Kayıtlı metadatayı döndürür; yoksa None.
+
+        Dönen sözlük "data", "icon" ((içerik, uzantı) ya da None) ve
+        "runtime" alanlarını içerir.
+        """
+        with self._transaction() as conn:
+            row = conn.execute("SELECT data, icon, icon_ext, runtime FROM entries WHERE sha256 = ?",
+                               (sha256,)).fetchone()
+            if row is None:
+                self._count(conn, "misses")
+                return None
+            conn.execute("UPDATE entries SET last_used = ? WHERE sha256 = ?", (time.time(), sha256))
+            self._count(conn, "hits")
+        data, icon, icon_ext, runtime = row
+        return {
+            "data": json.loads(data),
+            "icon": (bytes(icon), icon_ext) if icon is not None else None,
+            "runtime": runtime
+        }
+
+    def put(self, sha256, data, icon=None, runtime=None):
+        """Bir imajın metadatasını kaydeder ve gerekirse eski kayıtları atar."""
+        encoded = json.dumps(data, sort_keys=True)
+        icon_data, icon_ext = icon if icon else (None, None)
+        size = len(encoded) + len(icon_data or b"")
+        if size > self.max_bytes:
+            return
+        with self._transaction() as conn:
+            conn.execute(
+                "INSERT OR REPLACE INTO entries (sha256, data, icon, icon_ext, runtime, size, last_used) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?)",
+                (sha256, encoded, icon_data, icon_ext, runtime, size, time.time()))
+            self._evict(conn, self.max_bytes)
+
+    def _evict(self, conn, max_bytes):
+        """Toplam boyut sınırın altına inene kadar en eski kayıtları siler."""
+        total = conn.execute("SELECT COALESCE(SUM(size), 0) FROM entries").fetchone()[0]
+        evicted = 0
+        if total <= max_bytes:
+            return evicted
+        for sha256, size in conn.execute(
+                "SELECT sha256, size FROM entries ORDER BY last_used").fetchall():
+            if total <= max_bytes:
+                break
+            conn.execute("DELETE FROM entries WHERE sha256 = ?", (sha256,))
+            total -= size
+            evicted += 1
+        if evicted:
+            conn.execute("INSERT INTO counters (name, value) VALUES ('evictions', ?) "
+                         "ON CONFLICT (name) DO UPDATE SET value = value + ?", (evicted, evicted))
+        return evicted
+
+    def prune(self, max_bytes=None):
+        """Önbelleği verilen boyuta (varsayılan: yapılandırılmış sınır) indirir.
+
+        Silinen kayıt sayısını döndürür.
+        """
+        with self._transaction() as conn:
+            evicted = self._evict(conn, self.max_bytes if max_bytes is None else max_bytes)
+        if max_bytes == 0:
+            self._connect().execute("VACUUM")
+        return evicted
+
+    def stats(self):
+        """Kayıt sayısı, toplam boyut ve isabet istatistiklerini döndürür."""
+        conn = self._connect()
+        entries, size = conn.execute("SELECT COUNT(*), COALESCE(SUM(size), 0) FROM entries").fetchone()
+        counters = dict(conn.execute("SELECT name, value FROM counters"))
+        hits, misses = counters.get("hits", 0), counters.get("misses", 0)
+        return {
+            "entries": entries,
+            "size": size,
+            "max_size": self.max_bytes,
+            "hits": hits,
+            "misses": misses,
+            "evictions": counters.get("evictions", 0),
+            "hit_rate": hits / (hits + misses) if hits + misses else 0.0
+        }
@@ -0,0 +1,194 @@
+"""AppImage dosyaları için yalnızca başlığı okuyan doğrulayıcı.
+
+ELF sihirli sayısı, 8. bayttaki AppImage türü (AI\\x01 / AI\\x02) ve ELF
+bölüm tablosu birkaç pread çağrısıyla okunur; dosyanın geri kalanına
+dokunulmaz. Gömülü güncelleme bilgisi (.upd_info), imza (.sha256_sig),
+imza anahtarı (.sig_key) ve MD5 özeti (.digest_md5) bölümleri bulunur.
+Özet ve imza denetimi isteğe bağlıdır ve dosyayı akış hâlinde okur.
+"""
+import hashlib
+import os
+import struct
+
+ELF_MAGIC = b"\x7fELF"
+APPIMAGE_MAGIC = b"AI"
+SHT_NOBITS = 8
+MAX_SECTIONS = 4096
+
+UPDATE_INFO_SECTION = ".upd_info"
+SIGNATURE_SECTION = ".sha256_sig"
+SIGNATURE_KEY_SECTION = ".sig_key"
+DIGEST_SECTION = ".digest_md5"
+
+# Özet ve imza hesaplanırken sıfır kabul edilen bölümler
+SIGNATURE_SKIP = (SIGNATURE_SECTION, SIGNATURE_KEY_SECTION)
+DIGEST_SKIP = (DIGEST_SECTION,) + SIGNATURE_SKIP
+
+
+class ELFError(ValueError):
+    """Geçerli bir ELF/AppImage başlığı taşımayan dosyalar için hata."""
+
+
+class Header:
+    """Ayrıştırılmış AppImage başlığı."""
+    __slots__ = ("type", "elf_class", "endian", "size", "payload_offset", "sections")
+
+    def __init__(self, type, elf_class, endian, size, payload_offset, sections):
+        self.type = type
+        self.elf_class = elf_class
+        self.endian = endian
+        self.size = size
+        self.payload_offset = payload_offset
+        self.sections = sections
+
+    def section(self, name):
+        """Bölümün (ofset, boyut) çiftini döndürür; yoksa None."""
+        return self.sections.get(name)
+
+
+def read_header(fd):
+    """Açık bir dosyanın ELF ve AppImage başlığını ayrıştırır.
+
+    Yalnızca ELF başlığı, bölüm tablosu ve bölüm adları okunur.
+    """
+    size = os.fstat(fd).st_size
+    ident = os.pread(fd, 64, 0)
+    if len(ident) < 16 or ident[:4] != ELF_MAGIC:
+        raise ELFError("missing ELF magic")
+    if ident[8:10] != APPIMAGE_MAGIC or ident[10] not in (1, 2):
+        raise ELFError("missing AppImage magic")
+    if ident[5] not in (1, 2):
+        raise ELFError("unknown ELF byte order")
+    endian = "<" if ident[5] == 1 else ">"
+
+    if ident[4] == 2:
+        if len(ident) < 64:
+            raise ELFError("truncated ELF header")
+        shoff, = struct.unpack_from(endian + "Q", ident, 0x28)
+        shentsize, shnum, shstrndx = struct.unpack_from(endian + "HHH", ident, 0x3A)
+        entry_format, min_entsize = endian + "IIQQQQ", 0x28
+    elif ident[4] == 1:
+        if len(ident) < 52:
+            raise ELFError("truncated ELF header")
+        shoff, = struct.unpack_from(endian + "I", ident, 0x20)
+        shentsize, shnum, shstrndx = struct.unpack_from(endian + "HHH", ident, 0x2E)
+        entry_format, min_entsize = endian + "IIIIII", 0x18
+    else:
+        raise ELFError("unknown ELF class")
+
+    table_end = shoff + shentsize * shnum
+    if shnum and (shentsize < min_entsize or shnum > MAX_SECTIONS or table_end > size
+                  or shstrndx >= shnum):
+        raise ELFError("invalid ELF section table")
+
+    table = os.pread(fd, shentsize * shnum, shoff)
+    entries = []
+    for i in range(shnum):
+        name, type_, _flags, _addr, offset, length = struct.unpack_from(
+            entry_format, table, i * shentsize)
+        if type_ != SHT_NOBITS and offset + length > size:
+            raise ELFError("ELF section outside of file")
+        entries.append((name, type_, offset, length))
+
+    sections = {}
+    if shnum:
+        _name, _type, strtab_offset, strtab_length = entries[shstrndx]
+        strtab = os.pread(fd, strtab_length, strtab_offset)
+        for name, type_, offset, length in entries:
+            if type_ == SHT_NOBITS:
+                continue
+            end = strtab.find(b"\0", name)
+            label = strtab[name:end if end >= 0 else None].decode("ascii", "replace")
+            sections[label] = (offset, length)
+
+    return Header(ident[10], 64 if ident[4] == 2 else 32, endian, size, table_end, sections)
+
+
+def read_section(fd, header, name):
+    """Bölüm içeriğini sondaki NUL baytları atılmış olarak döndürür; yoksa None."""
+    location = header.section(name)
+    if location is None:
+        return None
+    offset, length = location
+    return os.pread(fd, length, offset).rstrip(b"\0")
+
+
+def digest(fd, header, algorithm, skip=(), chunk_size=1024 * 1024):
+    """Dosyanın özetini, skip içindeki bölümleri sıfır sayarak akış hâlinde hesaplar."""
+    ranges = [header.section(name) for name in skip if header.section(name)]
+    h = hashlib.new(algorithm)
+    buffer = bytearray(chunk_size)
+    view = memoryview(buffer)
+    position = 0
+    while position < header.size:
+        n = os.preadv(fd, [buffer], position)
+        if not n:
+            break
+        chunk = view[:n]
+        for offset, length in ranges:
+            start, end = max(offset, position), min(offset + length, position + n)
+            if start < end:
+                chunk[start - position:end - position] = bytes(end - start)
+        h.update(chunk)
+        position += n
+    return h.hexdigest()
+
+
+def verify_digest(fd, header):
+    """Gömülü .digest_md5 özetini denetler.
+
+    Özet bölümü yoksa ya da boşsa None, eşleşiyorsa True, eşleşmiyorsa
+    False döndürür.
+    """
+    location = header.section(DIGEST_SECTION)
+    if location is None:
+        return None
+    expected = os.pread(fd, location[1], location[0])
+    if not expected.strip(b"\0"):
+        return None
+    return digest(fd, header, "md5", DIGEST_SKIP) == expected[:16].hex()
+
+
+def verify_signature(fd, header, key=None):
+    """Gömülü GPG imzasını doğrular.
+
+    İmza SHA-256 özetinin onaltılık gösterimi üzerinedir; özet .sha256_sig
+    ve .sig_key bölümleri sıfır sayılarak hesaplanır. key verilmezse imza
+    dosyanın kendi gömülü anahtarıyla denetlenir; bu yalnızca dosyanın
+    imzalandıktan sonra değişmediğini gösterir, kimin imzaladığını değil.
+    key verilirse gömülü anahtar yok sayılır ve yalnızca bu anahtarla
+    (ASCII ya da ikili anahtarlık) doğrulanır. İmza yoksa None, geçerliyse
+    True, geçersizse False döndürür. gpg bulunamazsa FileNotFoundError
+    yükseltilir.
+    """
+    import shutil
+    import subprocess
+    import tempfile
+
+    signature = read_section(fd, header, SIGNATURE_SECTION)
+    if not signature:
+        return None
+    if key is None:
+        key = read_section(fd, header, SIGNATURE_KEY_SECTION)
+    gpg = shutil.which("gpg") or shutil.which("gpg2")
+    if gpg is None:
+        raise FileNotFoundError("gpg")
+
+    temp_dir = tempfile.mkdtemp()
+    try:
+        os.chmod(temp_dir, 0o700)
+        env = dict(os.environ, GNUPGHOME=temp_dir)
+        if key:
+            subprocess.run([gpg, "--batch", "--quiet", "--import"], input=key, env=env,
+                           stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL, check=False)
+        data_path = os.path.join(temp_dir, "digest")
+        signature_path = os.path.join(temp_dir, "digest.sig")
+        with open(data_path, "w") as f:
+            f.write(digest(fd, header, "sha256", SIGNATURE_SKIP))
+        with open(signature_path, "wb") as f:
+            f.write(signature)
+        result = subprocess.run([gpg, "--batch", "--verify", signature_path, data_path], env=env,
+                                stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+        return result.returncode == 0
+    finally:
+        shutil.rmtree(temp_dir, ignore_errors=True)
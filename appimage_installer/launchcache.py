@@ -0,0 +1,146 @@
+"""Önceden çıkarılmış AppImage'lardan oluşan başlatma önbelleği.
+
+Her imaj SHA-256 özetiyle adlandırılan bir dizine bir kez çıkarılır;
+uygulama her açılışta FUSE ile bağlanmak ya da APPIMAGE_EXTRACT_AND_RUN ile
+yeniden çıkarılmak yerine buradaki AppRun'dan başlatılır. Başlatıcı betik
+her çalışmada dizinin mtime'ını güncellediğinden en uzun süre kullanılmayan
+dizinler boyut sınırı aşıldığında silinir. Silinen ya da henüz çıkarılmamış
+bir sürüm için başlatıcı AppImage'ın kendisini çalıştırır.
+"""
+import os
+import re
+import shlex
+import shutil
+
+DEFAULT_MAX_BYTES = 2048 * 1024 * 1024
+ENTRY_NAME = re.compile(r"[0-9a-f]{64}$")
+
+LAUNCHER = """#!/bin/sh
+# appimage-installer başlatma önbelleği: {name}
+APPIMAGE={appimage}
+APPDIR={root}/$(basename "$(readlink "$APPIMAGE")")
+if [ -x "$APPDIR/AppRun" ]; then
+    touch -c "$APPDIR" 2>/dev/null
+    ARGV0="$APPIMAGE"
+    OWD="$PWD"
+    export APPIMAGE APPDIR ARGV0 OWD
+    exec "$APPDIR/AppRun" "$@"
+fi
+exec "$APPIMAGE" "$@"
+"""
+
+
+class LaunchCache:
+    """Özet başına bir dizin tutan, boyutu sınırlı (LRU) çıkarma önbelleği."""
+
+    def __init__(self, root, max_bytes=DEFAULT_MAX_BYTES):
+        self.root = root
+        self.max_bytes = max_bytes
+
+    def path(self, sha256):
+        return os.path.join(self.root, sha256)
+
+    def _size_file(self, sha256):
+        return os.path.join(self.root, f".{sha256}.size")
+
+    def contains(self, sha256):
+        return os.access(os.path.join(self.path(sha256), "AppRun"), os.X_OK)
+
+    def populate(self, sha256, extract):
+        """Özet için dizin yoksa extract(hedef) ile oluşturur; dizin yolunu döndürür.
+
+        extract çıkarılan bayt sayısını döndürmelidir ve var olmayan bir
+        hedef dizin almalıdır. Çıkarma geçici bir dizinde yapılır ve
+        tamamlanınca yeniden adlandırılır; böylece yarım kalmış bir dizin
+        hiçbir zaman başlatılmaz.
+        """
+        target = self.path(sha256)
+        if self.contains(sha256):
+            os.utime(target)
+            return target
+        from . import scratch
+
+        # Öldürülen bir çıkarmadan kalan yarım dizinleri sil
+        scratch.clean_stale(self.root, ".tmp-")
+        temp = scratch.make(self.root, ".tmp-")
+        try:
+            size = extract(os.path.join(temp, "root"))
+            if not os.access(os.path.join(temp, "root", "AppRun"), os.X_OK):
+                raise ValueError("AppRun not found in image")
+            with open(self._size_file(sha256), "w") as f:
+                f.write(str(size))
+            shutil.rmtree(target, ignore_errors=True)
+            os.rename(os.path.join(temp, "root"), target)
+        finally:
+            shutil.rmtree(temp, ignore_errors=True)
+        return target
+
+    def discard(self, sha256):
+        """Özetin dizinini siler; yoksa bir şey yapmaz."""
+        shutil.rmtree(self.path(sha256), ignore_errors=True)
+        try:
+            os.remove(self._size_file(sha256))
+        except FileNotFoundError:
+            pass
+
+    def entries(self):
+        """(özet, bayt, son kullanım) üçlülerini en eski kullanılandan başlayarak döndürür."""
+        try:
+            names = os.listdir(self.root)
+        except FileNotFoundError:
+            return []
+        result = []
+        for name in names:
+            if not ENTRY_NAME.match(name):
+                continue
+            try:
+                last_used = os.stat(self.path(name)).st_mtime
+            except OSError:
+                continue
+            try:
+                with open(self._size_file(name)) as f:
+                    size = int(f.read())
+            except (OSError, ValueError):
+                size = 0
+            result.append((name, size, last_used))
+        result.sort(key=lambda entry: entry[2])
+        return result
+
+    def prune(self, max_bytes=None, referenced=None, keep=()):
+        """Önbelleği boyut sınırına indirir; silinen özetleri döndürür.
+
+        referenced verilirse içinde olmayan (hiçbir kaydın kullanmadığı)
+        dizinler önce silinir. keep içindeki özetlere dokunulmaz.
+        """
+        limit = self.max_bytes if max_bytes is None else max_bytes
+        entries = self.entries()
+        evicted = []
+        if referenced is not None:
+            for entry in entries:
+                if entry[0] not in referenced and entry[0] not in keep:
+                    evicted.append(entry)
+            entries = [entry for entry in entries if entry not in evicted]
+        total = sum(size for _, size, _ in entries)
+        for entry in entries:
+            if total <= limit:
+                break
+            if entry[0] in keep:
+                continue
+            evicted.append(entry)
+            total -= entry[1]
+        for sha256, _, _ in evicted:
+            self.discard(sha256)
+        return [sha256 for sha256, _, _ in evicted]
+
+    def stats(self):
+        entries = self.entries()
+        return {
+            "entries": len(entries),
+            "size": sum(size for _, size, _ in entries),
+            "max_size": self.max_bytes
+        }
+
+
+def launcher_script(name, appimage, root):
+    """appimage bağlantısının gösterdiği sürümü önbellekten başlatan betiği döndürür."""
+    return LAUNCHER.format(name=name, appimage=shlex.quote(appimage), root=shlex.quote(root))
@@ -0,0 +1,164 @@
+"""Uygulamalar dizinindeki mimeinfo.cache dosyasının yerinde güncellenmesi.
+
+update-desktop-database her çağrıda dizindeki tüm .desktop dosyalarını
+yeniden okur. Burada yalnızca eklenen ya da silinen girdinin MimeType=
+satırı işlenir ve önbellek dosyası yerinde düzeltilir. Tam yeniden oluşturma
+rebuild() ile yapılır. Dosya biçimi update-desktop-database ile aynıdır::
+
+    [MIME Cache]
+    application/pdf=a.desktop;b.desktop;
+"""
+import fcntl
+import os
+import tempfile
+from contextlib import contextmanager
+
+CACHE_NAME = "mimeinfo.cache"
+GROUP = "[MIME Cache]"
+
+
+def desktop_id(apps_dir, path):
+    """Bir .desktop dosyasının masaüstü kimliğini döndürür (alt dizinler '-' ile)."""
+    return os.path.relpath(path, apps_dir).replace(os.sep, "-")
+
+
+def mime_types(path):
+    """Bir .desktop dosyasının [Desktop Entry] grubundaki MIME türlerini döndürür.
+
+    Hidden=true olan girdiler silinmiş sayılır ve boş liste döner.
+    """
+    types, hidden, in_entry = [], False, False
+    with open(path, "r", encoding="utf-8", errors="replace") as f:
+        for line in f:
+            line = line.strip()
+            if line.startswith("["):
+                if in_entry:
+                    break
+                in_entry = line == "[Desktop Entry]"
+            elif in_entry and "=" in line:
+                key, value = line.split("=", 1)
+                key = key.strip()
+                if key == "MimeType":
+                    types = [t.strip() for t in value.split(";") if "/" in t]
+                elif key == "Hidden":
+                    hidden = value.strip() == "true"
+    return [] if hidden else list(dict.fromkeys(types))
+
+
+def read_cache(path):
+    """Önbellek dosyasını {mime: [masaüstü kimlikleri]} olarak okur; yoksa None."""
+    try:
+        f = open(path, "r", encoding="utf-8", errors="replace")
+    except FileNotFoundError:
+        return None
+    cache = {}
+    with f:
+        for line in f:
+            line = line.strip()
+            if not line or line.startswith(("[", "#")) or "=" not in line:
+                continue
+            mime, value = line.split("=", 1)
+            cache[mime] = [i for i in value.split(";") if i]
+    return cache
+
+
+def write_cache(path, cache):
+    """Önbelleği MIME türüne göre sıralı olarak atomik biçimde yazar."""
+    lines = [GROUP]
+    for mime in sorted(cache):
+        if cache[mime]:
+            lines.append(f"{mime}={';'.join(cache[mime])};")
+    directory = os.path.dirname(path)
+    fd, temp_path = tempfile.mkstemp(dir=directory, prefix=f".{CACHE_NAME}.")
+    try:
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            f.write("\n".join(lines) + "\n")
+        os.chmod(temp_path, 0o644)
+        os.replace(temp_path, path)
+    except BaseException:
+        os.unlink(temp_path)
+        raise
+
+
+@contextmanager
+def _locked(apps_dir):
+    """Dizin üzerinde özel kilit alır; aynı anda çalışan güncellemeler sıralanır."""
+    fd = os.open(apps_dir, os.O_RDONLY | os.O_DIRECTORY)
+    try:
+        fcntl.flock(fd, fcntl.LOCK_EX)
+        yield
+    finally:
+        os.close(fd)
+
+
+def _scan(apps_dir):
+    """Dizindeki tüm .desktop dosyalarından önbelleği baştan oluşturur."""
+    cache = {}
+    for root, dirs, files in os.walk(apps_dir):
+        dirs.sort()
+        for name in sorted(files):
+            if not name.endswith(".desktop"):
+                continue
+            path = os.path.join(root, name)
+            try:
+                types = mime_types(path)
+            except OSError:
+                continue
+            entry = desktop_id(apps_dir, path)
+            for mime in types:
+                cache.setdefault(mime, []).append(entry)
+    return cache
+
+
+def rebuild(apps_dir):
+    """Önbelleği dizindeki tüm girdileri okuyarak yeniden oluşturur.
+
+    Listelenen MIME türü sayısını döndürür.
+    """
+    with _locked(apps_dir):
+        cache = _scan(apps_dir)
+        write_cache(os.path.join(apps_dir, CACHE_NAME), cache)
+    return len(cache)
+
+
+def update(apps_dir, added=(), removed=()):
+    """Eklenen .desktop dosyalarını ve silinen masaüstü kimliklerini önbelleğe işler.
+
+    Yalnızca verilen girdiler okunur. Önbellek dosyası henüz yoksa ya da
+    eklenen bir girdi okunamıyorsa bir kez tam tarama yapılır. Dosya
+    değiştiyse True döner.
+    """
+    path = os.path.join(apps_dir, CACHE_NAME)
+    with _locked(apps_dir):
+        cache = read_cache(path)
+        if cache is None:
+            write_cache(path, _scan(apps_dir))
+            return True
+
+        stale = set(removed)
+        new = {}
+        for desktop_path in added:
+            entry = desktop_id(apps_dir, desktop_path)
+            stale.add(entry)
+            try:
+                types = mime_types(desktop_path)
+            except OSError:
+                # Okunamayan girdi silinmiş sayılır; tam taramada atlanır
+                write_cache(path, _scan(apps_dir))
+                return True
+            for mime in types:
+                new.setdefault(mime, []).append(entry)
+
+        updated = {}
+        for mime, ids in cache.items():
+            # Yeniden kurulan girdi listedeki yerini korur
+            readded = new.get(mime, ())
+            updated[mime] = [i for i in ids if i not in stale or i in readded]
+        for mime, ids in new.items():
+            present = updated.setdefault(mime, [])
+            present.extend(i for i in ids if i not in present)
+
+        changed = {k: v for k, v in updated.items() if v} != {k: v for k, v in cache.items() if v}
+        if changed:
+            write_cache(path, updated)
+        return changed
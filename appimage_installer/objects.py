@@ -0,0 +1,350 @@
+"""İçerik adresli AppImage deposu.
+
+Her imaj SHA-256 özetini ad olarak alan tek bir dosya olarak saklanır
+(``~/.local/share/appimages/<sha256>``). Aynı içerik farklı yollardan ya da
+farklı sürüm kayıtlarından kurulsa da diskte bir kez bulunur. Kaynak aynı
+dosya sistemindeyse ve zaten salt okunursa kopyalanmak yerine sabit
+bağlantıyla depoya eklenir; yazılabilir bir kaynak nesneyle inode
+paylaşırsa nesnenin içeriği adıyla uyuşmaz hâle gelebilir.
+``~/.local/bin`` altındaki girdi depodaki nesneye işaret eden bir sembolik
+bağlantıdır ve atomik olarak değiştirilir; sürüm değiştirmek bu yüzden
+dosya kopyalamaz.
+"""
+import os
+import re
+import stat
+from contextlib import contextmanager
+
+OBJECT_NAME = re.compile(r"[0-9a-f]{64}$")
+OBJECT_MODE = 0o555
+
+
+class ObjectStore:
+    """SHA-256 özetiyle adreslenen AppImage nesneleri."""
+
+    def __init__(self, root):
+        self.root = root
+
+    def path(self, sha256):
+        return os.path.join(self.root, sha256)
+
+    def contains(self, sha256, size=None):
+        """Nesne depoda varsa (ve boyutu tutuyorsa) True."""
+        try:
+            st = os.stat(self.path(sha256))
+        except OSError:
+            return False
+        return stat.S_ISREG(st.st_mode) and (size is None or st.st_size == size)
+
+    def add(self, src, sha256, copy, move=False, ref=None, digest=None):
+        """src dosyasını depoya ekler; (nesne yolu, yöntem) döndürür.
+
+        Nesne zaten varsa dosyaya dokunulmaz ("dedup"). Kaynak aynı dosya
+        sistemindeyse, kullanıcıya aitse ve izinleri zaten OBJECT_MODE ise
+        sabit bağlantı kurulur ("hardlink"); digest verilirse bağlanan inode
+        yeniden özetlenir ve özet tutmazsa bağlantı geri alınır. Aksi hâlde
+        copy(src, dst, move) çağrılır; copy yöntemin adını döndürmelidir ve
+        dosyayı OBJECT_MODE izinleriyle atomik olarak yerleştirmelidir.
+        Kullanıcı deposunda başvurular kayıtlardan hesaplandığından ref
+        kullanılmaz.
+        """
+        os.makedirs(self.root, mode=0o755, exist_ok=True)
+        target = self.path(sha256)
+        st = os.stat(src)
+        if self.contains(sha256, st.st_size):
+            return target, "dedup"
+
+        if not move and self._linkable(st):
+            try:
+                os.link(src, target)
+            except FileExistsError:
+                if self.contains(sha256, st.st_size):
+                    return target, "dedup"
+            except OSError:
+                pass
+            else:
+                if digest is None or digest(target) == sha256:
+                    return target, "hardlink"
+                os.remove(target)
+                raise ValueError(f"{src} changed while it was being added to the store")
+        return target, copy(src, target, move)
+
+    def _linkable(self, st):
+        """Kaynağın depoyla sabit bağlantı paylaşması güvenliyse True.
+
+        Kaynak kimse tarafından yazılamamalıdır; aksi hâlde kaynağa yapılan
+        bir yazma aynı inode'u paylaşan nesneyi de değiştirir.
+        """
+        return (stat.S_ISREG(st.st_mode)
+                and st.st_dev == os.stat(self.root).st_dev
+                and st.st_uid == os.getuid()
+                and stat.S_IMODE(st.st_mode) == OBJECT_MODE)
+
+    @staticmethod
+    def link(target, link_path):
+        """link_path'i target'a işaret eden bir sembolik bağlantıyla atomik olarak değiştirir."""
+        temp = os.path.join(os.path.dirname(link_path), f".tmp-link-{os.getpid()}-{os.path.basename(link_path)}")
+        try:
+            os.unlink(temp)
+        except FileNotFoundError:
+            pass
+        os.symlink(target, temp)
+        try:
+            os.replace(temp, link_path)
+        except BaseException:
+            os.unlink(temp)
+            raise
+
+    def owns(self, link_path):
+        """link_path depodaki bir nesneye işaret eden bir sembolik bağlantıysa True."""
+        if not os.path.islink(link_path):
+            return False
+        target = os.readlink(link_path)
+        return (os.path.dirname(target) == self.root
+                and OBJECT_NAME.match(os.path.basename(target)) is not None)
+
+    def objects(self):
+        """Depodaki (özet, boyut) çiftlerini üretir."""
+        try:
+            entries = list(os.scandir(self.root))
+        except FileNotFoundError:
+            return
+        for entry in entries:
+            if OBJECT_NAME.match(entry.name) and entry.is_file(follow_symlinks=False):
+                yield entry.name, entry.stat(follow_symlinks=False).st_size
+
+    def discard(self, sha256):
+        """Nesneyi depodan siler; yoksa bir şey yapmaz."""
+        try:
+            os.remove(self.path(sha256))
+        except FileNotFoundError:
+            pass
+
+    def collect(self, referenced, dry_run=False):
+        """referenced içinde olmayan nesneleri siler; (özetler, bayt) döndürür."""
+        removed, freed = [], 0
+        for sha256, size in self.objects():
+            if sha256 in referenced:
+                continue
+            if not dry_run:
+                try:
+                    os.remove(self.path(sha256))
+                except FileNotFoundError:
+                    continue
+            removed.append(sha256)
+            freed += size
+        return removed, freed
+
+
+class UntrustedStoreError(ValueError):
+    """Paylaşılan deponun sahipliği ya da izinleri güvenli değil."""
+
+    def __init__(self, path, reason):
+        super().__init__(f"untrusted shared store {path}: {reason}")
+        self.path = path
+        self.reason = reason
+
+
+class SharedObjectStore(ObjectStore):
+    """Birden çok kullanıcının paylaştığı sistem deposu (ör. /opt/appimages).
+
+    Nesneler ``objects/``, ikonlar ``icons/`` altında tutulur. Önek ve alt
+    dizinleri root'a ait olmalı ve başkaları tarafından yazılamamalıdır;
+    nesne ekleyebilecek kullanıcılar dizinlerin grubuyla belirlenir. Dizinler
+    yoksa yalnızca root tarafından, önekin grubu ve izinleriyle oluşturulur.
+    Her kullanıcı kaydı ``refs/<sha256>-<uid>-<uygulama>`` adlı, o
+    kullanıcıya ait boş bir dosyayla nesneye başvurur. ``refs/`` dizininde
+    yapışkan bit bulunduğundan bir başvuruyu yalnızca sahibi silebilir;
+    sahibi adındaki uid ile uyuşmayan başvurular sayılmaz. Başvurusu
+    kalmayan nesneler collect_unreferenced ile silinir.
+
+    Nesne eklemek, başvuru eklemek ve nesne silmek nesne başına bir flock
+    kilidi altında yapılır; aynı imajı aynı anda kuran kullanıcılar
+    kopyalamayı tekrarlamaz ve çöp toplama yeni eklenen bir başvuruyu
+    kaçırmaz. Kaynak dosya hiçbir zaman taşınmaz ya da sabit bağlantıyla
+    eklenmez; her zaman geçici bir dosyaya kopyalanıp OBJECT_MODE izinleriyle
+    yerine konur. Var olan bir nesne yeniden kullanılmadan önce içeriği
+    özetlenir.
+    """
+
+    def __init__(self, prefix):
+        super().__init__(os.path.join(prefix, "objects"))
+        self.prefix = prefix
+        self.icons = os.path.join(prefix, "icons")
+        self.refs = os.path.join(prefix, "refs")
+
+    def _create_layout(self):
+        """Eksik dizinleri önekin grubu ve izinleriyle oluşturur (yalnızca root)."""
+        os.makedirs(self.prefix, mode=0o755, exist_ok=True)
+        st = os.stat(self.prefix)
+        mode = stat.S_IMODE(st.st_mode) & ~stat.S_IWOTH
+        for path in (self.root, self.icons, self.refs):
+            if os.path.isdir(path):
+                continue
+            os.mkdir(path)
+            os.chown(path, 0, st.st_gid)
+            # Başvuru dizininde herkes yalnızca kendi dosyasını silebilir
+            os.chmod(path, mode | stat.S_ISVTX if path == self.refs else mode)
+
+    def check(self):
+        """Depo dizinleri güvenilir değilse UntrustedStoreError yükseltir."""
+        if os.geteuid() == 0:
+            self._create_layout()
+        for path in (self.prefix, self.root, self.icons, self.refs):
+            try:
+                st = os.lstat(path)
+            except FileNotFoundError:
+                raise UntrustedStoreError(path, "missing; create it as root")
+            if not stat.S_ISDIR(st.st_mode):
+                raise UntrustedStoreError(path, "not a directory")
+            if st.st_uid != 0:
+                raise UntrustedStoreError(path, "not owned by root")
+            sticky = path == self.refs and st.st_mode & stat.S_ISVTX
+            if st.st_mode & stat.S_IWOTH and not sticky:
+                raise UntrustedStoreError(path, "writable by others")
+        if not os.stat(self.refs).st_mode & stat.S_ISVTX:
+            raise UntrustedStoreError(self.refs, "sticky bit not set")
+
+    def _lock_path(self, sha256):
+        return os.path.join(self.root, f".{sha256}.lock")
+
+    @contextmanager
+    def locked(self, sha256):
+        """Nesne için özel kilidi alır.
+
+        Kilit dosyası çöp toplamada kilit tutulurken silinebildiğinden,
+        kilit alındıktan sonra yolun hâlâ aynı dosyayı gösterdiği denetlenir;
+        göstermiyorsa yeni dosyayla yeniden denenir.
+        """
+        import fcntl
+
+        path = self._lock_path(sha256)
+        while True:
+            # flock salt okunur tanıtıcıda da çalışır; kilit dosyası başka bir kullanıcıya ait olabilir
+            fd = os.open(path, os.O_RDONLY | os.O_CREAT, 0o644)
+            fcntl.flock(fd, fcntl.LOCK_EX)
+            try:
+                if os.stat(path).st_ino == os.fstat(fd).st_ino:
+                    break
+            except FileNotFoundError:
+                pass
+            os.close(fd)
+        try:
+            yield
+        finally:
+            os.close(fd)
+
+    def _linkable(self, st):
+        return False
+
+    def add(self, src, sha256, copy, move=False, ref=None, digest=None):
+        """Nesneyi kilit altında kopyalayarak ekler ve ref adıyla bir başvuru kaydeder.
+
+        move yok sayılır. digest verilirse var olan nesnenin özeti
+        denetlenir; adıyla uyuşmayan nesne silinip kaynaktan yeniden yazılır.
+        """
+        self.check()
+        with self.locked(sha256):
+            if (digest is not None and self.contains(sha256, os.stat(src).st_size)
+                    and digest(self.path(sha256)) != sha256):
+                self.discard(sha256)
+            result = super().add(src, sha256, copy)
+            if ref is not None:
+                self._add_ref(sha256, ref)
+        return result
+
+    def _ref_path(self, sha256, ref):
+        return os.path.join(self.refs, f"{sha256}-{ref}")
+
+    def _add_ref(self, sha256, ref):
+        fd = os.open(self._ref_path(sha256, ref), os.O_RDONLY | os.O_CREAT | os.O_NOFOLLOW, 0o444)
+        try:
+            owner = os.fstat(fd).st_uid
+        finally:
+            os.close(fd)
+        if owner != os.getuid():
+            raise UntrustedStoreError(self._ref_path(sha256, ref), "reference owned by another user")
+
+    def add_ref(self, sha256, ref):
+        self.check()
+        with self.locked(sha256):
+            self._add_ref(sha256, ref)
+
+    def remove_ref(self, sha256, ref):
+        try:
+            os.remove(self._ref_path(sha256, ref))
+        except FileNotFoundError:
+            pass
+
+    def referenced(self, sha256=None):
+        """Geçerli bir başvurusu olan nesne özetlerini döndürür.
+
+        Adı ``<sha256>-<uid>-<uygulama>`` biçiminde olan ve sahibi adındaki
+        uid olan dosyalar sayılır; sha256 verilirse yalnızca o nesneye
+        bakılır.
+        """
+        result = set()
+        try:
+            entries = list(os.scandir(self.refs))
+        except FileNotFoundError:
+            return result
+        for entry in entries:
+            name = entry.name
+            if sha256 is not None and not name.startswith(sha256):
+                continue
+            uid = name[65:].split("-", 1)[0]
+            if (not OBJECT_NAME.match(name[:64]) or name[64:65] != "-" or not uid.isdigit()
+                    or not entry.is_file(follow_symlinks=False)):
+                continue
+            if entry.stat(follow_symlinks=False).st_uid == int(uid):
+                result.add(name[:64])
+        return result
+
+    def add_icon(self, sha256, data, ext):
+        """İmajın ikonunu paylaşılan ikon dizinine bir kez yazar ve yolunu döndürür."""
+        self.check()
+        target = os.path.join(self.icons, sha256 + ext)
+        if os.path.isfile(target) and not os.path.islink(target):
+            with open(target, "rb") as f:
+                if f.read() == data:
+                    return target
+        temp = f"{target}.tmp-{os.getpid()}"
+        with open(temp, "wb") as f:
+            f.write(data)
+        os.chmod(temp, 0o444)
+        os.replace(temp, target)
+        return target
+
+    def collect_unreferenced(self, dry_run=False):
+        """Hiçbir kullanıcının başvurmadığı nesneleri ve ikonlarını siler; (özetler, bayt) döndürür."""
+        self.check()
+        removed, freed = [], 0
+        referenced = self.referenced()
+        for sha256, size in list(self.objects()):
+            if sha256 in referenced:
+                continue
+            with self.locked(sha256):
+                # Listeden sonra eklenen başvuruları kaçırmamak için kilit altında yeniden bak
+                if self.referenced(sha256):
+                    continue
+                if not dry_run:
+                    self.discard(sha256)
+                    for name in os.listdir(self.icons):
+                        if name.startswith(sha256):
+                            os.remove(os.path.join(self.icons, name))
+                    os.remove(self._lock_path(sha256))
+                removed.append(sha256)
+                freed += size
+        if not dry_run:
+            self._collect_locks()
+        return removed, freed
+
+    def _collect_locks(self):
+        """Nesnesi artık bulunmayan kilit dosyalarını siler."""
+        for name in os.listdir(self.root):
+            sha256 = name[1:-len(".lock")]
+            if not (name.startswith(".") and name.endswith(".lock") and OBJECT_NAME.match(sha256)):
+                continue
+            with self.locked(sha256):
+                if not self.contains(sha256):
+                    os.remove(self._lock_path(sha256))
@@ -0,0 +1,166 @@
+"""Kayıtlar ile diskteki kurulum dosyaları arasındaki farkların tespiti.
+
+Her kaydın manifestindeki dosyalar stat ile denetlenir; içerik özeti yalnızca
+(cihaz, inode, boyut, mtime) bilgisi son denetimden beri değişen dosyalar
+için yeniden hesaplanır. Masaüstü girdileri dizini de aynı önbellekle
+taranır ve yalnızca değişen girdiler yeniden okunur; böylece değişiklik
+olmayan bir makinede denetim birkaç stat çağrısına mal olur.
+"""
+import os
+
+MISSING = "missing"
+MODIFIED = "modified"
+NO_MANIFEST = "no_manifest"
+NO_VERSION = "no_version"
+ORPHAN = "orphan"
+
+
+class Problem:
+    """Bulunan tek bir tutarsızlık; kayda bağlı değilse name None'dır."""
+    __slots__ = ("kind", "name", "path", "type")
+
+    def __init__(self, kind, name=None, path=None, type=None):
+        self.kind = kind
+        self.name = name
+        self.path = path
+        self.type = type
+
+
+class StatCache:
+    """Değişmemiş dosyalar için önceki denetimin sonucunu döndüren önbellek.
+
+    entries, {yol: ((cihaz, inode, boyut, mtime), değer)} biçimindedir.
+    Denetim sırasında görülmeyen yollar stale() ile bulunup silinebilir.
+    """
+
+    def __init__(self, entries):
+        self.entries = entries
+        self.changed = {}
+        self.seen = set()
+
+    @staticmethod
+    def _key(st):
+        return st.st_dev, st.st_ino, st.st_size, st.st_mtime_ns
+
+    def get(self, path, st):
+        self.seen.add(path)
+        cached = self.entries.get(path)
+        if cached is not None and tuple(cached[0]) == self._key(st):
+            return cached[1]
+        return None
+
+    def put(self, path, st, value):
+        self.seen.add(path)
+        self.entries[path] = self.changed[path] = (self._key(st), value)
+
+    def stale(self):
+        return [path for path in self.entries if path not in self.seen]
+
+
+def _intact(entry, st, owns, digest, stat_cache):
+    """Manifest girdisi diskteki dosyayla uyuşuyorsa True."""
+    if st.st_size != entry["size"]:
+        return False
+    sha256 = entry.get("sha256")
+    if not sha256:
+        return True
+    path = entry["path"]
+    if entry["type"] == "AppImage" and owns(path):
+        # Bağlantı doğru nesneyi göstermeli, nesnenin içeriği de adıyla uyuşmalı
+        path = os.readlink(path)
+        if os.path.basename(path) != sha256:
+            return False
+    cached = stat_cache.get(path, st)
+    if cached is None or not cached.startswith("sha256:"):
+        cached = "sha256:" + digest(path)
+        stat_cache.put(path, st, cached)
+    return cached == "sha256:" + sha256
+
+
+def check_records(versions, owns, digest, stat_cache):
+    """Kayıtlardaki eksik ya da değiştirilmiş dosyaları bulur.
+
+    owns, bir yolun depodaki bir nesneye bağlı olup olmadığını döndürür.
+    """
+    problems = []
+    for name, info in versions.items():
+        if not info.get("version"):
+            problems.append(Problem(NO_VERSION, name))
+        files = info.get("files")
+        if files is None:
+            problems.append(Problem(NO_MANIFEST, name))
+            continue
+        for entry in files:
+            try:
+                st = os.stat(entry["path"])
+            except OSError:
+                problems.append(Problem(MISSING, name, entry["path"], entry["type"]))
+                continue
+            if not _intact(entry, st, owns, digest, stat_cache):
+                problems.append(Problem(MODIFIED, name, entry["path"], entry["type"]))
+    return problems
+
+
+def _exec_target(path):
+    """Masaüstü girdisindeki Exec= satırının ilk öğesini döndürür."""
+    try:
+        with open(path, "r", encoding="utf-8", errors="replace") as f:
+            for line in f:
+                if line.startswith("Exec="):
+                    parts = line[5:].split()
+                    return parts[0] if parts else ""
+    except OSError:
+        pass
+    return ""
+
+
+def _scandir(path):
+    try:
+        return list(os.scandir(path))
+    except FileNotFoundError:
+        return []
+
+
+def find_orphans(versions, dirs, owns, stat_cache, icon_extensions=(), appimage_extensions=()):
+    """Hiçbir kayda ait olmayan, kurulumun oluşturduğu dosyaları bulur.
+
+    dirs "bin", "applications", "icons" ve "launchers" dizinlerini içerir.
+    Bir masaüstü girdisi yalnızca başlatıcı dizinindeki bir betiği ya da
+    bin dizininde depoya bağlı (ya da artık bulunmayan) bir AppImage'ı
+    çalıştırıyorsa kurulumun sayılır; kullanıcının kendi girdilerine
+    dokunulmaz.
+    """
+    owned = {entry["path"] for info in versions.values() for entry in info.get("files") or ()}
+    bin_dir, launcher_dir = dirs["bin"], dirs["launchers"]
+    problems = []
+
+    for item in _scandir(dirs["applications"]):
+        if not item.name.endswith(".desktop") or item.path in owned or not item.is_file():
+            continue
+        st = item.stat()
+        cached = stat_cache.get(item.path, st)
+        if cached is None or not cached.startswith("exec:"):
+            cached = "exec:" + _exec_target(item.path)
+            stat_cache.put(item.path, st, cached)
+        target = cached[5:]
+        ours = os.path.dirname(target) == launcher_dir or (
+            os.path.dirname(target) == bin_dir
+            and os.path.splitext(target)[1] in appimage_extensions
+            and (owns(target) or not os.path.lexists(target)))
+        if not ours:
+            continue
+        problems.append(Problem(ORPHAN, path=item.path, type="Desktop"))
+        stem = item.name[:-len(".desktop")]
+        for ext in icon_extensions:
+            icon = os.path.join(dirs["icons"], stem + ext)
+            if icon not in owned and os.path.isfile(icon):
+                problems.append(Problem(ORPHAN, path=icon, type="Icon"))
+
+    for item in _scandir(bin_dir):
+        if item.path not in owned and item.is_symlink() and owns(item.path):
+            problems.append(Problem(ORPHAN, path=item.path, type="AppImage"))
+
+    for item in _scandir(launcher_dir):
+        if item.path not in owned and item.is_file():
+            problems.append(Problem(ORPHAN, path=item.path, type="Launcher"))
+    return problems
@@ -0,0 +1,64 @@
+"""Çıkarma sırasında kullanılan geçici dizinler ve disk alanı denetimi.
+
+Geçici dizinler tmpfs olabilen /tmp yerine yapılandırılabilen bir kök
+altında ``<önek><pid>-<rastgele>`` adıyla oluşturulur. Süreç finally
+bloğuna ulaşmadan öldürülürse dizin geride kalır; sonraki çalışmada sahibi
+artık yaşamayan dizinler clean_stale ile silinir.
+"""
+import os
+import shutil
+import tempfile
+
+# Tahmin edilen boyutun üzerine eklenen pay ve dosya sisteminde boş bırakılan alan
+SPACE_MARGIN = 1.1
+RESERVE_BYTES = 16 * 1024 * 1024
+
+
+def _owner_alive(pid):
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        pass
+    return True
+
+
+def make(root, prefix=""):
+    """root altında bu sürece ait yeni bir geçici dizin oluşturur."""
+    os.makedirs(root, mode=0o700, exist_ok=True)
+    return tempfile.mkdtemp(prefix=f"{prefix}{os.getpid()}-", dir=root)
+
+
+def clean_stale(root, prefix=""):
+    """Sahibi çalışmayan geçici dizinleri siler ve yollarını döndürür."""
+    try:
+        entries = list(os.scandir(root))
+    except FileNotFoundError:
+        return []
+    removed = []
+    for entry in entries:
+        if not entry.name.startswith(prefix) or not entry.is_dir(follow_symlinks=False):
+            continue
+        pid = entry.name[len(prefix):].split("-", 1)[0]
+        if not pid.isdigit() or int(pid) == os.getpid() or _owner_alive(int(pid)):
+            continue
+        shutil.rmtree(entry.path, ignore_errors=True)
+        removed.append(entry.path)
+    return removed
+
+
+def free_bytes(path):
+    """path'in bulunduğu dosya sisteminde ayrıcalıksız kullanıcıya açık boş alan."""
+    while not os.path.exists(path):
+        parent = os.path.dirname(path)
+        if parent == path:
+            break
+        path = parent
+    st = os.statvfs(path)
+    return st.f_bavail * st.f_frsize
+
+
+def required_bytes(size):
+    """Tahmini boyut için dosya sisteminde bulunması gereken alan."""
+    return int(size * SPACE_MARGIN) + RESERVE_BYTES
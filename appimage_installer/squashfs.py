@@ -0,0 +1,450 @@
+"""AppImage içindeki SquashFS dosya sistemi için saf Python okuyucu.
+
+Type-2 AppImage dosyaları bir ELF çalıştırıcısı ve hemen arkasından gelen
+bir SquashFS 4.0 imajından oluşur. Bu modül imajı çalıştırmadan yalnızca
+gereken blokları açarak tek tek dosyaları okumaya izin verir.
+"""
+import os
+import stat
+import struct
+import zlib
+
+SQUASHFS_MAGIC = 0x73717368
+SUPERBLOCK_FORMAT = "<IIIIIHHHHHHQQQQQQQQ"
+SUPERBLOCK_SIZE = struct.calcsize(SUPERBLOCK_FORMAT)
+METADATA_SIZE = 8192
+NO_FRAGMENT = 0xFFFFFFFF
+MAX_SYMLINK_DEPTH = 40
+
+COMPRESSION_NAMES = {1: "gzip", 2: "lzma", 3: "lzo", 4: "xz", 5: "lz4", 6: "zstd"}
+
+# Inode türleri
+DIR_TYPES = (1, 8)
+FILE_TYPES = (2, 9)
+SYMLINK_TYPES = (3, 10)
+
+
+class SquashFSError(ValueError):
+    """Okunamayan ya da desteklenmeyen SquashFS imajları için hata."""
+
+
+class Superblock:
+    __slots__ = ("magic", "inode_count", "mkfs_time", "block_size", "fragment_count",
+                 "compression", "block_log", "flags", "id_count",
+                 "version_major", "version_minor", "root_inode", "bytes_used",
+                 "id_table", "xattr_table", "inode_table", "directory_table",
+                 "fragment_table", "export_table")
+
+    def __init__(self, raw):
+        for name, value in zip(self.__slots__, struct.unpack(SUPERBLOCK_FORMAT, raw)):
+            setattr(self, name, value)
+
+
+class Inode:
+    """Ayrıştırılmış bir inode'un okuyucunun ihtiyaç duyduğu alanları."""
+    __slots__ = ("type", "mode", "number", "mtime", "size", "blocks_start",
+                 "fragment", "fragment_offset", "block_sizes", "dir_block",
+                 "dir_offset", "target")
+
+    def __init__(self, type, mode, number, mtime):
+        self.type = type
+        self.mode = mode
+        self.number = number
+        self.mtime = mtime
+        self.size = 0
+        self.blocks_start = 0
+        self.fragment = NO_FRAGMENT
+        self.fragment_offset = 0
+        self.block_sizes = ()
+        self.dir_block = 0
+        self.dir_offset = 0
+        self.target = None
+
+    def is_dir(self):
+        return self.type in DIR_TYPES
+
+    def is_file(self):
+        return self.type in FILE_TYPES
+
+    def is_symlink(self):
+        return self.type in SYMLINK_TYPES
+
+
+def elf_payload_offset(header):
+    """ELF başlığından çalıştırıcının bittiği (imajın başladığı) ofseti hesaplar."""
+    if len(header) < 64 or header[:4] != b"\x7fELF":
+        raise SquashFSError("not an ELF file")
+    endian = "<" if header[5] == 1 else ">"
+    if header[4] == 2:
+        shoff, = struct.unpack_from(endian + "Q", header, 0x28)
+        shentsize, shnum = struct.unpack_from(endian + "HH", header, 0x3A)
+    elif header[4] == 1:
+        shoff, = struct.unpack_from(endian + "I", header, 0x20)
+        shentsize, shnum = struct.unpack_from(endian + "HH", header, 0x2E)
+    else:
+        raise SquashFSError("unknown ELF class")
+    return shoff + shentsize * shnum
+
+
+def find_payload_offset(fd):
+    """Dosya içinde SquashFS imajının başladığı ofseti bulur."""
+    header = os.pread(fd, 64, 0)
+    if header[:4] == struct.pack("<I", SQUASHFS_MAGIC):
+        return 0
+    offset = elf_payload_offset(header)
+    if os.pread(fd, 4, offset) != struct.pack("<I", SQUASHFS_MAGIC):
+        raise SquashFSError("no squashfs payload found")
+    return offset
+
+
+def _decompressor(compression, block_size):
+    """Sıkıştırma türüne uygun açma fonksiyonunu döndürür."""
+    if compression == 1:
+        return zlib.decompress
+    if compression in (2, 4):
+        import lzma
+        fmt = lzma.FORMAT_ALONE if compression == 2 else lzma.FORMAT_XZ
+        return lambda data: lzma.decompress(data, format=fmt)
+    try:
+        if compression == 3:
+            import lzo
+            return lambda data: lzo.decompress(data, False, block_size)
+        if compression == 5:
+            import lz4.block
+            return lambda data: lz4.block.decompress(data, uncompressed_size=block_size)
+        if compression == 6:
+            try:
+                from compression import zstd
+                return zstd.decompress
+            except ImportError:
+                import zstandard
+                decompressor = zstandard.ZstdDecompressor()
+                return lambda data: decompressor.decompress(data, max_output_size=block_size)
+    except ImportError:
+        pass
+    raise SquashFSError("unsupported compression: "
+                        + COMPRESSION_NAMES.get(compression, str(compression)))
+
+
+def _check_name(name):
+    if not name or name in (".", "..") or "/" in name or "\0" in name:
+        raise SquashFSError("invalid entry name: {!r}".format(name))
+    return name
+
+
+class SquashFS:
+    """Bir AppImage ya da ham SquashFS dosyasını salt okunur açar."""
+
+    def __init__(self, path, offset=None):
+        self.path = path
+        self._file = open(path, "rb")
+        try:
+            fd = self._file.fileno()
+            self.offset = find_payload_offset(fd) if offset is None else offset
+            raw = os.pread(fd, SUPERBLOCK_SIZE, self.offset)
+            if len(raw) != SUPERBLOCK_SIZE:
+                raise SquashFSError("truncated superblock")
+            self.superblock = sb = Superblock(raw)
+            if sb.magic != SQUASHFS_MAGIC or sb.version_major != 4:
+                raise SquashFSError("unsupported squashfs version {}.{}".format(
+                    sb.version_major, sb.version_minor))
+            if sb.block_size != 1 << sb.block_log:
+                raise SquashFSError("corrupt superblock")
+            self._decompress = _decompressor(sb.compression, sb.block_size)
+        except Exception:
+            self._file.close()
+            raise
+        self._metadata_cache = {}
+        self._fragment_cache = (None, None)
+        self._root = None
+
+    def close(self):
+        self._file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    # Düşük seviye okuma
+
+    def _pread(self, pos, size):
+        data = os.pread(self._file.fileno(), size, self.offset + pos)
+        if len(data) != size:
+            raise SquashFSError("unexpected end of image")
+        return data
+
+    def _metadata_block(self, pos):
+        """Bir metadata bloğunu açar; (veri, sonraki blok konumu) döndürür."""
+        cached = self._metadata_cache.get(pos)
+        if cached is None:
+            header, = struct.unpack("<H", self._pread(pos, 2))
+            size = header & 0x7FFF
+            data = self._pread(pos + 2, size)
+            if not header & 0x8000:
+                data = self._decompress(data)
+            cached = (data, pos + 2 + size)
+            if len(self._metadata_cache) > 256:
+                self._metadata_cache.clear()
+            self._metadata_cache[pos] = cached
+        return cached
+
+    def _read_metadata(self, pos, offset, size):
+        """Ardışık metadata bloklarından (pos, offset) konumundan size bayt okur."""
+        chunks = []
+        while size > 0:
+            data, next_pos = self._metadata_block(pos)
+            chunk = data[offset:offset + size]
+            if not chunk:
+                raise SquashFSError("metadata read out of range")
+            chunks.append(chunk)
+            size -= len(chunk)
+            pos, offset = next_pos, 0
+        return b"".join(chunks)
+
+    def _metadata_cursor(self, pos, offset):
+        """Metadata akışında ilerleyen bir okuma fonksiyonu döndürür."""
+        state = [pos, offset]
+
+        def read(size):
+            chunks = []
+            while size > 0:
+                data, next_pos = self._metadata_block(state[0])
+                chunk = data[state[1]:state[1] + size]
+                if not chunk:
+                    if state[1] < len(data):
+                        raise SquashFSError("metadata read out of range")
+                    state[0], state[1] = next_pos, 0
+                    continue
+                chunks.append(chunk)
+                size -= len(chunk)
+                state[1] += len(chunk)
+            return b"".join(chunks)
+        return read
+
+    def _block(self, pos, size_field, expected):
+        size = size_field & 0xFFFFFF
+        if size == 0:
+            return b"\0" * expected
+        data = self._pread(pos, size)
+        if not size_field & 0x1000000:
+            data = self._decompress(data)
+        return data
+
+    # Inode ve dizin tabloları
+
+    def inode(self, ref):
+        """Bir inode referansını (blok << 16 | ofset) ayrıştırır."""
+        sb = self.superblock
+        read = self._metadata_cursor(sb.inode_table + (ref >> 16), ref & 0xFFFF)
+        type, mode, _, _, mtime, number = struct.unpack("<HHHHII", read(16))
+        inode = Inode(type, mode, number, mtime)
+        if type == 1:
+            block, _, size, offset, _ = struct.unpack("<IIHHI", read(16))
+            inode.dir_block, inode.size, inode.dir_offset = block, size, offset
+        elif type == 8:
+            _, size, block, _, _, offset, _ = struct.unpack("<IIIIHHI", read(24))
+            inode.dir_block, inode.size, inode.dir_offset = block, size, offset
+        elif type in FILE_TYPES:
+            if type == 2:
+                start, fragment, frag_offset, size = struct.unpack("<IIII", read(16))
+            else:
+                start, size, _, _, fragment, frag_offset, _ = struct.unpack("<QQQIIII", read(40))
+            count, rest = divmod(size, sb.block_size)
+            if rest and fragment == NO_FRAGMENT:
+                count += 1
+            inode.blocks_start, inode.size = start, size
+            inode.fragment, inode.fragment_offset = fragment, frag_offset
+            inode.block_sizes = struct.unpack("<%dI" % count, read(4 * count))
+        elif type in SYMLINK_TYPES:
+            _, size = struct.unpack("<II", read(8))
+            inode.size = size
+            inode.target = read(size).decode("utf-8", "surrogateescape")
+        return inode
+
+    def _entries(self, inode):
+        """Bir dizin inode'unun (ad, inode referansı, tür) girdilerini üretir."""
+        # Dizin boyutu, "." ve ".." için 3 bayt fazladan içerir
+        remaining = inode.size - 3
+        if remaining <= 0:
+            return
+        sb = self.superblock
+        listing = self._read_metadata(sb.directory_table + inode.dir_block,
+                                      inode.dir_offset, remaining)
+        pos = 0
+        while pos + 12 <= len(listing):
+            count, start, _ = struct.unpack_from("<III", listing, pos)
+            pos += 12
+            for _ in range(count + 1):
+                offset, _, type, name_size = struct.unpack_from("<HhHH", listing, pos)
+                pos += 8
+                name = listing[pos:pos + name_size + 1].decode("utf-8", "surrogateescape")
+                pos += name_size + 1
+                yield _check_name(name), (start << 16) | offset, type
+
+    @property
+    def root(self):
+        if self._root is None:
+            self._root = self.inode(self.superblock.root_inode)
+        return self._root
+
+    def listdir(self, path=""):
+        """Dizin içindeki girdi adlarını döndürür."""
+        inode = self.lookup(path)
+        if not inode.is_dir():
+            raise SquashFSError("not a directory: " + path)
+        return [name for name, _, _ in self._entries(inode)]
+
+    def lookup(self, path, follow_symlinks=True, _depth=0):
+        """İmaj içindeki göreli bir yolu inode'a çözümler."""
+        if _depth > MAX_SYMLINK_DEPTH:
+            raise SquashFSError("too many levels of symbolic links: " + path)
+        parts = [p for p in path.split("/") if p and p != "."]
+        inode, walked = self.root, []
+        for i, part in enumerate(parts):
+            if part == "..":
+                walked = walked[:-1]
+                inode = self.lookup("/".join(walked), _depth=_depth + 1)
+                continue
+            if not inode.is_dir():
+                raise SquashFSError("not a directory: " + "/".join(walked))
+            for name, ref, _ in self._entries(inode):
+                if name == part:
+                    inode = self.inode(ref)
+                    break
+            else:
+                raise SquashFSError("no such file in image: " + path)
+            last = i == len(parts) - 1
+            if inode.is_symlink() and (follow_symlinks or not last):
+                if inode.target.startswith("/"):
+                    raise SquashFSError("symlink leaves image: " + path)
+                target = "/".join(walked + [inode.target] + parts[i + 1:])
+                return self.lookup(target, follow_symlinks, _depth + 1)
+            walked.append(part)
+        return inode
+
+    def walk(self, top=""):
+        """os.walk benzeri şekilde (dizin, alt dizinler, dosyalar) üretir.
+
+        Alt dizin listesi yerinde değiştirilerek gezinti budanabilir.
+        Sembolik bağlar izlenmez ve dosyalar listesinde yer alır.
+        """
+        top = top.strip("/")
+        stack = [(top, self.lookup(top))]
+        while stack:
+            path, inode = stack.pop()
+            dirs, files, refs = [], [], {}
+            for name, ref, type in self._entries(inode):
+                if type in DIR_TYPES:
+                    dirs.append(name)
+                    refs[name] = ref
+                else:
+                    files.append(name)
+            yield path, dirs, files
+            for name in reversed(dirs):
+                if name in refs:
+                    child = path + "/" + name if path else name
+                    stack.append((child, self.inode(refs[name])))
+
+    def unpacked_size(self, include=None):
+        """Çıkarıldığında yazılacak bayt sayısını veri bloklarını okumadan hesaplar.
+
+        Yalnızca dizin ve inode tabloları okunur. include verilirse
+        include(yol, dizin_mi) False dönen dizinlere girilmez ve dosyalar
+        sayılmaz.
+        """
+        total = 0
+        stack = [("", self.root)]
+        while stack:
+            path, inode = stack.pop()
+            for name, ref, type in self._entries(inode):
+                child = path + "/" + name if path else name
+                is_dir = type in DIR_TYPES
+                if include is not None and not include(child, is_dir):
+                    continue
+                if is_dir:
+                    stack.append((child, self.inode(ref)))
+                elif type in FILE_TYPES:
+                    total += self.inode(ref).size
+        return total
+
+    # Dosya verisi
+
+    def _fragment(self, index):
+        cached_index, cached = self._fragment_cache
+        if cached_index == index:
+            return cached
+        sb = self.superblock
+        if index >= sb.fragment_count:
+            raise SquashFSError("fragment index out of range")
+        table, = struct.unpack("<Q", self._pread(sb.fragment_table + 8 * (index // 512), 8))
+        start, size, _ = struct.unpack("<QII", self._read_metadata(table, (index % 512) * 16, 16))
+        data = self._block(start, size, sb.block_size)
+        self._fragment_cache = (index, data)
+        return data
+
+    def iter_file(self, inode):
+        """Bir dosyanın içeriğini blok blok üretir."""
+        if not inode.is_file():
+            raise SquashFSError("not a regular file")
+        block_size = self.superblock.block_size
+        pos, remaining = inode.blocks_start, inode.size
+        for size_field in inode.block_sizes:
+            expected = min(block_size, remaining)
+            data = self._block(pos, size_field, expected)[:expected]
+            pos += size_field & 0xFFFFFF
+            remaining -= len(data)
+            yield data
+        if remaining > 0 and inode.fragment != NO_FRAGMENT:
+            fragment = self._fragment(inode.fragment)
+            yield fragment[inode.fragment_offset:inode.fragment_offset + remaining]
+
+    def read_bytes(self, path):
+        """İmaj içindeki bir dosyayı (sembolik bağları izleyerek) okur."""
+        return b"".join(self.iter_file(self.lookup(path)))
+
+    def extract_file(self, path, dest):
+        """Tek bir dosyayı sembolik bağlarını çözerek dest altına yazar."""
+        inode = self.lookup(path)
+        target = os.path.join(dest, *path.split("/"))
+        os.makedirs(os.path.dirname(target), exist_ok=True)
+        mode = 0o755 if inode.mode & stat.S_IXUSR else 0o644
+        fd = os.open(target, os.O_WRONLY | os.O_CREAT | os.O_TRUNC | os.O_NOFOLLOW, mode)
+        with os.fdopen(fd, "wb") as f:
+            for chunk in self.iter_file(inode):
+                f.write(chunk)
+        return target
+
+    def extract_tree(self, dest):
+        """İmajın tamamını dest altına çıkarır ve yazılan bayt sayısını döndürür.
+
+        Sembolik bağlar olduğu gibi oluşturulur, izinler korunur; setuid ve
+        setgid bitleri ile aygıt dosyaları, FIFO'lar ve soketler atlanır.
+        Dizin izinleri içerikleri yazıldıktan sonra uygulanır.
+        """
+        total = 0
+        os.makedirs(dest, exist_ok=True)
+        stack = [(dest, self.root)]
+        directories = []
+        while stack:
+            base, inode = stack.pop()
+            for name, ref, _ in self._entries(inode):
+                child = self.inode(ref)
+                target = os.path.join(base, name)
+                if child.is_dir():
+                    os.mkdir(target, 0o700)
+                    directories.append((target, child.mode & 0o777))
+                    stack.append((target, child))
+                elif child.is_symlink():
+                    os.symlink(child.target, target)
+                elif child.is_file():
+                    fd = os.open(target, os.O_WRONLY | os.O_CREAT | os.O_EXCL | os.O_NOFOLLOW, 0o600)
+                    with os.fdopen(fd, "wb") as f:
+                        for chunk in self.iter_file(child):
+                            f.write(chunk)
+                    os.chmod(target, child.mode & 0o777)
+                    total += child.size
+        for path, mode in reversed(directories):
+            os.chmod(path, mode | stat.S_IRWXU)
+        return total
@@ -0,0 +1,289 @@
+"""Kurulu uygulama kayıtlarını tutan SQLite tabanlı depo.
+
+Kayıtlar uygulama adına göre saklanır; içerik özeti ve kurulum yolu için
+ayrıca indeks tutulur. Yazmalar SQLite kilidiyle korunan işlemler içinde
+yapıldığından aynı anda çalışan birden çok appimage-installer süreci
+birbirinin güncellemesini ezmez.
+"""
+import json
+import os
+import sqlite3
+import stat
+from contextlib import contextmanager
+
+SCHEMA_VERSION = 2
+LOCK_TIMEOUT = 30  # saniye
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS meta (
+    key TEXT PRIMARY KEY,
+    value TEXT
+);
+CREATE TABLE IF NOT EXISTS apps (
+    name TEXT PRIMARY KEY,
+    version TEXT,
+    sha256 TEXT,
+    install_path TEXT,
+    source_path TEXT,
+    data TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS apps_sha256 ON apps (sha256);
+CREATE INDEX IF NOT EXISTS apps_install_path ON apps (install_path);
+CREATE TABLE IF NOT EXISTS digests (
+    device INTEGER NOT NULL,
+    inode INTEGER NOT NULL,
+    size INTEGER NOT NULL,
+    mtime_ns INTEGER NOT NULL,
+    sha256 TEXT NOT NULL,
+    PRIMARY KEY (device, inode)
+);
+CREATE TABLE IF NOT EXISTS file_states (
+    path TEXT PRIMARY KEY,
+    device INTEGER NOT NULL,
+    inode INTEGER NOT NULL,
+    size INTEGER NOT NULL,
+    mtime_ns INTEGER NOT NULL,
+    value TEXT
+);
+"""
+# Sürüm 2'de eklenen sütun eski depolarda önce oluşturulmalıdır
+SOURCE_PATH_INDEX = "CREATE INDEX IF NOT EXISTS apps_source_path ON apps (source_path)"
+
+# query() ile filtrelenebilen ve kayıt çözülmeden okunabilen sütunlar
+INDEXED_COLUMNS = ("name", "version", "sha256", "install_path", "source_path")
+
+
+def _encode(entry):
+    return json.dumps(entry, sort_keys=True)
+
+
+def _indexed_fields(entry):
+    """Kayıttan indekslenen alanları (sürüm, özet, kurulum yolu, kaynak yol) çıkarır."""
+    sha256 = install_path = None
+    for item in entry.get("files") or ():
+        if item.get("type") == "AppImage":
+            sha256, install_path = item.get("sha256"), item.get("path")
+            break
+    return entry.get("version"), sha256, install_path, entry.get("path")
+
+
+class Versions(dict):
+    """Depodan okunan kayıtlar.
+
+    Okunduğu andaki hâli saklanır; kaydedilirken yalnızca eklenen,
+    değişen ve silinen kayıtlar yazılır. Böylece aynı anda farklı
+    uygulamaları güncelleyen süreçler birbirinin değişikliğini silmez.
+    """
+
+    def __init__(self, entries=()):
+        super().__init__(entries)
+        self.snapshot = {name: _encode(entry) for name, entry in self.items()}
+
+
+class VersionStore:
+    """Uygulama kayıtları için kilit güvenli depo."""
+
+    def __init__(self, path, legacy_json=None):
+        self.path = path
+        self.legacy_json = legacy_json
+        self._conn = None
+
+    def _connect(self):
+        if self._conn is not None:
+            return self._conn
+        os.makedirs(os.path.dirname(self.path), exist_ok=True)
+        created = not os.path.exists(self.path)
+        if not created:
+            st = os.stat(self.path)
+            if not stat.S_ISREG(st.st_mode):
+                raise ValueError("Not a regular file: " + self.path)
+            if st.st_uid != os.getuid():
+                raise ValueError("File not owned by current user: " + self.path)
+        conn = sqlite3.connect(self.path, timeout=LOCK_TIMEOUT, isolation_level=None)
+        if created:
+            os.chmod(self.path, 0o600)
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn = conn
+        with self.transaction():
+            # executescript örtük COMMIT yaptığından komutlar tek tek çalıştırılır
+            for statement in SCHEMA.split(";"):
+                if statement.strip():
+                    conn.execute(statement)
+            row = conn.execute("SELECT value FROM meta WHERE key = 'schema_version'").fetchone()
+            if row is None:
+                conn.execute("INSERT INTO meta (key, value) VALUES ('schema_version', ?)",
+                             (str(SCHEMA_VERSION),))
+                self._import_legacy(conn)
+            elif int(row[0]) < SCHEMA_VERSION:
+                self._migrate(conn)
+            conn.execute(SOURCE_PATH_INDEX)
+        return conn
+
+    @staticmethod
+    def _migrate(conn):
+        """Eski şemadaki depoya kaynak yol sütununu ekler ve doldurur."""
+        columns = {row[1] for row in conn.execute("PRAGMA table_info(apps)")}
+        if "source_path" not in columns:
+            conn.execute("ALTER TABLE apps ADD COLUMN source_path TEXT")
+        for name, data in conn.execute("SELECT name, data FROM apps").fetchall():
+            conn.execute("UPDATE apps SET source_path = ? WHERE name = ?",
+                         (json.loads(data).get("path"), name))
+        conn.execute("UPDATE meta SET value = ? WHERE key = 'schema_version'", (str(SCHEMA_VERSION),))
+
+    def _import_legacy(self, conn):
+        """Eski appimage-versions.json dosyasındaki kayıtları içe aktarır."""
+        if not self.legacy_json or not os.path.isfile(self.legacy_json):
+            return
+        with open(self.legacy_json, "r", encoding="utf-8") as f:
+            content = f.read()
+        entries = json.loads(content) if content.strip() else {}
+        for name, entry in entries.items():
+            self._put(conn, name, entry)
+        conn.execute("INSERT OR REPLACE INTO meta (key, value) VALUES ('imported_from', ?)",
+                     (self.legacy_json,))
+
+    def close(self):
+        if self._conn is not None:
+            self._conn.close()
+            self._conn = None
+
+    @contextmanager
+    def transaction(self):
+        """Yazma kilidini alarak bir işlem başlatır."""
+        conn = self._conn if self._conn is not None else self._connect()
+        if conn.in_transaction:
+            yield conn
+            return
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            yield conn
+        except BaseException:
+            conn.execute("ROLLBACK")
+            raise
+        conn.execute("COMMIT")
+
+    @staticmethod
+    def _put(conn, name, entry):
+        version, sha256, install_path, source_path = _indexed_fields(entry)
+        conn.execute(
+            "INSERT OR REPLACE INTO apps (name, version, sha256, install_path, source_path, data) "
+            "VALUES (?, ?, ?, ?, ?, ?)",
+            (name, version, sha256, install_path, source_path, _encode(entry)))
+
+    # Okuma
+
+    def load(self):
+        """Tüm kayıtları tek sorguda okur."""
+        rows = self._connect().execute("SELECT name, data FROM apps ORDER BY name")
+        return Versions((name, json.loads(data)) for name, data in rows)
+
+    def items(self):
+        """Kayıtları ada göre sıralı olarak tek tek üretir."""
+        for name, data in self._connect().execute("SELECT name, data FROM apps ORDER BY name"):
+            yield name, json.loads(data)
+
+    def query(self, filters=None, decode=True):
+        """Filtrelere uyan kayıtları ada göre sıralı olarak tek tek üretir.
+
+        filters {sütun: glob deseni} biçimindedir; desenler indeksli
+        sütunlarda SQLite GLOB ile eşleştirilir. (indeksli sütunlar, kayıt)
+        çiftleri üretilir; decode False ise kayıt çözülmez ve None döner.
+        """
+        clauses, params = [], []
+        for column, pattern in (filters or {}).items():
+            if column not in INDEXED_COLUMNS:
+                raise ValueError("cannot filter on " + column)
+            clauses.append(f"{column} GLOB ?")
+            params.append(pattern)
+        sql = "SELECT {}{} FROM apps".format(", ".join(INDEXED_COLUMNS), ", data" if decode else "")
+        if clauses:
+            sql += " WHERE " + " AND ".join(clauses)
+        for row in self._connect().execute(sql + " ORDER BY name", params):
+            yield dict(zip(INDEXED_COLUMNS, row)), json.loads(row[-1]) if decode else None
+
+    def get(self, name):
+        row = self._connect().execute("SELECT data FROM apps WHERE name = ?", (name,)).fetchone()
+        return json.loads(row[0]) if row else None
+
+    def find_by_hash(self, sha256):
+        """Verilen içerik özetine sahip kayıtları döndürür."""
+        rows = self._connect().execute("SELECT name, data FROM apps WHERE sha256 = ?", (sha256,))
+        return [(name, json.loads(data)) for name, data in rows]
+
+    def find_by_path(self, install_path):
+        """Verilen kurulum yoluna sahip kaydı döndürür."""
+        row = self._connect().execute("SELECT name, data FROM apps WHERE install_path = ?",
+                                      (install_path,)).fetchone()
+        return (row[0], json.loads(row[1])) if row else None
+
+    def cached_digest(self, st):
+        """os.stat sonucu değişmemiş bir dosya için kayıtlı özeti döndürür."""
+        row = self._connect().execute(
+            "SELECT sha256 FROM digests WHERE device = ? AND inode = ? AND size = ? AND mtime_ns = ?",
+            (st.st_dev, st.st_ino, st.st_size, st.st_mtime_ns)).fetchone()
+        return row[0] if row else None
+
+    def file_states(self):
+        """sync denetiminin dosya başına sakladığı sonuçları döndürür.
+
+        {yol: ((cihaz, inode, boyut, mtime), değer)} biçimindedir.
+        """
+        rows = self._connect().execute(
+            "SELECT path, device, inode, size, mtime_ns, value FROM file_states")
+        return {path: ((device, inode, size, mtime_ns), value)
+                for path, device, inode, size, mtime_ns, value in rows}
+
+    # Yazma
+
+    def update_file_states(self, changed, removed=()):
+        """Değişen dosya sonuçlarını yazar, artık görülmeyenleri siler."""
+        if not changed and not removed:
+            return
+        with self.transaction() as conn:
+            conn.executemany("DELETE FROM file_states WHERE path = ?", ((path,) for path in removed))
+            conn.executemany(
+                "INSERT OR REPLACE INTO file_states (path, device, inode, size, mtime_ns, value) "
+                "VALUES (?, ?, ?, ?, ?, ?)",
+                ((path,) + tuple(key) + (value,) for path, (key, value) in changed.items()))
+
+    def remember_digest(self, st, sha256):
+        """Bir dosyanın özetini (cihaz, inode, boyut, mtime) anahtarıyla kaydeder."""
+        with self.transaction() as conn:
+            conn.execute("INSERT OR REPLACE INTO digests (device, inode, size, mtime_ns, sha256) "
+                         "VALUES (?, ?, ?, ?, ?)",
+                         (st.st_dev, st.st_ino, st.st_size, st.st_mtime_ns, sha256))
+
+    def put(self, name, entry):
+        with self.transaction() as conn:
+            self._put(conn, name, entry)
+
+    def delete(self, name):
+        with self.transaction() as conn:
+            conn.execute("DELETE FROM apps WHERE name = ?", (name,))
+
+    def save(self, versions):
+        """Kayıtları tek bir işlemde kaydeder.
+
+        versions load() ile okunmuşsa yalnızca farklar uygulanır; düz bir
+        sözlük verilirse depo içeriği onunla değiştirilir.
+        """
+        snapshot = getattr(versions, "snapshot", None)
+        with self.transaction() as conn:
+            if snapshot is None:
+                names = set(versions)
+                for (name,) in conn.execute("SELECT name FROM apps").fetchall():
+                    if name not in names:
+                        conn.execute("DELETE FROM apps WHERE name = ?", (name,))
+                for name, entry in versions.items():
+                    self._put(conn, name, entry)
+                return
+            for name in snapshot:
+                if name not in versions:
+                    conn.execute("DELETE FROM apps WHERE name = ?", (name,))
+            for name, entry in versions.items():
+                encoded = _encode(entry)
+                if snapshot.get(name) != encoded:
+                    self._put(conn, name, entry)
+        if snapshot is not None:
+            versions.snapshot = {name: _encode(entry) for name, entry in versions.items()}
@@ -0,0 +1,100 @@
+"""Kurulum ve kaldırma aşamaları için süre ve kaynak ölçümü.
+
+Ölçüm kapalıyken stage() hiçbir iş yapmaz; açıkken her aşama için duvar
+saati süresi, /proc/self/io üzerinden okunan/yazılan bayt sayısı ve o ana
+kadarki en yüksek bellek kullanımı (RSS) kaydedilir.
+"""
+import os
+import time
+from contextlib import contextmanager
+
+
+def _io_counters():
+    """Sürecin okuduğu ve yazdığı toplam bayt sayısını döndürür."""
+    read = written = 0
+    try:
+        with open("/proc/self/io", "rb") as f:
+            for line in f:
+                if line.startswith(b"rchar:"):
+                    read = int(line.split()[1])
+                elif line.startswith(b"wchar:"):
+                    written = int(line.split()[1])
+    except OSError:
+        pass
+    return read, written
+
+
+def _peak_rss_kb():
+    """Sürecin ve beklenen alt süreçlerin en yüksek RSS değerini (KiB) döndürür."""
+    try:
+        import resource
+    except ImportError:
+        return 0
+    return max(resource.getrusage(resource.RUSAGE_SELF).ru_maxrss,
+               resource.getrusage(resource.RUSAGE_CHILDREN).ru_maxrss)
+
+
+class Timings:
+    """Aşama ölçümlerini toplar."""
+
+    def __init__(self):
+        self.enabled = False
+        self.records = []
+        self.pid = os.getpid()
+
+    def enable(self):
+        self.enabled = True
+        self.pid = os.getpid()
+
+    @contextmanager
+    def stage(self, name, target=None):
+        """Bir aşamayı ölçer; hata olsa bile kayıt eklenir."""
+        if not self.enabled:
+            yield
+            return
+        read, written = _io_counters()
+        start = time.perf_counter()
+        ok = False
+        try:
+            yield
+            ok = True
+        finally:
+            end_read, end_written = _io_counters()
+            self.records.append({
+                "stage": name,
+                "target": target,
+                "wall_ms": round((time.perf_counter() - start) * 1000, 3),
+                "read_bytes": end_read - read,
+                "write_bytes": end_written - written,
+                "peak_rss_kb": _peak_rss_kb(),
+                "pid": os.getpid(),
+                "ok": ok
+            })
+
+    def export(self):
+        """Alt süreçte toplanan kayıtları ana sürece gönderilmek üzere döndürür.
+
+        Ana süreçte çağrılırsa kayıtlar yerinde kaldığından boş liste döner.
+        """
+        if os.getpid() == self.pid:
+            return []
+        records, self.records = self.records, []
+        return records
+
+    def merge(self, records):
+        self.records.extend(records or ())
+
+    def summary(self):
+        """Aşama adına göre toplanmış (sayı, süre, okunan, yazılan, RSS) satırları."""
+        totals = {}
+        for record in self.records:
+            row = totals.setdefault(record["stage"], [0, 0.0, 0, 0, 0])
+            row[0] += 1
+            row[1] += record["wall_ms"]
+            row[2] += record["read_bytes"]
+            row[3] += record["write_bytes"]
+            row[4] = max(row[4], record["peak_rss_kb"])
+        return [(stage,) + tuple(row) for stage, row in totals.items()]
+
+
+timings = Timings()
@@ -0,0 +1,475 @@
+"""AppImage güncellemeleri için saf Python zsync istemcisi.
+
+Gömülü güncelleme bilgisi (.upd_info) ".zsync" kontrol dosyasının adresini
+verir. Kontrol dosyası yeni sürümü sabit boyutlu bloklara böler ve her blok
+için bir kayan toplam (rsum) ile kısaltılmış bir MD4 özeti içerir. Kurulu
+kopya bu özetlerle taranır; eşleşen bloklar yerel dosyadan alınır, yalnızca
+eksik bloklar HTTP aralık istekleriyle indirilir ve sonuç SHA-1 ile
+doğrulanır.
+
+Desteklenen güncelleme bilgisi biçimleri::
+
+    zsync|https://example.com/App-latest-x86_64.AppImage.zsync
+    gh-releases-zsync|sahip|depo|latest|App-*-x86_64.AppImage.zsync
+"""
+import hashlib
+import mmap
+import os
+import struct
+from itertools import accumulate, compress, repeat
+from operator import and_, lshift, mul, or_, sub
+
+USER_AGENT = "appimage-installer"
+GITHUB_API = os.environ.get("APPIMAGE_INSTALLER_GITHUB_API", "https://api.github.com")
+HTTP_TIMEOUT = 30  # saniye
+MAX_REDIRECTS = 5
+# Aradaki boşluk bu kadardan küçükse iki aralık tek istekte birleştirilir
+RANGE_MERGE_BYTES = 64 * 1024
+MAX_RANGE_BYTES = 16 * 1024 * 1024
+# Eşleşme aranırken tek seferde taranan pencere sayısı
+SCAN_WINDOW = 256 * 1024
+COPY_BUFFER_SIZE = 1024 * 1024
+
+
+class ZsyncError(ValueError):
+    """Okunamayan kontrol dosyaları ve başarısız güncellemeler için hata."""
+
+
+class RangeNotSupported(ZsyncError):
+    """Sunucu aralık isteklerini desteklemiyor."""
+
+
+# MD4 (RFC 1320). OpenSSL 3 ile hashlib çoğu sistemde MD4 sunmaz.
+
+def _rotl(x, n):
+    x &= 0xFFFFFFFF
+    return ((x << n) | (x >> (32 - n))) & 0xFFFFFFFF
+
+
+def _md4_pure(data):
+    length = len(data)
+    data = bytes(data) + b"\x80" + b"\0" * ((55 - length) % 64) + struct.pack("<Q", length * 8)
+    h0, h1, h2, h3 = 0x67452301, 0xEFCDAB89, 0x98BADCFE, 0x10325476
+    for offset in range(0, len(data), 64):
+        x = struct.unpack_from("<16I", data, offset)
+        a, b, c, d = h0, h1, h2, h3
+        for i in (0, 4, 8, 12):
+            a = _rotl(a + ((b & c) | (~b & d)) + x[i], 3)
+            d = _rotl(d + ((a & b) | (~a & c)) + x[i + 1], 7)
+            c = _rotl(c + ((d & a) | (~d & b)) + x[i + 2], 11)
+            b = _rotl(b + ((c & d) | (~c & a)) + x[i + 3], 19)
+        for i in (0, 1, 2, 3):
+            a = _rotl(a + ((b & c) | (b & d) | (c & d)) + x[i] + 0x5A827999, 3)
+            d = _rotl(d + ((a & b) | (a & c) | (b & c)) + x[i + 4] + 0x5A827999, 5)
+            c = _rotl(c + ((d & a) | (d & b) | (a & b)) + x[i + 8] + 0x5A827999, 9)
+            b = _rotl(b + ((c & d) | (c & a) | (d & a)) + x[i + 12] + 0x5A827999, 13)
+        for i in (0, 2, 1, 3):
+            a = _rotl(a + (b ^ c ^ d) + x[i] + 0x6ED9EBA1, 3)
+            d = _rotl(d + (a ^ b ^ c) + x[i + 8] + 0x6ED9EBA1, 9)
+            c = _rotl(c + (d ^ a ^ b) + x[i + 4] + 0x6ED9EBA1, 11)
+            b = _rotl(b + (c ^ d ^ a) + x[i + 12] + 0x6ED9EBA1, 15)
+        h0, h1 = (h0 + a) & 0xFFFFFFFF, (h1 + b) & 0xFFFFFFFF
+        h2, h3 = (h2 + c) & 0xFFFFFFFF, (h3 + d) & 0xFFFFFFFF
+    return struct.pack("<4I", h0, h1, h2, h3)
+
+
+def _libcrypto_md4():
+    """libcrypto'daki düşük seviyeli MD4 fonksiyonunu döndürür; yoksa None."""
+    try:
+        import ctypes
+        import ctypes.util
+
+        name = ctypes.util.find_library("crypto")
+        if not name:
+            return None
+        function = ctypes.CDLL(name).MD4
+    except (ImportError, OSError, AttributeError):
+        return None
+    function.restype = ctypes.c_void_p
+    function.argtypes = (ctypes.c_char_p, ctypes.c_size_t, ctypes.c_char_p)
+    out = ctypes.create_string_buffer(16)
+
+    def digest(data):
+        data = bytes(data)
+        function(data, len(data), out)
+        return out.raw
+
+    return digest
+
+
+def _select_md4():
+    try:
+        hashlib.new("md4")
+        return lambda data: hashlib.new("md4", data).digest()
+    except ValueError:
+        return _libcrypto_md4() or _md4_pure
+
+
+_md4 = None
+
+
+def md4(data):
+    """Verinin MD4 özetini döndürür.
+
+    Sırasıyla hashlib, libcrypto ve saf Python uygulaması denenir.
+    """
+    global _md4
+    if _md4 is None:
+        _md4 = _select_md4()
+    return _md4(data)
+
+
+def rsum(block):
+    """zsync kayan toplamını (a << 16 | b) döndürür."""
+    a = sum(block) & 0xFFFF
+    b = sum(accumulate(block)) & 0xFFFF
+    return (a << 16) | b
+
+
+class ControlFile:
+    """Ayrıştırılmış .zsync kontrol dosyası."""
+
+    def __init__(self, raw, url=None):
+        header_end = raw.find(b"\n\n")
+        if header_end < 0:
+            raise ZsyncError("invalid zsync control file")
+        self.headers = {}
+        for line in raw[:header_end].decode("utf-8", "replace").splitlines():
+            if ":" in line:
+                key, value = line.split(":", 1)
+                self.headers[key.strip()] = value.strip()
+        try:
+            self.blocksize = int(self.headers["Blocksize"])
+            self.length = int(self.headers["Length"])
+            seq, rsum_bytes, checksum_bytes = (int(v) for v in self.headers["Hash-Lengths"].split(","))
+            self.sha1 = self.headers["SHA-1"].lower()
+        except (KeyError, ValueError):
+            raise ZsyncError("incomplete zsync control file")
+        if self.blocksize <= 0 or not 1 <= rsum_bytes <= 4 or not 3 <= checksum_bytes <= 16:
+            raise ZsyncError("unsupported zsync hash lengths")
+        self.seq_matches = seq
+        self.rsum_bytes = rsum_bytes
+        self.checksum_bytes = checksum_bytes
+        self.rsum_mask = (1 << (8 * rsum_bytes)) - 1
+        self.filename = self.headers.get("Filename")
+        self.url = self.headers.get("URL")
+        if url and self.url:
+            from urllib.parse import urljoin
+            self.url = urljoin(url, self.url)
+
+        count = (self.length + self.blocksize - 1) // self.blocksize
+        entry = rsum_bytes + checksum_bytes
+        data = raw[header_end + 2:]
+        if len(data) < count * entry:
+            raise ZsyncError("truncated zsync control file")
+        self.blocks = []
+        for i in range(count):
+            item = data[i * entry:(i + 1) * entry]
+            key = int.from_bytes(item[:rsum_bytes], "big")
+            self.blocks.append((key, item[rsum_bytes:]))
+
+    def block_range(self, first, last):
+        """[first, last) bloklarının dosyadaki bayt aralığını döndürür."""
+        return first * self.blocksize, min(last * self.blocksize, self.length)
+
+
+def parse_update_info(info):
+    """Güncelleme bilgisini (tür, alanlar) çiftine ayırır."""
+    parts = info.strip().split("|")
+    kind = parts[0]
+    if kind == "zsync" and len(parts) == 2:
+        return kind, parts[1:]
+    if kind == "gh-releases-zsync" and len(parts) == 5:
+        return kind, parts[1:]
+    raise ZsyncError(f"unsupported update information: {kind}")
+
+
+class HTTPClient:
+    """Sunucu başına bağlantıyı yeniden kullanan küçük HTTP istemcisi."""
+
+    def __init__(self, timeout=HTTP_TIMEOUT):
+        self.timeout = timeout
+        self._connections = {}
+        self.downloaded = 0
+
+    def _connection(self, scheme, netloc):
+        import http.client
+
+        key = (scheme, netloc)
+        conn = self._connections.get(key)
+        if conn is None:
+            if scheme == "https":
+                conn = http.client.HTTPSConnection(netloc, timeout=self.timeout)
+            elif scheme == "http":
+                conn = http.client.HTTPConnection(netloc, timeout=self.timeout)
+            else:
+                raise ZsyncError(f"unsupported URL scheme: {scheme}")
+            self._connections[key] = conn
+        return conn
+
+    def close(self):
+        for conn in self._connections.values():
+            conn.close()
+        self._connections.clear()
+
+    def open(self, url, headers=None):
+        """İsteği yönlendirmeleri izleyerek gönderir; (yanıt, son adres) döndürür.
+
+        Yanıt gövdesi çağıran tarafından sonuna kadar okunmalıdır.
+        """
+        import http.client
+        from urllib.parse import urljoin, urlsplit
+
+        headers = dict(headers or {}, **{"User-Agent": USER_AGENT})
+        for _attempt in range(MAX_REDIRECTS + 1):
+            parts = urlsplit(url)
+            path = parts.path or "/"
+            if parts.query:
+                path += "?" + parts.query
+            conn = self._connection(parts.scheme, parts.netloc)
+            try:
+                conn.request("GET", path, headers=headers)
+                response = conn.getresponse()
+            except (http.client.HTTPException, OSError):
+                # Sunucu bekleyen bağlantıyı kapatmış olabilir; bir kez yeniden dene
+                conn.close()
+                conn.request("GET", path, headers=headers)
+                response = conn.getresponse()
+            if response.status in (301, 302, 303, 307, 308):
+                location = response.getheader("Location")
+                response.read()
+                if not location:
+                    break
+                url = urljoin(url, location)
+                continue
+            if response.status >= 400:
+                response.read()
+                raise ZsyncError(f"HTTP {response.status} for {url}")
+            return response, url
+        raise ZsyncError(f"too many redirects for {url}")
+
+    def get(self, url, headers=None):
+        """Adresin içeriğini ve son adresini döndürür."""
+        response, url = self.open(url, headers)
+        body = response.read()
+        self.downloaded += len(body)
+        return body, url
+
+    def get_range(self, url, start, end):
+        """[start, end) aralığını indirir; sunucu aralığı desteklemiyorsa hata verir."""
+        response, _url = self.open(url, {"Range": f"bytes={start}-{end - 1}"})
+        if response.status != 206:
+            response.close()
+            self.close()
+            raise RangeNotSupported(url)
+        body = response.read()
+        self.downloaded += len(body)
+        if len(body) != end - start:
+            raise ZsyncError("short range response")
+        return body
+
+    def download(self, url, fd):
+        """Adresin tamamını açık dosyaya akış hâlinde yazar."""
+        response, _url = self.open(url)
+        while True:
+            chunk = response.read(COPY_BUFFER_SIZE)
+            if not chunk:
+                break
+            os.write(fd, chunk)
+            self.downloaded += len(chunk)
+
+
+def resolve_control_url(info, client):
+    """Güncelleme bilgisinden .zsync dosyasının adresini bulur."""
+    import fnmatch
+    import json
+
+    kind, fields = parse_update_info(info)
+    if kind == "zsync":
+        return fields[0]
+
+    owner, repo, tag, pattern = fields
+    release = "latest" if tag == "latest" else f"tags/{tag}"
+    body, _url = client.get(f"{GITHUB_API.rstrip('/')}/repos/{owner}/{repo}/releases/{release}",
+                            {"Accept": "application/vnd.github+json"})
+    for asset in json.loads(body).get("assets", ()):
+        if fnmatch.fnmatch(asset.get("name", ""), pattern):
+            return asset["browser_download_url"]
+    raise ZsyncError(f"no release asset matches {pattern}")
+
+
+class _Seed:
+    """Kurulu kopya üzerinde blok eşleştirici."""
+
+    def __init__(self, control, data):
+        self.control = control
+        self.data = data
+        self.size = len(data)
+        blocks = control.blocks
+        # Aynı içerikli bloklar tek eşleşmeyle birlikte işaretlenir
+        self.same = {}
+        for index, block in enumerate(blocks):
+            self.same.setdefault(block, []).append(index)
+        # seq_matches > 1 ise ardışık iki bloğun rsum'u birlikte aranır
+        self.paired = control.seq_matches > 1 and len(blocks) > 1
+        self.targets = {}
+        for index, (key, _checksum) in enumerate(blocks):
+            if self.paired:
+                if index + 1 == len(blocks):
+                    break
+                key = (key << 32) | blocks[index + 1][0]
+            self.targets.setdefault(key, []).append(index)
+
+    def window(self, pos):
+        n = self.control.blocksize
+        block = self.data[pos:pos + n]
+        return block + bytes(n - len(block)) if len(block) < n else block
+
+    def verify(self, pos, indexes, found):
+        """Konumdaki blok adaylardan biriyle eşleşiyorsa onu ve eşlerini işaretler.
+
+        Eşleşen bloğun numarasını, eşleşme yoksa None döndürür.
+        """
+        checksum = md4(self.window(pos))[:self.control.checksum_bytes]
+        for index in indexes:
+            block = self.control.blocks[index]
+            if block[1] == checksum:
+                for same in self.same[block]:
+                    found.setdefault(same, pos)
+                return index
+        return None
+
+    def scan(self, start, end):
+        """[start, end) konumlarından rsum'u hedeflerle eşleşenleri sırayla üretir.
+
+        (konum, aday blok numaraları) çiftleri döner. Toplamlar önek
+        toplamlarıyla C düzeyinde hesaplanır; bayt başına Python döngüsü
+        yoktur.
+        """
+        n = self.control.blocksize
+        m = end - start
+        count = m + n if self.paired else m
+        segment = self.data[start:start + count + n - 1]
+        if len(segment) < count + n - 1:
+            segment += bytes(count + n - 1 - len(segment))
+        p = [0]
+        p.extend(accumulate(segment))
+        s = [0]
+        s.extend(accumulate(p))
+        a = map(and_, map(sub, p[n:n + count], p[:count]), repeat(0xFFFF))
+        b = map(and_, map(sub, map(sub, s[n + 1:n + 1 + count], s[1:count + 1]),
+                          map(mul, p[:count], repeat(n))), repeat(0xFFFF))
+        keys = list(map(and_, map(or_, map(lshift, a, repeat(16)), b),
+                        repeat(self.control.rsum_mask)))
+        if self.paired:
+            keys = list(map(or_, map(lshift, keys[:m], repeat(32)), keys[n:n + m]))
+        targets = self.targets
+        for i in compress(range(m), map(targets.__contains__, keys)):
+            yield start + i, targets[keys[i]]
+
+    def match(self):
+        """Kurulu kopyada bulunan blokları {blok: ofset} olarak döndürür."""
+        n = self.control.blocksize
+        blocks = self.control.blocks
+        mask = self.control.rsum_mask
+        total = len(blocks)
+        found = {}
+        pos = 0
+        expected = None
+        while pos < self.size and len(found) < total:
+            # Bir eşleşmenin ardından genellikle sıradaki blok gelir
+            if expected is not None and expected < total:
+                if (rsum(self.window(pos)) & mask == blocks[expected][0]
+                        and self.verify(pos, (expected,), found) is not None):
+                    pos += n
+                    expected += 1
+                    continue
+            end = min(pos + SCAN_WINDOW, self.size)
+            next_pos, expected = end, None
+            for candidate, indexes in self.scan(pos, end):
+                index = self.verify(candidate, indexes, found)
+                if index is not None:
+                    next_pos, expected = candidate + n, index + 1
+                    break
+            pos = next_pos
+        return found
+
+
+def _missing_ranges(control, found):
+    """İndirilmesi gereken blokları birleştirilmiş bayt aralıkları olarak döndürür."""
+    merge_blocks = max(1, RANGE_MERGE_BYTES // control.blocksize)
+    max_blocks = max(1, MAX_RANGE_BYTES // control.blocksize)
+    ranges = []
+    for index in range(len(control.blocks)):
+        if index in found:
+            continue
+        if ranges and index - ranges[-1][1] <= merge_blocks and index - ranges[-1][0] < max_blocks:
+            ranges[-1][1] = index + 1
+        else:
+            ranges.append([index, index + 1])
+    return ranges
+
+
+def file_sha1(path):
+    h = hashlib.sha1()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(COPY_BUFFER_SIZE), b""):
+            h.update(chunk)
+    return h.hexdigest()
+
+
+def synchronize(control, seed_path, dest_path, client):
+    """Yeni sürümü kurulu kopyadan ve eksik bloklardan dest_path'e yazar.
+
+    Sunucu aralık isteklerini desteklemiyorsa ya da birleştirilen dosya
+    doğrulanamazsa dosyanın tamamı indirilir. Yerelden alınan ve indirilen
+    bayt sayılarını içeren bir sözlük döndürür.
+    """
+    if not control.url:
+        raise ZsyncError("zsync control file has no URL")
+    n = control.blocksize
+    reused = 0
+    fd = os.open(dest_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+    try:
+        with open(seed_path, "rb") as seed_file:
+            size = os.fstat(seed_file.fileno()).st_size
+            data = mmap.mmap(seed_file.fileno(), 0, prot=mmap.PROT_READ) if size else b""
+            try:
+                seed = _Seed(control, data)
+                found = seed.match()
+                for index, pos in found.items():
+                    start, end = control.block_range(index, index + 1)
+                    os.pwrite(fd, seed.window(pos)[:end - start], start)
+                    reused += end - start
+            finally:
+                if size:
+                    data.close()
+
+        downloaded_before = client.downloaded
+        try:
+            for first, last in _missing_ranges(control, found):
+                start, end = control.block_range(first, last)
+                body = client.get_range(control.url, start, end)
+                # Birleştirilen aralıkta yerelden alınmış bloklar yeniden yazılmaz
+                for index in range(first, last):
+                    if index not in found:
+                        block_start, block_end = control.block_range(index, index + 1)
+                        os.pwrite(fd, body[block_start - start:block_end - start], block_start)
+            os.ftruncate(fd, control.length)
+            complete = file_sha1(dest_path) == control.sha1
+        except RangeNotSupported:
+            complete = False
+
+        if not complete:
+            # Tam indirmeye geri dön
+            reused = 0
+            os.ftruncate(fd, 0)
+            os.lseek(fd, 0, os.SEEK_SET)
+            client.download(control.url, fd)
+            if file_sha1(dest_path) != control.sha1:
+                raise ZsyncError("downloaded file does not match the zsync checksum")
+        os.fsync(fd)
+    finally:
+        os.close(fd)
+    return {"reused": reused, "downloaded": client.downloaded - downloaded_before,
+            "length": control.length, "blocks": len(control.blocks), "matched": len(found)}
@@ -0,0 +1,417 @@
+"""Benchmarklar için sahte AppImage üreteci.
+
+İki biçim desteklenir:
+
+* ``stub``: ``--appimage-extract`` argümanını anlayan ve dosya ağacını
+  kendi sonuna eklenmiş bir tar arşivinden çıkaran bir kabuk betiği.
+  ELF başlığı olmadığından yalnızca alt süreçle çıkarma ölçülebilir;
+  doğrulama ve kurulum bu biçimi reddeder.
+* ``squashfs``: küçük bir ELF başlığı ve arkasından gelen gerçek bir
+  SquashFS 4.0 imajı. ``mksquashfs`` kuruluysa o kullanılır; değilse
+  imaj bu dosyadaki saf Python yazıcıyla (gzip) oluşturulur.
+
+Örnek::
+
+    python benchmarks/generate.py -o /tmp/Big.AppImage --size 200 --files 5000
+"""
+import argparse
+import hashlib
+import io
+import os
+import random
+import shutil
+import struct
+import subprocess
+import tarfile
+import tempfile
+import time
+import zlib
+
+BLOCK_SIZE = 131072
+METADATA_SIZE = 8192
+ICON_SIZES = ("16x16", "32x32", "48x48", "128x128", "256x256")
+ICON_LAYOUTS = ("root", "hicolor", "both", "none")
+
+# appimagetool çalıştırıcısındaki bölümler ve boyutları
+UPDATE_INFO_SIZE = 1024
+RUNTIME_SECTIONS = ((".upd_info", UPDATE_INFO_SIZE), (".sha256_sig", 1024), (".sig_key", 8192),
+                    (".digest_md5", 16))
+
+# 1x1 boyutlu geçerli bir PNG
+PNG_PIXEL = bytes.fromhex(
+    "89504e470d0a1a0a0000000d4948445200000001000000010806000000"
+    "1f15c4890000000d49444154789c6360000002000001e221bc330000000049454e44ae426082")
+
+
+def elf_header(sections=()):
+    """AppImage type-2 sihirli sayısını taşıyan en küçük ELF64 başlığını üretir.
+
+    sections, (ad, içerik) çiftlerinden oluşur ve ELF bölüm tablosuna
+    eklenir (ör. .upd_info). Dönen baytların sonu bölüm tablosunun
+    sonudur; SquashFS imajı hemen arkasına eklenir.
+    """
+    names = b"\0.shstrtab\0" + b"".join(name.encode() + b"\0" for name, _ in sections)
+    body = bytearray()
+    headers = [b"\0" * 64]
+    data_start = 64
+    offset = data_start
+    name_offset = len(b"\0.shstrtab\0")
+    for name, content in sections:
+        headers.append(struct.pack("<IIQQQQIIQQ", name_offset, 1, 0, 0, offset, len(content),
+                                   0, 0, 1, 0))
+        name_offset += len(name) + 1
+        body += content
+        offset += len(content)
+    headers.append(struct.pack("<IIQQQQIIQQ", 1, 3, 0, 0, offset, len(names), 0, 0, 1, 0))
+    body += names
+    offset += len(names)
+    shoff = offset + (-offset) % 8
+    body += b"\0" * (shoff - offset)
+
+    header = bytearray(64)
+    header[:4] = b"\x7fELF"
+    header[4:7] = b"\x02\x01\x01"  # 64 bit, little endian, sürüm 1
+    header[8:11] = b"AI\x02"
+    struct.pack_into("<HHIQQQIHHHHHH", header, 16,
+                     2, 0x3E, 1, 0, 0, shoff, 0, 64, 0, 0, 64, len(headers), len(headers) - 1)
+    return bytes(header) + bytes(body) + b"".join(headers)
+
+
+def build_tree(name="Bench App", size_mb=10, files=1000, icon_layout="both", seed=0,
+               version=None):
+    """Sahte bir AppImage dosya ağacını sözlük olarak üretir.
+
+    Değerler dosya içeriği (bytes), sembolik bağ için ("link", hedef)
+    ya da alt dizin (dict) olabilir.
+    """
+    rng = random.Random(seed)
+    slug = name.lower().replace(" ", "-")
+    desktop = (f"[Desktop Entry]\nType=Application\nName={name}\nIcon={slug}\n"
+               f"Exec=AppRun\nCategories=Utility;\nMimeType=application/x-{slug};\n"
+               + (f"Version={version}\n" if version else "")).encode()
+    tree = {
+        "AppRun": b"#!/bin/sh\nexec \"$(dirname \"$0\")/usr/bin/app\" \"$@\"\n",
+        f"{slug}.desktop": ("link", f"usr/share/applications/{slug}.desktop"),
+        "usr": {
+            "bin": {"app": b"#!/bin/sh\necho benchmark\n"},
+            "share": {"applications": {f"{slug}.desktop": desktop}},
+            "lib": {},
+        },
+    }
+    if icon_layout in ("root", "both"):
+        tree[f"{slug}.png"] = PNG_PIXEL
+        tree[".DirIcon"] = ("link", f"{slug}.png")
+    if icon_layout in ("hicolor", "both"):
+        tree["usr"]["share"]["icons"] = {"hicolor": {
+            size: {"apps": {f"{slug}.png": PNG_PIXEL + size.encode()}} for size in ICON_SIZES}}
+
+    # Electron uygulamalarındaki node_modules benzeri derin bir ağaç
+    modules = tree["usr"]["lib"].setdefault("node_modules", {})
+    for i in range(files):
+        package = modules.setdefault(f"pkg{i // 50}", {"lib": {}})
+        package["lib"][f"file{i}.js"] = f"module.exports = {i};\n".encode() * rng.randint(1, 20)
+
+    # Dosyanın istenen boyuta ulaşması için sıkıştırılamayan dolgu
+    tree["usr"]["lib"]["payload.bin"] = rng.randbytes(max(0, size_mb * 1024 * 1024))
+    return tree
+
+
+def write_tree(tree, root):
+    """Sözlük biçimindeki ağacı diske yazar."""
+    os.makedirs(root, exist_ok=True)
+    for name, node in tree.items():
+        path = os.path.join(root, name)
+        if isinstance(node, dict):
+            write_tree(node, path)
+        elif isinstance(node, tuple):
+            os.symlink(node[1], path)
+        else:
+            with open(path, "wb") as f:
+                f.write(node)
+            if name in ("AppRun", "app"):
+                os.chmod(path, 0o755)
+
+
+class _MetadataWriter:
+    """SquashFS metadata bloklarını (8 KiB, gzip) biriktirir."""
+
+    def __init__(self):
+        self.output = bytearray()
+        self.buffer = bytearray()
+
+    def position(self):
+        return len(self.output), len(self.buffer)
+
+    def write(self, data):
+        self.buffer += data
+        while len(self.buffer) >= METADATA_SIZE:
+            self._flush(self.buffer[:METADATA_SIZE])
+            del self.buffer[:METADATA_SIZE]
+
+    def _flush(self, chunk):
+        compressed = zlib.compress(bytes(chunk), 9)
+        if len(compressed) < len(chunk):
+            self.output += struct.pack("<H", len(compressed)) + compressed
+        else:
+            self.output += struct.pack("<H", len(chunk) | 0x8000) + chunk
+
+    def finish(self):
+        if self.buffer:
+            self._flush(self.buffer)
+            self.buffer = bytearray()
+        return bytes(self.output)
+
+
+def build_squashfs(tree):
+    """Ağaçtan gzip sıkıştırmalı bir SquashFS 4.0 imajı üretir (saf Python)."""
+    image = bytearray(96)
+    fragments = []
+    fragment_buffer = bytearray()
+    inodes, directories = _MetadataWriter(), _MetadataWriter()
+
+    def flush_fragment():
+        if not fragment_buffer:
+            return
+        compressed = zlib.compress(bytes(fragment_buffer))
+        start = len(image)
+        if len(compressed) < len(fragment_buffer):
+            image.extend(compressed)
+            fragments.append((start, len(compressed)))
+        else:
+            image.extend(fragment_buffer)
+            fragments.append((start, len(fragment_buffer) | 0x1000000))
+        fragment_buffer.clear()
+
+    def write_data(content):
+        start, sizes = len(image), []
+        full = len(content) // BLOCK_SIZE
+        for i in range(full):
+            block = content[i * BLOCK_SIZE:(i + 1) * BLOCK_SIZE]
+            compressed = zlib.compress(block, 1)
+            if len(compressed) < len(block):
+                image.extend(compressed)
+                sizes.append(len(compressed))
+            else:
+                image.extend(block)
+                sizes.append(len(block) | 0x1000000)
+        tail = content[full * BLOCK_SIZE:]
+        fragment = (0xFFFFFFFF, 0)
+        if tail:
+            if len(fragment_buffer) + len(tail) > BLOCK_SIZE:
+                flush_fragment()
+            fragment = (len(fragments), len(fragment_buffer))
+            fragment_buffer.extend(tail)
+        return start, sizes, fragment
+
+    # Inode numaraları önce-kök sırasıyla atanır
+    counter = [0]
+
+    def assign(node):
+        counter[0] += 1
+        own = counter[0]
+        children = {}
+        if isinstance(node, dict):
+            for name in sorted(node):
+                children[name] = assign(node[name])
+        return own, node, children
+
+    root = assign(tree)
+    inode_count = counter[0]
+
+    def emit(entry, parent):
+        own, node, children = entry
+        if isinstance(node, dict):
+            refs = [(name, child[0], emit(child, own)) for name, child in children.items()]
+            listing_pos = directories.position()
+            listing = bytearray()
+            i = 0
+            while i < len(refs):
+                block = refs[i][2][0]
+                group = []
+                for ref in refs[i:i + 256]:
+                    if ref[2][0] != block:
+                        break
+                    group.append(ref)
+                base = group[0][1]
+                listing += struct.pack("<III", len(group) - 1, block, base)
+                for name, child_number, (_, offset, kind) in group:
+                    encoded = name.encode()
+                    listing += struct.pack("<HhHH", offset, child_number - base, kind,
+                                           len(encoded) - 1) + encoded
+                i += len(group)
+            directories.write(listing)
+            subdirs = sum(1 for child in children.values() if isinstance(child[1], dict))
+            position = inodes.position()
+            inodes.write(struct.pack("<HHHHII", 1, 0o755, 0, 0, 0, own) +
+                         struct.pack("<IIHHI", listing_pos[0], 2 + subdirs, len(listing) + 3,
+                                     listing_pos[1], parent))
+            return position[0], position[1], 1
+        if isinstance(node, tuple):
+            target = node[1].encode()
+            position = inodes.position()
+            inodes.write(struct.pack("<HHHHII", 3, 0o777, 0, 0, 0, own) +
+                         struct.pack("<II", 1, len(target)) + target)
+            return position[0], position[1], 3
+        start, sizes, fragment = write_data(node)
+        position = inodes.position()
+        inodes.write(struct.pack("<HHHHII", 2, 0o755, 0, 0, 0, own) +
+                     struct.pack("<IIII", start, fragment[0], fragment[1], len(node)) +
+                     b"".join(struct.pack("<I", size) for size in sizes))
+        return position[0], position[1], 2
+
+    root_ref = emit(root, inode_count + 1)
+    flush_fragment()
+
+    inode_table = len(image)
+    image += inodes.finish()
+    directory_table = len(image)
+    image += directories.finish()
+
+    fragment_writer = _MetadataWriter()
+    for start, size in fragments:
+        fragment_writer.write(struct.pack("<QII", start, size, 0))
+    fragment_blocks = fragment_writer.finish()
+    fragment_blocks_pos = len(image)
+    image += fragment_blocks
+    fragment_table = len(image)
+    pos = 0
+    while pos < len(fragment_blocks):
+        image += struct.pack("<Q", fragment_blocks_pos + pos)
+        header, = struct.unpack_from("<H", fragment_blocks, pos)
+        pos += 2 + (header & 0x7FFF)
+
+    id_writer = _MetadataWriter()
+    id_writer.write(struct.pack("<I", os.getuid()))
+    id_blocks_pos = len(image)
+    image += id_writer.finish()
+    id_table = len(image)
+    image += struct.pack("<Q", id_blocks_pos)
+
+    unused = 0xFFFFFFFFFFFFFFFF
+    struct.pack_into("<IIIIIHHHHHHQQQQQQQQ", image, 0,
+                     0x73717368, inode_count, int(time.time()), BLOCK_SIZE, len(fragments),
+                     1, BLOCK_SIZE.bit_length() - 1, 0, 1, 4, 0,
+                     (root_ref[0] << 16) | root_ref[1], len(image), id_table, unused,
+                     inode_table, directory_table, fragment_table if fragments else unused, unused)
+    image += b"\0" * ((-len(image)) % 4096)
+    return bytes(image)
+
+
+def runtime_sections(update_info=""):
+    """Gerçek çalıştırıcıdaki gibi boş imza ve özet bölümlerini döndürür."""
+    info = update_info.encode()
+    if len(info) > UPDATE_INFO_SIZE:
+        raise ValueError("update information too long")
+    return [(name, info.ljust(size, b"\0") if name == ".upd_info" else bytes(size))
+            for name, size in RUNTIME_SECTIONS]
+
+
+def make_squashfs_appimage(path, tree, sections=None, update_info=""):
+    """ELF başlığı ve SquashFS imajından oluşan bir type-2 AppImage yazar.
+
+    sections verilmezse çalıştırıcı bölümleri eklenir ve .digest_md5
+    bölümüne appimagetool'un yaptığı gibi dosyanın MD5 özeti yazılır.
+    """
+    if sections is None:
+        sections = runtime_sections(update_info)
+    mksquashfs = shutil.which("mksquashfs")
+    if mksquashfs:
+        temp_dir = tempfile.mkdtemp()
+        try:
+            write_tree(tree, os.path.join(temp_dir, "root"))
+            image_path = os.path.join(temp_dir, "image.sqfs")
+            subprocess.run([mksquashfs, os.path.join(temp_dir, "root"), image_path,
+                            "-comp", "gzip", "-all-root", "-noappend", "-quiet"],
+                           check=True, stdout=subprocess.DEVNULL)
+            with open(image_path, "rb") as f:
+                image = f.read()
+        finally:
+            shutil.rmtree(temp_dir)
+    else:
+        image = build_squashfs(tree)
+    with open(path, "wb") as f:
+        f.write(elf_header(sections))
+        f.write(image)
+    names = [name for name, _content in sections]
+    if ".digest_md5" in names:
+        # Bölümler 64. bayttan itibaren sırayla yerleştirilir
+        index = names.index(".digest_md5")
+        offset = 64 + sum(len(content) for _name, content in sections[:index])
+        with open(path, "r+b") as f:
+            digest = hashlib.md5()
+            for chunk in iter(lambda: f.read(1024 * 1024), b""):
+                digest.update(chunk)
+            f.seek(offset)
+            f.write(digest.digest())
+    os.chmod(path, 0o755)
+    return "mksquashfs" if mksquashfs else "python"
+
+
+STUB_SCRIPT = """#!/bin/sh
+# Benchmark için sahte AppImage: ağaç bu betiğin sonuna eklenmiş tar arşivindedir
+if [ "$1" = "--appimage-extract" ]; then
+    mkdir -p squashfs-root
+    tail -c +{offset} "$0" | tar -x -f - -C squashfs-root
+    exit $?
+fi
+exit 0
+"""
+
+
+def make_stub_appimage(path, tree):
+    """--appimage-extract argümanını uygulayan kabuk betiği biçiminde AppImage yazar."""
+    temp_dir = tempfile.mkdtemp()
+    try:
+        write_tree(tree, os.path.join(temp_dir, "root"))
+        archive = io.BytesIO()
+        with tarfile.open(fileobj=archive, mode="w") as tar:
+            for name in sorted(os.listdir(os.path.join(temp_dir, "root"))):
+                tar.add(os.path.join(temp_dir, "root", name), arcname=name)
+    finally:
+        shutil.rmtree(temp_dir)
+    # Betik uzunluğu ofsetin basamak sayısına bağlı olduğundan sabit noktaya kadar dene
+    offset = 0
+    while True:
+        script = STUB_SCRIPT.format(offset=offset + 1).encode()
+        if len(script) == offset:
+            break
+        offset = len(script)
+    with open(path, "wb") as f:
+        f.write(script)
+        f.write(archive.getvalue())
+    os.chmod(path, 0o755)
+    return "stub"
+
+
+def generate(path, fmt="squashfs", name="Bench App", size_mb=10, files=1000,
+             icon_layout="both", seed=0, update_info="", version=None):
+    """Sahte bir AppImage üretir ve kullanılan üretim yöntemini döndürür.
+
+    Aynı seed ile farklı version değerleri verilirse yalnızca masaüstü
+    girdisi değişir; bu, delta güncellemeleri denemek için kullanılır.
+    """
+    tree = build_tree(name, size_mb, files, icon_layout, seed, version)
+    if fmt == "stub":
+        return make_stub_appimage(path, tree)
+    return make_squashfs_appimage(path, tree, update_info=update_info)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Generate a synthetic AppImage for benchmarks")
+    parser.add_argument("-o", "--output", required=True, help="Output .AppImage path")
+    parser.add_argument("--format", choices=["squashfs", "stub"], default="squashfs")
+    parser.add_argument("--name", default="Bench App", help="Desktop entry Name=")
+    parser.add_argument("--size", type=int, default=10, metavar="MB", help="Payload size")
+    parser.add_argument("--files", type=int, default=1000, help="Number of small files")
+    parser.add_argument("--icon-layout", choices=ICON_LAYOUTS, default="both")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--update-info", default="", help="Embedded .upd_info string")
+    parser.add_argument("--app-version", default=None, help="Desktop entry Version=")
+    args = parser.parse_args()
+    method = generate(args.output, args.format, args.name, args.size, args.files,
+                      args.icon_layout, args.seed, args.update_info, args.app_version)
+    print(f"{args.output}: {os.path.getsize(args.output)} bytes ({method})")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,187 @@
+"""appimage-installer sıcak yolları için tekrarlanabilir benchmark.
+
+Sahte bir AppImage üretir, HOME değişkenini geçici bir dizine yönlendirir
+ve verify_appimage, extract_appimage, find_file, install_appimage,
+uninstall_app ile list_installed_apps sürelerini ölçer. Sonuçlar sürümler
+arasında karşılaştırılabilmesi için JSON olarak yazılır.
+
+Örnek::
+
+    python benchmarks/run.py --size 100 --files 20000 --runs 5 -o bench.json
+"""
+import argparse
+import contextlib
+import io
+import json
+import os
+import platform
+import shutil
+import statistics
+import sys
+import tempfile
+import time
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+# Kurulu paket yerine bu çalışma kopyasını ölç
+sys.path.insert(0, os.path.dirname(HERE))
+
+from generate import build_tree, generate, write_tree  # noqa: E402
+
+
+def measure(func, runs, setup=None):
+    """func'ı runs kez çalıştırıp milisaniye cinsinden istatistik döndürür.
+
+    setup verilirse her çalıştırmadan önce çağrılır ve süreye dahil edilmez.
+    """
+    timings = []
+    for _run in range(runs):
+        if setup:
+            with contextlib.redirect_stdout(io.StringIO()):
+                setup()
+        with contextlib.redirect_stdout(io.StringIO()):
+            start = time.perf_counter()
+            func()
+            timings.append((time.perf_counter() - start) * 1000)
+    return {
+        "runs": runs,
+        "min_ms": round(min(timings), 3),
+        "median_ms": round(statistics.median(timings), 3),
+        "mean_ms": round(statistics.fmean(timings), 3),
+        "max_ms": round(max(timings), 3),
+    }
+
+
+def prepare_home(work):
+    """Geçici HOME dizinini hazırlar."""
+    home = os.path.join(work, "home")
+    os.makedirs(home)
+    os.environ["HOME"] = home
+    return home
+
+
+INSTALL_BENCHMARKS = ("verify_appimage", "verify_appimage_digest", "extract_appimage",
+                      "extract_appimage_full", "install_appimage_cold",
+                      "install_appimage_cached", "install_appimage_noop", "uninstall_app")
+
+
+def measure_install(installer, appimage, work, runs, results):
+    """Doğrulama, çıkarma, kurma ve kaldırma sürelerini ölçer."""
+    results["verify_appimage"] = measure(lambda: installer.verify_appimage(appimage), runs)
+    results["verify_appimage_digest"] = measure(
+        lambda: installer.verify_appimage(appimage, check_signature=True), runs)
+
+    def extract(full):
+        scratch = tempfile.mkdtemp(dir=work)
+        try:
+            installer.extract_appimage(appimage, scratch, full=full)
+        finally:
+            shutil.rmtree(scratch)
+
+    results["extract_appimage"] = measure(lambda: extract(False), runs)
+    results["extract_appimage_full"] = {
+        "skipped": "synthetic ELF runtime cannot execute --appimage-extract"}
+
+    def uninstall_quiet():
+        if installer.load_versions().get("bench_app"):
+            installer.uninstall_app("bench_app")
+
+    def reset_caches():
+        uninstall_quiet()
+        installer.get_metadata_cache().prune(0)
+        # Özet önbelleğini geçersiz kılmak için mtime değerini değiştir
+        st = os.stat(appimage)
+        os.utime(appimage, ns=(st.st_atime_ns, st.st_mtime_ns + 1000))
+
+    results["install_appimage_cold"] = measure(
+        lambda: installer.install_appimage(appimage), runs, setup=reset_caches)
+    results["install_appimage_cached"] = measure(
+        lambda: installer.install_appimage(appimage), runs, setup=uninstall_quiet)
+    results["install_appimage_noop"] = measure(
+        lambda: installer.install_appimage(appimage), runs,
+        setup=lambda: installer.install_appimage(appimage))
+    results["uninstall_app"] = measure(
+        lambda: installer.uninstall_app("bench_app"), runs,
+        setup=lambda: installer.install_appimage(appimage))
+
+
+def run(args):
+    work = tempfile.mkdtemp(prefix="appimage-bench-")
+    try:
+        prepare_home(work)
+        # HOME yönlendirildikten sonra içe aktarılmalı
+        import appimage_installer as installer
+        installer.set_language("en")
+
+        apps = os.path.join(work, "apps")
+        os.makedirs(apps)
+        appimage = os.path.join(apps, "Bench.AppImage")
+        generator = generate(appimage, args.format, "Bench App", args.size, args.files,
+                             args.icon_layout, args.seed)
+
+        tree_root = os.path.join(work, "tree")
+        write_tree(build_tree("Bench App", 0, args.files, args.icon_layout, args.seed), tree_root)
+
+        results = {}
+        runs = args.runs
+
+        results["find_file"] = measure(lambda: installer.find_file(tree_root, ".png"), runs)
+        results["index_tree"] = measure(lambda: installer.index_tree(tree_root), runs)
+
+        if args.format == "stub":
+            # Kabuk betiği ELF başlığı taşımadığından doğrulamada reddedilir
+            skipped = {"skipped": "stub images have no ELF header and fail validation"}
+            for name in INSTALL_BENCHMARKS:
+                results[name] = skipped
+        else:
+            measure_install(installer, appimage, work, runs, results)
+
+        store = installer.get_store()
+        for i in range(args.entries):
+            store.put(f"bench_entry_{i}", {"name": f"Bench Entry {i}", "version": "1.0",
+                                           "path": os.path.join(apps, f"Entry{i}.AppImage")})
+        results["list_installed_apps"] = measure(installer.list_installed_apps, runs)
+
+        return {
+            "tool_version": installer.get_version(),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "timestamp": int(time.time()),
+            "params": {
+                "format": args.format,
+                "size_mb": args.size,
+                "files": args.files,
+                "icon_layout": args.icon_layout,
+                "entries": args.entries,
+                "seed": args.seed,
+                "appimage_bytes": os.path.getsize(appimage),
+            },
+            "generator": generator,
+            "results": results,
+        }
+    finally:
+        shutil.rmtree(work, ignore_errors=True)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark appimage-installer hot paths")
+    parser.add_argument("--format", choices=["squashfs", "stub"], default="squashfs")
+    parser.add_argument("--size", type=int, default=20, metavar="MB")
+    parser.add_argument("--files", type=int, default=2000)
+    parser.add_argument("--icon-layout", choices=["root", "hicolor", "both", "none"], default="both")
+    parser.add_argument("--entries", type=int, default=500,
+                        help="Extra versions-store entries for the list benchmark")
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("-o", "--output", help="Write JSON here instead of stdout")
+    args = parser.parse_args()
+
+    report = json.dumps(run(args), indent=2)
+    if args.output:
+        with open(args.output, "w") as f:
+            f.write(report + "\n")
+    else:
+        print(report)
+
+
+if __name__ == "__main__":
+    main()
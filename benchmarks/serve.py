@@ -0,0 +1,99 @@
+"""Aralık isteklerini destekleyen yerel HTTP sunucusu.
+
+http.server Range başlığını desteklemediğinden zsync güncellemeleri bu
+sunucuyla denenir. Her istekte gönderilen bayt sayısı loglanır.
+
+Örnek::
+
+    python benchmarks/serve.py --directory /tmp/releases --port 8000
+"""
+import argparse
+import functools
+import os
+import re
+import threading
+from http.server import SimpleHTTPRequestHandler, ThreadingHTTPServer
+
+RANGE_PATTERN = re.compile(r"bytes=(\d*)-(\d*)$")
+
+
+class RangeRequestHandler(SimpleHTTPRequestHandler):
+    """Tek aralıklı Range isteklerine 206 ile yanıt veren dosya sunucusu."""
+
+    protocol_version = "HTTP/1.1"
+    sent = 0
+    _lock = threading.Lock()
+
+    def send_head(self):
+        self._range = None
+        match = RANGE_PATTERN.match(self.headers.get("Range", ""))
+        path = self.translate_path(self.path)
+        if match is None or not os.path.isfile(path):
+            return super().send_head()
+        size = os.path.getsize(path)
+        first, last = match.groups()
+        if first:
+            start, end = int(first), int(last) + 1 if last else size
+        else:
+            start, end = max(0, size - int(last or 0)), size
+        end = min(end, size)
+        if start >= end:
+            self.send_error(416)
+            return None
+        f = open(path, "rb")
+        f.seek(start)
+        self._range = end - start
+        self.send_response(206)
+        self.send_header("Content-Type", self.guess_type(path))
+        self.send_header("Content-Range", f"bytes {start}-{end - 1}/{size}")
+        self.send_header("Content-Length", str(end - start))
+        self.send_header("Accept-Ranges", "bytes")
+        self.end_headers()
+        return f
+
+    def copyfile(self, source, outputfile):
+        remaining = self._range
+        total = 0
+        while remaining is None or remaining > 0:
+            chunk = source.read(65536 if remaining is None else min(65536, remaining))
+            if not chunk:
+                break
+            outputfile.write(chunk)
+            total += len(chunk)
+            if remaining is not None:
+                remaining -= len(chunk)
+        with self._lock:
+            RangeRequestHandler.sent += total
+
+    def log_message(self, format, *args):
+        if not self.server.quiet:
+            super().log_message(format, *args)
+
+
+def serve(directory, port=0, quiet=False):
+    """Sunucuyu arka planda başlatır ve (sunucu, adres) döndürür."""
+    handler = functools.partial(RangeRequestHandler, directory=directory)
+    server = ThreadingHTTPServer(("127.0.0.1", port), handler)
+    server.quiet = quiet
+    server.daemon_threads = True
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server, f"http://127.0.0.1:{server.server_address[1]}"
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Serve a directory with HTTP range support")
+    parser.add_argument("-d", "--directory", default=os.getcwd())
+    parser.add_argument("-p", "--port", type=int, default=8000)
+    args = parser.parse_args()
+    handler = functools.partial(RangeRequestHandler, directory=args.directory)
+    server = ThreadingHTTPServer(("127.0.0.1", args.port), handler)
+    server.quiet = False
+    print(f"Serving {args.directory} on http://127.0.0.1:{args.port}")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
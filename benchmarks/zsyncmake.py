@@ -0,0 +1,82 @@
+"""Benchmark ve testler için .zsync kontrol dosyası üreteci.
+
+zsyncmake ile aynı biçimde (zsync 0.6.2) dosya yazar: başlık satırları,
+boş bir satır ve her blok için rsum ile kısaltılmış MD4 özeti. Hash
+uzunlukları zsyncmake'in formülüyle seçilir.
+
+Örnek::
+
+    python benchmarks/zsyncmake.py App.AppImage -u App.AppImage -o App.AppImage.zsync
+"""
+import argparse
+import hashlib
+import math
+import os
+import sys
+import time
+from email.utils import formatdate
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, os.path.dirname(HERE))
+
+from appimage_installer.zsync import md4, rsum  # noqa: E402
+
+
+def hash_lengths(length, blocksize):
+    """zsyncmake'in seçtiği (seq_matches, rsum, checksum) uzunluklarını döndürür."""
+    seq_matches = 2 if length > blocksize else 1
+    log_len = math.log(max(length, 1))
+    rsum_len = math.ceil(((log_len + math.log(blocksize)) / math.log(2) - 8.6) / seq_matches / 8)
+    rsum_len = min(4, max(2, rsum_len))
+    checksum_len = math.ceil((20 + (log_len + math.log(1 + length / blocksize)) / math.log(2))
+                             / seq_matches / 8)
+    checksum_len = max(checksum_len, int((7.9 + (20 + math.log(1 + length / blocksize) / math.log(2))) / 8))
+    return seq_matches, rsum_len, min(16, max(3, checksum_len))
+
+
+def make_zsync(path, url, output=None, blocksize=None):
+    """path için .zsync dosyası yazar ve yolunu döndürür."""
+    length = os.path.getsize(path)
+    if blocksize is None:
+        blocksize = 2048 if length < 100 * 1024 * 1024 else 4096
+    seq_matches, rsum_len, checksum_len = hash_lengths(length, blocksize)
+    sha1 = hashlib.sha1()
+    entries = bytearray()
+    with open(path, "rb") as f:
+        while True:
+            block = f.read(blocksize)
+            if not block:
+                break
+            sha1.update(block)
+            block = block.ljust(blocksize, b"\0")
+            entries += rsum(block).to_bytes(4, "big")[4 - rsum_len:]
+            entries += md4(block)[:checksum_len]
+    header = (
+        "zsync: 0.6.2\n"
+        f"Filename: {os.path.basename(path)}\n"
+        f"MTime: {formatdate(os.path.getmtime(path) if length else time.time(), usegmt=True)}\n"
+        f"Blocksize: {blocksize}\n"
+        f"Length: {length}\n"
+        f"Hash-Lengths: {seq_matches},{rsum_len},{checksum_len}\n"
+        f"URL: {url}\n"
+        f"SHA-1: {sha1.hexdigest()}\n"
+        "\n"
+    )
+    output = output or path + ".zsync"
+    with open(output, "wb") as f:
+        f.write(header.encode() + bytes(entries))
+    return output
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Write a .zsync control file")
+    parser.add_argument("path")
+    parser.add_argument("-u", "--url", help="Download URL, relative to the .zsync file (default: file name)")
+    parser.add_argument("-o", "--output", help="Output path (default: PATH.zsync)")
+    parser.add_argument("-b", "--blocksize", type=int, default=None)
+    args = parser.parse_args()
+    print(make_zsync(args.path, args.url or os.path.basename(args.path), args.output, args.blocksize))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,52 @@
+"""Testler için ortak yardımcılar.
+
+Paket HOME dizinini içe aktarılırken okuduğundan komutlar ayrı bir süreçte,
+geçici bir HOME ile çalıştırılır. Sahte AppImage'lar benchmarks/generate.py
+ile üretilir.
+"""
+import os
+import subprocess
+import sys
+
+import pytest
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, os.path.join(ROOT, "benchmarks"))
+
+from generate import generate  # noqa: E402
+
+
+@pytest.fixture
+def home(tmp_path):
+    path = tmp_path / "home"
+    path.mkdir()
+    return path
+
+
+@pytest.fixture
+def cli(home):
+    """appimage-installer komutunu geçici HOME ile çalıştırır."""
+    def run(*args, check=True, env=None):
+        environ = dict(os.environ, HOME=str(home), PYTHONPATH=ROOT)
+        for name in ("APPIMAGE_INSTALLER_SYSTEM_PREFIX", "APPIMAGE_INSTALLER_EXTRACT_DIR",
+                     "APPIMAGE_INSTALLER_EXTRACT_INCLUDE"):
+            environ.pop(name, None)
+        environ.update(env or {})
+        result = subprocess.run(
+            [sys.executable, "-c", "import appimage_installer as a; a.main()"] + [str(a) for a in args],
+            cwd=str(home), env=environ, stdout=subprocess.PIPE, stderr=subprocess.PIPE,
+            universal_newlines=True)
+        if check:
+            assert result.returncode == 0, result.stdout + result.stderr
+        return result
+    return run
+
+
+@pytest.fixture
+def appimage(tmp_path):
+    """Küçük bir sahte AppImage üretir ve yolunu döndürür."""
+    def make(path=None, name="Foo App", version="1.0", seed=0):
+        path = str(path or tmp_path / "Foo.AppImage")
+        generate(path, name=name, size_mb=1, files=5, seed=seed, version=version)
+        return path
+    return make
@@ -0,0 +1,61 @@
+import json
+
+import pytest
+
+from appimage_installer.apply import INSTALL, REMOVE, UPGRADE, ManifestError, load_manifest, plan
+
+
+def _write(tmp_path, text):
+    path = tmp_path / "manifest.toml"
+    path.write_text(text)
+    return str(path)
+
+
+def _records(cli):
+    return {app["name"]: app for app in json.loads(cli("list", "--format", "json").stdout)}
+
+
+def test_label_differs_from_desktop_name(tmp_path, cli, appimage):
+    source = appimage(tmp_path / "Foo.AppImage", name="Foo App", version="1.0")
+    manifest = _write(tmp_path, 'prune = true\n[apps.foo]\nsource = "Foo.AppImage"\n')
+    cli("apply", manifest)
+    assert _records(cli)["foo_app"]["version"] == "1.0"
+
+    appimage(source, name="Foo App", version="2.0", seed=1)
+    result = cli("apply", "--dry-run", manifest)
+    assert "foo_app" in result.stdout and "- foo_app" not in result.stdout
+    cli("apply", manifest)
+    assert _records(cli)["foo_app"]["version"] == "2.0"
+
+
+def test_new_source_path_keeps_record(tmp_path, cli, appimage):
+    appimage(tmp_path / "Foo.AppImage", name="Foo App", version="1.0")
+    manifest = _write(tmp_path, 'prune = true\n[apps.foo]\nsource = "Foo.AppImage"\n')
+    cli("apply", manifest)
+
+    # Yeni yoldaki yeni imajın adı plan sırasında bilinmiyor; kurulan kayıt budanmamalı
+    appimage(tmp_path / "Foo-2.AppImage", name="Foo App", version="2.0", seed=1)
+    manifest = _write(tmp_path, 'prune = true\n[apps.foo]\nsource = "Foo-2.AppImage"\n')
+    cli("apply", manifest)
+    records = _records(cli)
+    assert list(records) == ["foo_app"] and records["foo_app"]["version"] == "2.0"
+
+
+def test_plan_never_installs_and_removes_same_name(tmp_path):
+    source = tmp_path / "Old.AppImage"
+    source.write_bytes(b"")
+    versions = {"foo_app": {"path": str(source), "files": []}}
+    apps = {"foo": {"source": str(source), "sha256": None, "sandbox": True, "state": "present"}}
+    actions = plan(apps, versions, lambda path: "0" * 64, prune=True)
+    assert [(a.kind, a.name) for a in actions] == [(UPGRADE, "foo_app")]
+
+    actions = plan(apps, {"foo_app": {"files": []}}, lambda path: "0" * 64, prune=True,
+                   derived_name=lambda sha256: "foo_app")
+    assert {a.kind for a in actions} == {UPGRADE}
+    assert not any(a.kind in (INSTALL, REMOVE) for a in actions)
+
+
+def test_sha256_must_be_hex(tmp_path):
+    manifest = _write(tmp_path, '[apps.foo]\nsource = "Foo.AppImage"\nsha256 = "%s"\n' % ("z" * 64))
+    with pytest.raises(ManifestError, match=r"\[apps.foo\] sha256"):
+        load_manifest(manifest, lambda name: name)
@@ -0,0 +1,27 @@
+import json
+import os
+import shutil
+
+
+def _version(cli, name):
+    return {info["name"]: info for info in json.loads(cli("list", "--format", "json").stdout)}[name]["version"]
+
+
+def test_upgrade_adopts_legacy_json_record(cli, appimage, home, tmp_path):
+    old = appimage(tmp_path / "Foo.AppImage", version="1.0")
+    bin_dir = home / ".local" / "bin"
+    bin_dir.mkdir(parents=True)
+    shutil.copy(old, str(bin_dir / "Foo.AppImage"))
+    (home / ".local" / "share").mkdir(parents=True)
+    (home / ".local" / "share" / "appimage-versions.json").write_text(
+        json.dumps({"foo_app": {"version": "1.0", "path": old}}))
+
+    new = appimage(tmp_path / "Foo-2.AppImage", version="2.0", seed=1)
+    cli("install", new)
+    assert not os.path.lexists(str(bin_dir / "Foo.AppImage"))
+    assert _version(cli, "foo_app") == "2.0"
+
+    cli("rollback", "foo_app")
+    assert _version(cli, "foo_app") == "1.0"
+    with open(old, "rb") as f, open(str(bin_dir / "Foo-2.AppImage"), "rb") as g:
+        assert f.read() == g.read()
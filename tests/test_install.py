@@ -0,0 +1,21 @@
+import os
+import shutil
+
+
+def test_clean_keeps_already_installed_sources(cli, appimage, tmp_path):
+    path = appimage()
+    cli("install", path)
+    copy = str(tmp_path / "Copy.AppImage")
+    shutil.copy(path, copy)
+
+    cli("install", "--clean", copy)
+    assert os.path.isfile(copy)
+
+
+def test_clean_removes_copied_source(cli, appimage, tmp_path):
+    path = appimage()
+    # Başka bağlantısı olan dosya taşınmaz, kopyalanır
+    os.link(path, str(tmp_path / "Other.AppImage"))
+
+    cli("install", "--clean", path)
+    assert not os.path.exists(path)
@@ -0,0 +1,16 @@
+import os
+
+
+def _cache_entries(home):
+    root = home / ".cache" / "appimage-installer" / "launch"
+    return [name for name in os.listdir(str(root)) if not name.startswith(".")] if root.exists() else []
+
+
+def test_prune_drops_cache_after_launch_cache_disabled(cli, appimage, home):
+    path = appimage()
+    cli("install", "--launch-cache", path)
+    assert _cache_entries(home)
+
+    cli("install", "--no-launch-cache", path)
+    cli("launch-cache", "prune")
+    assert _cache_entries(home) == []
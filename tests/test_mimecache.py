@@ -0,0 +1,15 @@
+from appimage_installer import mimecache
+
+
+def _desktop(path, mime):
+    path.write_text(f"[Desktop Entry]\nType=Application\nName=X\nMimeType={mime};\n")
+
+
+def test_update_rebuilds_when_added_entry_is_missing(tmp_path):
+    _desktop(tmp_path / "a.desktop", "text/plain")
+    _desktop(tmp_path / "b.desktop", "image/png")
+    mimecache.rebuild(str(tmp_path))
+    (tmp_path / "b.desktop").unlink()
+
+    assert mimecache.update(str(tmp_path), added=[str(tmp_path / "b.desktop")])
+    assert mimecache.read_cache(str(tmp_path / mimecache.CACHE_NAME)) == {"text/plain": ["a.desktop"]}
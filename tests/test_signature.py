@@ -0,0 +1,78 @@
+import os
+import shutil
+import subprocess
+import tempfile
+
+import pytest
+
+from appimage_installer.elf import (SIGNATURE_KEY_SECTION, SIGNATURE_SECTION, SIGNATURE_SKIP,
+                                    digest, read_header)
+
+GPG = shutil.which("gpg") or shutil.which("gpg2")
+pytestmark = pytest.mark.skipif(GPG is None, reason="gpg is required")
+
+
+@pytest.fixture
+def keys(tmp_path):
+    """İki anahtar üretir; her biri için (GNUPGHOME, dışa aktarılan anahtar yolu) döndürür."""
+    homes = []
+
+    def make(user):
+        # gpg-agent soket yolu kısa olmalı
+        gnupg = tempfile.mkdtemp(prefix="gpg-")
+        homes.append(gnupg)
+        env = dict(os.environ, GNUPGHOME=gnupg)
+        subprocess.run([GPG, "--batch", "--passphrase", "", "--quick-gen-key", f"{user} <{user}@example.com>",
+                        "ed25519", "sign", "never"], env=env, check=True, capture_output=True)
+        key = tmp_path / f"{user}.asc"
+        key.write_bytes(subprocess.run([GPG, "--batch", "--armor", "--export"], env=env,
+                                       check=True, capture_output=True).stdout)
+        return gnupg, str(key)
+
+    yield make("alice"), make("mallory")
+    for gnupg in homes:
+        subprocess.run(["gpgconf", "--homedir", gnupg, "--kill", "all"], capture_output=True)
+        shutil.rmtree(gnupg, ignore_errors=True)
+
+
+def _sign(path, gnupg, key):
+    """appimagetool gibi imzayı ve anahtarı AppImage'ın bölümlerine yazar."""
+    fd = os.open(path, os.O_RDWR)
+    try:
+        header = read_header(fd)
+        signature = subprocess.run(
+            [GPG, "--batch", "--armor", "--detach-sign"], env=dict(os.environ, GNUPGHOME=gnupg),
+            input=digest(fd, header, "sha256", SIGNATURE_SKIP).encode(), check=True, capture_output=True).stdout
+        with open(key, "rb") as f:
+            os.pwrite(fd, f.read(), header.section(SIGNATURE_KEY_SECTION)[0])
+        os.pwrite(fd, signature, header.section(SIGNATURE_SECTION)[0])
+    finally:
+        os.close(fd)
+
+
+def test_check_signature_is_self_signed(cli, appimage, keys):
+    _, (mallory, mallory_key) = keys
+    path = appimage()
+    _sign(path, mallory, mallory_key)
+    result = cli("verify", "--check-signature", path)
+    assert "Self-signed" in result.stdout
+
+
+def test_trusted_key(cli, appimage, keys):
+    (alice, alice_key), (mallory, mallory_key) = keys
+    forged = appimage(seed=1)
+    _sign(forged, mallory, mallory_key)
+    result = cli("verify", "--trusted-key", alice_key, forged, check=False)
+    assert result.returncode != 0
+    assert "signature is invalid" in result.stdout + result.stderr
+
+    path = appimage()
+    _sign(path, alice, alice_key)
+    assert "trusted key" in cli("verify", "--trusted-key", alice_key, path).stdout
+
+
+def test_trusted_key_requires_signature(cli, appimage, keys):
+    (_, alice_key), _ = keys
+    result = cli("install", "--trusted-key", alice_key, appimage(), check=False)
+    assert result.returncode != 0
+    assert "not signed" in result.stdout + result.stderr
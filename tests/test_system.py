@@ -0,0 +1,28 @@
+import os
+
+import pytest
+
+needs_root = pytest.mark.skipif(os.geteuid() != 0, reason="the shared store must be owned by root")
+
+
+def test_system_flag_does_not_take_the_path(tmp_path, cli, appimage):
+    # README'deki sıra: install --system /path/to/application.AppImage
+    source = appimage()
+    prefix = tmp_path / "shared"
+    result = cli("install", "--system", source, check=False,
+                 env={"APPIMAGE_INSTALLER_SYSTEM_PREFIX": str(prefix)})
+    assert result.returncode != 2, result.stderr
+    assert "required" not in result.stderr
+
+
+@needs_root
+def test_install_into_system_prefix(tmp_path, home, cli, appimage):
+    source = appimage()
+    prefix = tmp_path / "shared"
+    cli("install", "--system", "--system-prefix", prefix, source)
+    link = home / ".local" / "bin" / "Foo.AppImage"
+    assert os.path.dirname(os.readlink(str(link))) == str(prefix / "objects")
+
+    cli("uninstall", "foo_app")
+    cli("gc", "--system", "--system-prefix", prefix)
+    assert os.listdir(str(prefix / "objects")) == []